@@ -7,10 +7,12 @@ Responsibilities:
 - Portfolio updates to portfolio-events topic
 - Error events to error-events topic
 - Message serialization and compression
+- Background publisher worker that decouples callers from broker latency
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
+import asyncio
 import json
 import logging
 try:
@@ -20,6 +22,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bound on events buffered ahead of the publisher worker
+PUBLISH_QUEUE_SIZE = 10_000
+# Maximum number of events drained from the queue per batch
+PUBLISH_BATCH_SIZE = 512
+
 class KafkaIntegration:
     """
     Handles publishing events to Kafka topics for market data, orders, portfolio, and errors.
@@ -30,6 +37,8 @@ class KafkaIntegration:
         """
         self.bootstrap_servers = bootstrap_servers
         self.producer = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
         self.topics = {
             "market_data": "market-data",
             "order": "trade-events",
@@ -50,6 +59,8 @@ class KafkaIntegration:
                 value_serializer=lambda v: json.dumps(v).encode('utf-8')
             )
             await self.producer.start()
+            self._queue = asyncio.Queue(maxsize=PUBLISH_QUEUE_SIZE)
+            self._worker = asyncio.create_task(self._drain())
             logger.info("Kafka producer started successfully.")
         except Exception as e:
             logger.error(f"Failed to start Kafka producer: {e}")
@@ -57,17 +68,35 @@ class KafkaIntegration:
 
     async def stop(self):
         """
-        Stop Kafka producer if initialized.
-        """
+        Stop Kafka producer if initialized, flushing queued events first.
+        """
+        if self._worker:
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._queue = None
         if self.producer:
             await self.producer.stop()
             logger.info("Kafka producer stopped.")
 
     async def publish_market_data(self, data: Dict[str, Any]):
         """
-        Publish market data event to Kafka.
+        Enqueue market data event for the background publisher worker.
+
+        Falls back to a direct publish when the worker is not running.
         """
-        await self._publish_event("market_data", data)
+        if self._queue is None:
+            await self._publish_event("market_data", data)
+            return
+        try:
+            self._queue.put_nowait((self.topics["market_data"], data))
+        except asyncio.QueueFull:
+            logger.error("Kafka publish queue full, rejecting market data event")
+            raise
 
     async def publish_order_event(self, event: Dict[str, Any]):
         """
@@ -103,4 +132,38 @@ class KafkaIntegration:
             logger.info(f"Published {event_type} event to {topic}")
         except Exception as e:
             logger.error(f"Failed to publish event to {topic}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def _drain(self):
+        """
+        Publisher worker: drain queued events in batches and send them together.
+
+        Each batch is handed to the producer via non-blocking ``send`` calls so
+        aiokafka's accumulator groups them per partition, then the delivery
+        futures are awaited together.
+        """
+        while True:
+            items: List[Tuple[str, Dict[str, Any]]] = [await self._queue.get()]
+            while len(items) < PUBLISH_BATCH_SIZE:
+                try:
+                    items.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                # Sends are collected one by one so a failing send does not orphan the
+                # delivery futures already handed out for earlier items
+                futures = []
+                failed = 0
+                for topic, data in items:
+                    try:
+                        futures.append(await self.producer.send(topic, data))
+                    except Exception as e:
+                        failed += 1
+                        logger.error(f"Failed to publish queued event to {topic}: {e}")
+                results = await asyncio.gather(*futures, return_exceptions=True)
+                failed += sum(1 for r in results if isinstance(r, Exception))
+                if failed:
+                    logger.error(f"Failed to publish {failed}/{len(items)} queued events")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
@@ -27,7 +27,7 @@ import redis.asyncio as aioredis
 import asyncio
 import time
 
-from .metrics import start_metrics_server, record_api_request
+from .metrics import start_metrics_listener, stop_metrics_listener, record_api_request
 from .security_manager import SecurityManager, SecurityViolationError, RateLimitExceededError, PhishingDetectedError, InvalidSessionError, SuspiciousActivityError
 from .browser_controller import BrowserController
 
@@ -49,10 +49,11 @@ from contextlib import asynccontextmanager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Lifespan event handler to initialize the metrics server on startup.
+    Lifespan event handler serving metrics on the dedicated metrics port from this event loop.
     """
-    start_metrics_server()
+    await start_metrics_listener()
     yield
+    await stop_metrics_listener()
 
 app = FastAPI(
     title="Metamask Integration API",
@@ -227,12 +228,12 @@ async def record_api_metrics(request: Request, call_next):
     """
     method = request.method
     endpoint = request.url.path
-    start_time = time.time()
+    start_time = time.monotonic()
     
     response = await call_next(request)
     
     status_code = response.status_code
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     record_api_request(endpoint, method, status_code, duration)
     
     return response
\ No newline at end of file
@@ -11,22 +11,145 @@ Enables secure, automated browser-based wallet operations.
 """
 
 import asyncio
+import functools
+import inspect
 import logging
-import time # Added for duration calculation
-from typing import Optional, Dict, Any
+import re
+import shutil
+import tempfile
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union, Awaitable
+from urllib.parse import SplitResult, urlsplit
 
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Error as PlaywrightError
+# Playwright is imported lazily where it is used; its import chain is expensive at startup
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, BrowserContext, Locator, Route
 
 from .security_manager import SecurityManager, SecurityViolationError, PhishingDetectedError, InvalidSessionError
 from .metrics import record_browser_automation_security_event, record_browser_operation # Added metrics import
+from .config import BROWSER_CONTAINER_MODE, BROWSER_DISABLE_GPU
 # validator.py is a stub; use placeholder validation for now
 
 logger = logging.getLogger(__name__)
 
+# Browser operations after which the persistent context is closed and reopened
+CONTEXT_RECYCLE_INTERVAL = 100
+# Successful session/phishing validations are reused for this many seconds
+VALIDATION_CACHE_TTL = 30
+VALIDATION_CACHE_SIZE = 1024
+# Only the Metamask extension is loaded, so extension pages are Metamask's own UI
+METAMASK_INTERNAL_SCHEME = "chrome-extension"
+_ALLOWED_URL_SCHEMES = frozenset({"http", "https", METAMASK_INTERNAL_SCHEME})
+# Eager navigations return once the response is committed instead of after DOM parse
+EAGER_NAVIGATION_TIMEOUT_MS = 3000
+# Response cache for repeated dapp navigations: static GET subresources of opted-in origins only
+CACHEABLE_RESOURCE_TYPES = frozenset({"stylesheet", "script", "image", "font"})
+_STATIC_ASSET_SUFFIX = r"/[^?#]*\.(?:m?js|css|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf)(?:\?[^#]*)?$"
+# Cache-Control directives that forbid reusing a response from this cache
+_UNCACHEABLE_DIRECTIVES = frozenset({"no-store", "no-cache", "private"})
+RESPONSE_CACHE_MAX_ENTRIES = 512
+RESPONSE_CACHE_MAX_BODY_BYTES = 2 * 1024 * 1024
+# Metamask popup "Confirm"/"Next" button
+METAMASK_CONFIRM_SELECTOR = 'button[data-testid="page-container-footer-next"]'
+# Browser-operation metrics are buffered and recorded off the hot path at this interval
+METRIC_FLUSH_INTERVAL = 0.1
+
+# Safe selectors: 1-256 characters with no markup brackets
+_SELECTOR_RE = re.compile(r"[^<>]{1,256}")
+
+@functools.lru_cache(maxsize=2048)
+def _parse_url(url: str) -> SplitResult:
+    """
+    Parse and scheme-check a navigation URL. Memoized because trading flows revisit
+    a small set of dapp URLs; invalid URLs raise and are not cached.
+    """
+    parsed = urlsplit(url)
+    if parsed.scheme not in _ALLOWED_URL_SCHEMES:
+        raise ValueError(f"Invalid URL scheme: {parsed.scheme!r}")
+    return parsed
+
+# CSP and XSS protections, built once at import and registered on the browser context
+_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-eval' 'unsafe-inline' chrome-extension:; "
+    "object-src 'none'; "
+    "base-uri 'self'; "
+    "frame-ancestors 'none';"
+)
+
+_CSP_INIT_SCRIPT = f"""
+(() => {{
+    const meta = document.createElement('meta');
+    meta.httpEquiv = "Content-Security-Policy";
+    meta.content = "{_CSP}";
+    document.head.appendChild(meta);
+}})();
+"""
+
+_XSS_INIT_SCRIPT = """
+window.addEventListener('DOMContentLoaded', () => {
+    // Remove dangerous inline event handlers
+    document.querySelectorAll('*').forEach(el => {
+        for (const attr of el.getAttributeNames()) {
+            if (attr.startsWith('on')) el.removeAttribute(attr);
+        }
+    });
+});
+"""
+
+def _freshness_lifetime(headers: Dict[str, str]) -> Optional[float]:
+    """
+    Seconds a response may be reused according to its Cache-Control/Expires headers, or
+    None if it must not be cached. Responses without explicit freshness are not cached.
+    """
+    directives = {}
+    for part in headers.get("cache-control", "").lower().split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"')
+    if _UNCACHEABLE_DIRECTIVES.intersection(directives):
+        return None
+    try:
+        if "max-age" in directives:
+            lifetime = float(int(directives["max-age"]))
+        elif "expires" in headers:
+            expires_at = parsedate_to_datetime(headers["expires"]).timestamp()
+            date = headers.get("date")
+            lifetime = expires_at - (parsedate_to_datetime(date).timestamp() if date else time.time())
+        else:
+            return None
+        lifetime -= float(int(headers.get("age", 0)))
+    except (TypeError, ValueError):
+        return None
+    return lifetime if lifetime > 0 else None
+
+@functools.lru_cache(maxsize=512)
+def _validate_selector(selector: str) -> bool:
+    """
+    Return True if the selector is safe to hand to Playwright. Memoized because the
+    same constant selectors (e.g. the Metamask confirm button) are validated per transaction.
+    """
+    return _SELECTOR_RE.fullmatch(selector) is not None
+
 class BrowserControllerError(Exception):
     """Base exception for BrowserController errors."""
     pass
 
+@dataclass(frozen=True, slots=True)
+class MetamaskInteraction:
+    """A Metamask interaction to perform, e.g. confirming a transaction."""
+    type: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    url: Optional[str] = None  # Metamask popup to open before acting
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetamaskInteraction":
+        """Build an interaction from the legacy dict form ({"type", "params", "url"})."""
+        return cls(type=data.get("type", ""), params=data.get("params") or {}, url=data.get("url"))
+
 class BrowserController:
     """
     Secure controller for automating Metamask browser interactions using Playwright.
@@ -34,43 +157,79 @@ class BrowserController:
     All DOM and user inputs are validated and sanitized.
     """
 
-    def __init__(self, security_manager: SecurityManager, metamask_extension_path: str):
+    # (operation, status, duration) samples awaiting record_browser_operation; shared by all controllers
+    _metric_queue: deque = deque(maxlen=4096)
+
+    def __init__(
+        self,
+        security_manager: SecurityManager,
+        metamask_extension_path: str,
+        recycle_interval: int = CONTEXT_RECYCLE_INTERVAL,
+        response_cache_ttls: Optional[Dict[str, float]] = None,
+    ):
         """
         :param security_manager: Instance of SecurityManager for validation and session control.
         :param metamask_extension_path: Path to unpacked Metamask extension directory.
+        :param recycle_interval: Operations after which the context is recycled to bound memory growth.
+        :param response_cache_ttls: Origins (scheme://host[:port]) whose static responses are
+            served from an in-process cache, mapped to the longest time (seconds) to keep them.
+            Responses are cached only as long as their Cache-Control/Expires allow; other
+            origins are never routed through Python and keep Chromium's own HTTP cache.
         """
         self.security_manager = security_manager
+        # Bound once so the navigation hot path skips the attribute chain
+        self._check_phishing = security_manager.check_phishing
         self.metamask_extension_path = metamask_extension_path
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
+        self.browser: Optional["Browser"] = None
+        self.context: Optional["BrowserContext"] = None
+        self.page: Optional["Page"] = None
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._user_data_dir: Optional[str] = None
+        self.recycle_interval = recycle_interval
+        self._ops_since_recycle = 0
+        # token/url -> monotonic expiry of the last successful validation
+        self._session_ok: Dict[str, float] = {}
+        self._url_ok: Dict[str, float] = {}
+        self._metric_flusher: Optional[asyncio.Task] = None
+        # Confirm-button locator, reused while the active page stays the same
+        self._confirm_locator: Optional["Locator"] = None
+        self._confirm_locator_page: Optional["Page"] = None
+        # url -> (monotonic expiry, status, headers, body); kept across context recycles
+        self.response_cache_ttls = response_cache_ttls or {}
+        self._resp_cache: Dict[str, tuple] = {}
 
     async def launch_browser(self) -> None:
         """
         Launch a hardened browser instance with Metamask extension loaded.
         Applies security flags and disables unnecessary features.
         """
-        playwright = await async_playwright().start()
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        # Unique profile per controller so parallel controllers don't collide
+        self._user_data_dir = tempfile.mkdtemp(prefix="metamask_user_data_")
+        try:
+            await self._open_context()
+        except BaseException:
+            # Don't leak the driver process or the temp profile when the context fails to open
+            await self._playwright.stop()
+            self._playwright = None
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+            raise
+
+    async def _open_context(self) -> None:
+        """
+        Open the persistent context on this controller's profile along with its active page.
+        """
+        from playwright.async_api import Error as PlaywrightError
+
         try:
-            self.browser = await playwright.chromium.launch_persistent_context(
-                user_data_dir="/tmp/metamask_user_data",  # Should be ephemeral or session-specific
+            self.browser = await self._playwright.chromium.launch_persistent_context(
+                user_data_dir=self._user_data_dir,
                 headless=False,  # Metamask requires non-headless for some flows
-                args=[
-                    f"--disable-extensions-except={self.metamask_extension_path}",
-                    f"--load-extension={self.metamask_extension_path}",
-                    "--no-sandbox",
-                    "--disable-gpu",
-                    "--disable-dev-shm-usage",
-                    "--disable-remote-fonts",
-                    "--disable-background-networking",
-                    "--disable-sync",
-                    "--disable-default-apps",
-                    "--disable-popup-blocking",
-                    "--disable-remote-extensions",
-                    "--disable-site-isolation-trials",
-                    "--disable-features=IsolateOrigins,site-per-process",
-                    "--js-flags=--no-expose-wasm,--no-expose-async-hooks",
-                ],
+                args=self._browser_args(),
                 ignore_default_args=["--enable-automation"],  # Remove automation flag for stealth
                 viewport={"width": 1280, "height": 800},
                 accept_downloads=False,
@@ -78,87 +237,260 @@ class BrowserController:
                 bypass_csp=False,  # We'll inject our own CSP
             )
             self.context = self.browser
+            # Context-level init scripts apply to every page opened in this context
+            await self.context.add_init_script(script=_CSP_INIT_SCRIPT)
+            await self.context.add_init_script(script=_XSS_INIT_SCRIPT)
+            for origin, max_ttl in self.response_cache_ttls.items():
+                if max_ttl > 0:
+                    await self.context.route(re.compile(re.escape(origin) + _STATIC_ASSET_SUFFIX), self._cache_handler)
             self.page = await self.context.new_page()
-            await self._inject_security_headers(self.page)
+            if self._metric_flusher is None:
+                self._metric_flusher = asyncio.create_task(self._flush_metrics())
             logger.info("Browser launched with hardened settings and Metamask extension.")
         except PlaywrightError as e:
             logger.error(f"Failed to launch browser: {e}")
             raise
 
-    async def _inject_security_headers(self, page: Page) -> None:
-        """
-        Injects CSP and XSS protections into every page.
-        """
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-eval' 'unsafe-inline' chrome-extension:; "
-            "object-src 'none'; "
-            "base-uri 'self'; "
-            "frame-ancestors 'none';"
-        )
-        await page.add_init_script(
-            f"""
-            (() => {{
-                const meta = document.createElement('meta');
-                meta.httpEquiv = "Content-Security-Policy";
-                meta.content = "{csp}";
-                document.head.appendChild(meta);
-            }})();
-            """
-        )
-        # Optionally, inject XSS protection headers or scripts
-        await page.add_init_script(
-            """
-            window.addEventListener('DOMContentLoaded', () => {
-                // Remove dangerous inline event handlers
-                document.querySelectorAll('*').forEach(el => {
-                    for (const attr of el.getAttributeNames()) {
-                        if (attr.startsWith('on')) el.removeAttribute(attr);
-                    }
-                });
-            });
-            """
-        )
+    def _browser_args(self) -> list:
+        """
+        Chromium flags: hardened defaults, GPU compositing unless disabled, sandbox and
+        shared-memory workarounds only when running inside a container.
+        """
+        args = [
+            f"--disable-extensions-except={self.metamask_extension_path}",
+            f"--load-extension={self.metamask_extension_path}",
+            "--disable-remote-fonts",
+            "--disable-background-networking",
+            "--disable-sync",
+            "--disable-default-apps",
+            "--disable-popup-blocking",
+            "--disable-remote-extensions",
+            "--disable-site-isolation-trials",
+            "--disable-features=IsolateOrigins,site-per-process",
+            "--js-flags=--no-expose-wasm,--no-expose-async-hooks",
+        ]
+        if BROWSER_CONTAINER_MODE:
+            args += ["--no-sandbox", "--disable-dev-shm-usage"]
+        if BROWSER_DISABLE_GPU:
+            args.append("--disable-gpu")
+        else:
+            args += ["--use-gl=angle", "--enable-gpu-rasterization", "--enable-zero-copy"]
+        return args
+
+    async def _ensure_browser(self) -> None:
+        """
+        Launch the browser once per controller; concurrent callers share the same launch.
+        """
+        async with self._launch_lock:
+            if self.context is None:
+                await self.launch_browser()
+
+    async def _maybe_recycle_context(self) -> None:
+        """
+        Close and reopen the persistent context once recycle_interval operations have run.
+
+        Long-lived persistent contexts (especially with extensions) leak memory. Cookies and
+        local storage live in the on-disk profile, so reopening on the same user_data_dir
+        preserves the Metamask state.
+        """
+        self._ops_since_recycle += 1
+        if self.context is None or self._ops_since_recycle < self.recycle_interval:
+            return
+        async with self._launch_lock:
+            await self.context.close()
+            self.context = None
+            self.browser = None
+            self.page = None
+            self._confirm_locator = None
+            self._confirm_locator_page = None
+            await self._open_context()
+            self._ops_since_recycle = 0
+            logger.info("Browser context recycled to bound memory growth.")
+
+    async def _cache_handler(self, route: "Route") -> None:
+        """
+        Serve static GET subresources of cache-enabled origins from the response cache,
+        fetching and storing them on a miss. Anything else continues to the network untouched.
+        """
+        from playwright.async_api import Error as PlaywrightError
+
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            await route.continue_()
+            return
+
+        url = request.url
+        now = time.monotonic()
+        entry = self._resp_cache.get(url)
+        if entry is not None and entry[0] > now:
+            _, status, headers, body = entry
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except PlaywrightError as e:
+            logger.debug(f"Cache fetch for {url} failed, letting the browser load it: {e}")
+            try:
+                await route.continue_()
+            except PlaywrightError:
+                # The page went away or the request was already handled
+                pass
+            return
+
+        parsed = urlsplit(url)
+        max_ttl = self.response_cache_ttls.get(f"{parsed.scheme}://{parsed.netloc}", 0)
+        lifetime = _freshness_lifetime(response.headers) if response.status == 200 else None
+        if lifetime is not None and max_ttl > 0 and len(body) <= RESPONSE_CACHE_MAX_BODY_BYTES:
+            if len(self._resp_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                self._resp_cache.pop(next(iter(self._resp_cache)))
+            self._resp_cache[url] = (now + min(lifetime, max_ttl), response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    async def _flush_metrics(self) -> None:
+        """
+        Background task: periodically record buffered browser-operation metrics.
+        """
+        while True:
+            await asyncio.sleep(METRIC_FLUSH_INTERVAL)
+            self._drain_metric_queue()
+
+    @classmethod
+    def _drain_metric_queue(cls) -> None:
+        """
+        Record every buffered (operation, status, duration) sample.
+        """
+        queue = cls._metric_queue
+        while queue:
+            operation, status, duration = queue.popleft()
+            record_browser_operation(operation=operation, status=status, duration=duration)
+
+    @staticmethod
+    def _remember(cache: Dict[str, float], key: str, now: float) -> None:
+        """
+        Record a successful validation, pruning expired entries when the cache is full.
+        """
+        if len(cache) >= VALIDATION_CACHE_SIZE:
+            for stale in [k for k, expiry in cache.items() if expiry <= now]:
+                del cache[stale]
+            if len(cache) >= VALIDATION_CACHE_SIZE:
+                cache.clear()
+        cache[key] = now + VALIDATION_CACHE_TTL
+
+    def _validate_session_cached(self, session_token: str) -> Optional[Awaitable[None]]:
+        """
+        Validate a session, skipping the full check if it passed within VALIDATION_CACHE_TTL.
+        A cached token is only trusted while the session still exists, so invalidation is immediate.
+        If the validator is asynchronous, an awaitable is returned and the token is cached only
+        once it completes; callers must await it.
+        """
+        now = time.monotonic()
+        expiry = self._session_ok.get(session_token)
+        if expiry is not None and expiry > now and session_token in self.security_manager.sessions:
+            return None
+        try:
+            result = self.security_manager.validate_session(session_token)
+        except InvalidSessionError:
+            self._session_ok.pop(session_token, None)
+            raise
+        if inspect.isawaitable(result):
+            return self._finish_session_validation(session_token, result, now)
+        self._remember(self._session_ok, session_token, now)
+        return None
+
+    async def _finish_session_validation(self, session_token: str, pending: Awaitable, now: float) -> None:
+        """
+        Await an asynchronous session validator, caching the token only if it passes.
+        """
+        try:
+            await pending
+        except InvalidSessionError:
+            self._session_ok.pop(session_token, None)
+            raise
+        self._remember(self._session_ok, session_token, now)
+
+    def _check_phishing_cached(self, url: str, parsed: Optional[SplitResult] = None) -> None:
+        """
+        Run the phishing check, skipping it for URLs that passed within VALIDATION_CACHE_TTL.
+        Keyed by full URL because the detector also matches path and query patterns.
+        """
+        now = time.monotonic()
+        expiry = self._url_ok.get(url)
+        if expiry is not None and expiry > now:
+            return
+        self._check_phishing(url, parsed)
+        self._remember(self._url_ok, url, now)
 
     async def close_browser(self) -> None:
         """
         Closes the browser and cleans up resources.
         """
+        if self._metric_flusher:
+            self._metric_flusher.cancel()
+            self._metric_flusher = None
+        self._drain_metric_queue()
+        self._ops_since_recycle = 0
         if self.context:
             await self.context.close()
             self.context = None
             self.browser = None
             self.page = None
+            self._confirm_locator = None
+            self._confirm_locator_page = None
             logger.info("Browser context closed and cleaned up.")
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
 
-    async def navigate(self, url: str, session_token: str) -> None:
+    async def navigate(self, url: str, session_token: str, eager: bool = False) -> None:
         """
         Securely navigate to a URL after phishing and session validation.
         Records duration and security events.
+        :param eager: Return once the navigation commits, with a short timeout. Timeouts are
+            tolerated for Metamask internal pages, whose UI keeps rendering after commit.
         """
-        start_time = time.time()
+        from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+        start_time = time.perf_counter()
         current_status = "success" # Default status
 
         try:
-            self.security_manager.validate_session(session_token)
-            self.security_manager.check_phishing(url)
-
-            if not url.startswith("http"): # Basic URL validation
+            pending = self._validate_session_cached(session_token)
+            if pending is not None:
+                await pending
+            try:
+                parsed = _parse_url(url)
+            except ValueError:
                 current_status = "failure_invalid_url_scheme"
                 record_browser_automation_security_event(event_type="invalid_url_scheme")
                 raise ValueError("Invalid URL scheme.")
+            self._check_phishing_cached(url, parsed)
+            is_internal = parsed.scheme == METAMASK_INTERNAL_SCHEME
+
+            # Recycle only at navigation boundaries, where page state is discarded anyway
+            await self._maybe_recycle_context()
 
             if not self.page:
-                # Attempt to launch browser if page is not available.
-                # This might indicate an issue if launch_browser wasn't called or failed previously.
-                logger.warning("Page not available for navigation, attempting to launch browser.")
-                await self.launch_browser()
+                # Launch at most once per controller; opening the context creates the page.
+                await self._ensure_browser()
                 if not self.page: # Still no page after attempt
                     current_status = "failure_page_unavailable"
                     record_browser_automation_security_event(event_type="page_unavailable_error")
                     raise BrowserControllerError("Browser page not available for navigation even after launch attempt.")
-            
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=15000)
+
+            if eager:
+                try:
+                    await self.page.goto(url, wait_until="commit", timeout=EAGER_NAVIGATION_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    if not is_internal:
+                        raise
+                    logger.debug(f"Eager navigation to Metamask page {url} timed out after commit window")
+            else:
+                await self.page.goto(url, wait_until="domcontentloaded", timeout=15000)
             logger.info(f"Navigated to {url}")
 
         except InvalidSessionError as e:
@@ -191,8 +523,8 @@ class BrowserController:
             # Consider re-raising as BrowserControllerError
             raise BrowserControllerError(f"Unexpected error navigating to {url}: {e}")
         finally:
-            duration = time.time() - start_time
-            record_browser_operation(operation="navigate", status=current_status, duration=duration)
+            duration = time.perf_counter() - start_time
+            self._metric_queue.append(("navigate", current_status, duration))
 
     async def interact_with_element(self, selector: str, action: str, value: Optional[str] = None) -> None:
         """
@@ -202,12 +534,13 @@ class BrowserController:
         :param action: Action to perform ('click', 'type', etc.).
         :param value: Value to type if action is 'type'.
         """
-        start_time = time.time()
+        from playwright.async_api import Error as PlaywrightError
+
+        start_time = time.perf_counter()
         current_status = "success"
 
         try:
-            # Placeholder for selector validation
-            if not isinstance(selector, str) or len(selector) > 256 or "<" in selector or ">" in selector:
+            if not isinstance(selector, str) or not _validate_selector(selector):
                 current_status = "failure_unsafe_selector"
                 record_browser_automation_security_event(event_type="unsafe_selector")
                 raise ValueError("Unsafe selector pattern detected.")
@@ -217,17 +550,21 @@ class BrowserController:
                 record_browser_automation_security_event(event_type="page_unavailable_interaction")
                 raise BrowserControllerError("Browser page not available for interaction.")
 
-            element = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
-            
+            # Counted towards recycling, which is deferred to the next navigation
+            self._ops_since_recycle += 1
+
+            # Locator actions auto-wait for the element to be actionable, fusing wait + action
+            locator = self._locator_for(selector)
+
             if action == "click":
-                await element.click(timeout=5000) # Added timeout to click
+                await locator.click(timeout=5000)
                 logger.info(f"Clicked element: {selector}")
             elif action == "type":
                 if value is None or not isinstance(value, str) or len(value) > 256:
                     current_status = "failure_unsafe_type_value"
                     record_browser_automation_security_event(event_type="unsafe_type_value")
                     raise ValueError("Unsafe or missing value for typing.")
-                await element.fill(value, timeout=5000) # Added timeout to fill
+                await locator.fill(value, timeout=5000)
                 logger.info(f"Typed into element: {selector}")
             else:
                 current_status = "failure_unsupported_action"
@@ -261,43 +598,86 @@ class BrowserController:
             record_browser_automation_security_event(event_type=f"unknown_{action}_error")
             raise BrowserControllerError(f"Unexpected error with {selector}, action {action}: {e}")
         finally:
-            duration = time.time() - start_time
-            record_browser_operation(operation=f"interact_{action}", status=current_status, duration=duration)
+            duration = time.perf_counter() - start_time
+            self._metric_queue.append((f"interact_{action}", current_status, duration))
 
-    async def capture_screenshot(self, path: str) -> None:
+    async def capture_screenshot(self, path: str, lossless: bool = False) -> None:
         """
-        Capture a screenshot for debugging.
+        Capture a viewport screenshot for debugging.
+        Defaults to JPEG at quality 60, which is far cheaper to encode than PNG.
+        :param lossless: Capture a PNG instead, e.g. for forensic snapshots.
         """
         if not self.page:
             raise RuntimeError("No active page to capture screenshot.")
-        await self.page.screenshot(path=path)
+        if lossless:
+            await self.page.screenshot(path=path, type="png", full_page=False, animations="disabled", caret="hide")
+        else:
+            await self.page.screenshot(
+                path=path, type="jpeg", quality=60, full_page=False, animations="disabled", caret="hide"
+            )
         logger.info(f"Screenshot saved to {path}")
 
-    async def perform_metamask_interaction(self, session_token: str, interaction: Dict[str, Any]) -> None:
+    def _locator_for(self, selector: str) -> "Locator":
+        """
+        Return a Locator for the selector on the active page. The Metamask confirm button,
+        clicked on every transaction, is resolved once per page and reused.
+        """
+        if selector != METAMASK_CONFIRM_SELECTOR:
+            return self.page.locator(selector)
+        if self._confirm_locator is None or self._confirm_locator_page is not self.page:
+            self._confirm_locator = self.page.locator(selector)
+            self._confirm_locator_page = self.page
+        return self._confirm_locator
+
+    @staticmethod
+    async def _await_validations(results: list) -> None:
+        """
+        Await any validators that returned awaitables (e.g. RPC- or DB-backed checks) concurrently.
+        Synchronous validators have already run inline, so they add no scheduling overhead.
+        """
+        pending = [result for result in results if inspect.isawaitable(result)]
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def perform_metamask_interaction(
+        self,
+        session_token: str,
+        interaction: Union[MetamaskInteraction, Dict[str, Any]],
+        eager: bool = True,
+    ) -> None:
         """
         Perform a secure Metamask interaction (e.g., transaction signing).
         Validates session and transaction, and logs security events.
         :param session_token: Session token for the user.
-        :param interaction: Dict describing the interaction (type, params, etc.).
+        :param interaction: The interaction to perform; the legacy dict form is still accepted.
+        :param eager: Navigate to the interaction's popup URL with eager (commit-only) loading.
         """
+        if not isinstance(interaction, MetamaskInteraction):
+            interaction = MetamaskInteraction.from_dict(interaction)
+        is_transaction = interaction.type == "transaction"
+
         try:
-            self.security_manager.validate_session(session_token)
-            if interaction.get("type") == "transaction":
-                self.security_manager.verify_transaction(interaction.get("params", {}))
+            checks = [self._validate_session_cached(session_token)]
+            if is_transaction:
+                checks.append(self.security_manager.verify_transaction(interaction.params))
             # Additional interaction types can be handled here
+            await self._await_validations(checks)
         except (InvalidSessionError, SecurityViolationError) as e:
             logger.error(f"Metamask interaction blocked: {e}")
             self.security_manager.log_security_event({
                 "event_type": "interaction_blocked",
                 "reason": str(e),
-                "interaction": interaction,
+                "interaction": asdict(interaction),
             })
             raise
 
-        # Example: Click the "Confirm" button in Metamask popup
-        if interaction.get("type") == "transaction":
-            # This selector is for illustration; real selectors should be validated and kept up to date
-            await self.interact_with_element('button[data-testid="page-container-footer-next"]', "click")
-            logger.info("Metamask transaction confirmed via automation.")
+        match interaction.type:
+            case "transaction":
+                # Example: Click the "Confirm" button in Metamask popup
+                if interaction.url:
+                    await self.navigate(interaction.url, session_token, eager=eager)
+                # Illustrative selector; real selectors should be validated and kept up to date
+                await self.interact_with_element(METAMASK_CONFIRM_SELECTOR, "click")
+                logger.info("Metamask transaction confirmed via automation.")
 
     # Additional secure utility methods can be added as needed
\ No newline at end of file
@@ -9,6 +9,8 @@ Manages environment-based configuration, including:
 
 Provides centralized configuration management for all wallet operations.
 """
+import os
+
 # Metrics configuration for Prometheus integration
 METRICS_ENABLED = True
 METRICS_PORT = 8000
@@ -29,4 +31,11 @@ WEB3_PROVIDER_URL = "http://localhost:8545"
 
 # Browser automation configuration
 BROWSER_TYPE = "chrome"
-BROWSER_HEADLESS = True
\ No newline at end of file
+BROWSER_HEADLESS = True
+# Software rendering only when explicitly requested; GPU compositing is used where available
+BROWSER_DISABLE_GPU = os.environ.get("BROWSER_DISABLE_GPU", "false").lower() in ("1", "true", "yes")
+# Container mode adds --no-sandbox and --disable-dev-shm-usage; auto-detected unless set explicitly
+BROWSER_CONTAINER_MODE = os.environ.get(
+    "BROWSER_CONTAINER_MODE",
+    str(os.path.exists("/.dockerenv") or "KUBERNETES_SERVICE_HOST" in os.environ),
+).lower() in ("1", "true", "yes")
@@ -12,16 +12,59 @@ Enables real-time event distribution across the trading system.
 
 import json
 import asyncio
-from typing import Dict, Any, Optional
+import time
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 try:
-    from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
+    import orjson
 except ImportError:
-    AIOKafkaProducer = None
-    AIOKafkaConsumer = None
+    orjson = None
+try:
+    import lz4  # noqa: F401 - enables lz4 compression in aiokafka
+    COMPRESSION_TYPE = "lz4"
+except ImportError:
+    COMPRESSION_TYPE = None
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Producer batching: wait up to LINGER_MS to fill batches of up to MAX_BATCH_SIZE bytes
+LINGER_MS = 5
+MAX_BATCH_SIZE = 65536
+# Consumer callbacks allowed to run concurrently before the consumer loop applies backpressure
+MAX_INFLIGHT_CALLBACKS = 32
+# Minimum seconds between offset commits while consuming
+COMMIT_INTERVAL = 1.0
+# Batched consumption: wait up to FETCH_TIMEOUT_MS for up to FETCH_MAX_RECORDS messages
+FETCH_TIMEOUT_MS = 200
+FETCH_MAX_RECORDS = 500
+# A failing consumer callback is retried up to MAX_CALLBACK_ATTEMPTS times, RETRY_BACKOFF
+# seconds apart, before the message is dead-lettered and its offset released
+MAX_CALLBACK_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+
+# Producers shared by every KafkaIntegration in the process, keyed by bootstrap servers,
+# so all instances feed the same batch accumulator over one set of broker connections
+_PRODUCERS: Dict[str, Any] = {}
+_PRODUCER_REFCOUNTS: Dict[str, int] = {}
+_PRODUCERS_LOCK = asyncio.Lock()
+
+if orjson is not None:
+    # orjson emits bytes directly; Decimal and other unknown types fall back to str
+    def serialize_value(value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, default=str)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits, which wei amounts can exceed
+            return json.dumps(value, default=str).encode('utf-8')
+    deserialize_value = orjson.loads
+else:
+    def serialize_value(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode('utf-8')
+
+    def deserialize_value(raw: bytes) -> Any:
+        return json.loads(raw.decode('utf-8'))
+
 class KafkaIntegration:
     """
     Manages Kafka interactions for the Metamask Integration Service.
@@ -38,6 +81,17 @@ class KafkaIntegration:
         self.bootstrap_servers = bootstrap_servers
         self.producer = None
         self.consumer = None
+        self._group_id: Optional[str] = None
+        self._consuming = False
+        self._callback_slots = asyncio.Semaphore(MAX_INFLIGHT_CALLBACKS)
+        self._inflight: Set[asyncio.Task] = set()
+        self._pending_offsets: Dict[Any, Set[int]] = defaultdict(set)
+        self._next_offsets: Dict[Any, int] = {}
+        self._committed_offsets: Dict[Any, int] = {}
+        self._last_commit = 0.0
+        # Set while subscribe_to_topics() is not dispatching, so stop() can wait for it to exit
+        self._loop_idle = asyncio.Event()
+        self._loop_idle.set()
         self.topics = {
             "wallet": "wallet-events",
             "transaction": "transaction-events",
@@ -48,20 +102,34 @@ class KafkaIntegration:
     
     async def start(self):
         """
-        Start Kafka producer.
+        Start Kafka producer, reusing the process-wide producer for these bootstrap servers.
         Note: Ensure 'aiokafka' library is installed (`pip install aiokafka`).
         """
-        if AIOKafkaProducer is None:
+        # aiokafka is imported lazily to keep it out of process startup
+        try:
+            from aiokafka import AIOKafkaProducer
+        except ImportError:
             logger.warning("aiokafka library not installed. Kafka integration disabled.")
             return
             
         try:
-            self.producer = AIOKafkaProducer(
-                bootstrap_servers=self.bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8')
-            )
-            await self.producer.start()
-            logger.info("Kafka producer started successfully.")
+            async with _PRODUCERS_LOCK:
+                producer = _PRODUCERS.get(self.bootstrap_servers)
+                if producer is None:
+                    producer = AIOKafkaProducer(
+                        bootstrap_servers=self.bootstrap_servers,
+                        value_serializer=serialize_value,
+                        linger_ms=LINGER_MS,
+                        max_batch_size=MAX_BATCH_SIZE,
+                        compression_type=COMPRESSION_TYPE,
+                        acks=1,
+                    )
+                    await producer.start()
+                    _PRODUCERS[self.bootstrap_servers] = producer
+                    _PRODUCER_REFCOUNTS[self.bootstrap_servers] = 0
+                    logger.info("Kafka producer started successfully.")
+                _PRODUCER_REFCOUNTS[self.bootstrap_servers] += 1
+            self.producer = producer
         except Exception as e:
             logger.error(f"Failed to start Kafka producer: {e}")
             raise
@@ -69,64 +137,226 @@ class KafkaIntegration:
     async def stop(self):
         """
         Stop Kafka producer and consumer if initialized.
+        The consume loop is allowed to exit first, then in-flight consumer callbacks are
+        drained and their offsets committed.
         """
+        self._consuming = False
+        await self._loop_idle.wait()
         if self.producer:
-            await self.producer.stop()
-            logger.info("Kafka producer stopped.")
+            self.producer = None
+            await self._release_producer()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
         if self.consumer:
+            try:
+                await self._commit_completed(force=True)
+            except Exception as e:
+                logger.error(f"Failed to commit offsets on shutdown: {e}")
             await self.consumer.stop()
             logger.info("Kafka consumer stopped.")
     
-    async def publish_event(self, event_type: str, event_data: Dict[str, Any]):
+    async def _release_producer(self) -> None:
+        """
+        Drop this instance's reference to the shared producer, stopping it when no users remain.
+        """
+        async with _PRODUCERS_LOCK:
+            _PRODUCER_REFCOUNTS[self.bootstrap_servers] -= 1
+            if _PRODUCER_REFCOUNTS[self.bootstrap_servers] > 0:
+                return
+            del _PRODUCER_REFCOUNTS[self.bootstrap_servers]
+            producer = _PRODUCERS.pop(self.bootstrap_servers)
+            await producer.stop()
+            logger.info("Kafka producer stopped.")
+
+    async def publish_event(self, event_type: str, event_data: Dict[str, Any], wait: bool = False) -> asyncio.Future:
         """
         Publish an event to the appropriate Kafka topic.
+
+        The event is handed to the producer's batch accumulator without waiting for the
+        broker round-trip; pass ``wait=True`` when the caller requires delivery confirmation.
         
         Args:
             event_type (str): Type of event (wallet, transaction, portfolio, error, network).
             event_data (Dict[str, Any]): Event data to be published.
+            wait (bool): Await broker acknowledgement before returning.
+
+        Returns:
+            asyncio.Future: Delivery future resolving to the record metadata.
+        """
+        topic = self._resolve_topic(event_type)
+        try:
+            future = await self.producer.send(topic, event_data)
+            if wait:
+                await future
+                logger.info(f"Published {event_type} event to {topic}")
+            else:
+                future.add_done_callback(lambda f: self._log_delivery_failure(topic, f))
+            return future
+        except Exception as e:
+            logger.error(f"Failed to publish event to {topic}: {e}")
+            raise
+
+    async def publish_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Publish several events, pipelining the sends and awaiting all acknowledgements together.
+        
+        Args:
+            events: Iterable of (event_type, event_data) pairs.
+
+        Returns:
+            List[Any]: Record metadata for each published event, in order.
+        """
+        futures = []
+        for event_type, event_data in events:
+            topic = self._resolve_topic(event_type)
+            futures.append(await self.producer.send(topic, event_data))
+        try:
+            results = await asyncio.gather(*futures)
+            logger.info(f"Published batch of {len(futures)} events")
+            return results
+        except Exception as e:
+            logger.error(f"Failed to publish event batch: {e}")
+            raise
+
+    def _resolve_topic(self, event_type: str) -> str:
+        """
+        Map an event type to its topic, checking that the producer is running.
         """
         if event_type not in self.topics:
             logger.error(f"Unknown event type: {event_type}")
             raise ValueError(f"Unknown event type: {event_type}")
-            
-        topic = self.topics[event_type]
         if self.producer is None:
             logger.error("Kafka producer not initialized")
             raise RuntimeError("Kafka producer not initialized")
-            
-        try:
-            await self.producer.send_and_wait(topic, event_data)
-            logger.info(f"Published {event_type} event to {topic}")
-        except Exception as e:
-            logger.error(f"Failed to publish event to {topic}: {e}")
-            raise
+        return self.topics[event_type]
+
+    @staticmethod
+    def _log_delivery_failure(topic: str, future: asyncio.Future) -> None:
+        """
+        Done-callback for fire-and-forget sends; surfaces delivery errors in the log.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Failed to publish event to {topic}: {future.exception()}")
     
-    async def subscribe_to_topics(self, topics: list, callback):
+    async def subscribe_to_topics(self, topics: list, callback, group_id: Optional[str] = None):
         """
         Subscribe to specified Kafka topics and process messages with the provided callback.
+
+        Messages are fetched in batches with getmany(); callbacks run concurrently, bounded by
+        MAX_INFLIGHT_CALLBACKS. When a consumer group is given, offsets are committed only up
+        to the oldest message whose callback has not finished, preserving at-least-once delivery.
         
         Args:
             topics (list): List of topics to subscribe to.
             callback: Function to process incoming messages.
+            group_id (Optional[str]): Consumer group used for offset commits.
         """
-        if AIOKafkaConsumer is None:
+        try:
+            from aiokafka import AIOKafkaConsumer
+            from aiokafka.errors import ConsumerStoppedError
+        except ImportError:
             logger.warning("aiokafka library not installed. Kafka subscription disabled.")
             return
             
         try:
+            self._group_id = group_id
             self.consumer = AIOKafkaConsumer(
                 *topics,
                 bootstrap_servers=self.bootstrap_servers,
-                value_deserializer=lambda v: json.loads(v.decode('utf-8'))
+                group_id=group_id,
+                enable_auto_commit=False,
+                value_deserializer=deserialize_value
             )
             await self.consumer.start()
             logger.info(f"Subscribed to topics: {topics}")
             
-            async for msg in self.consumer:
+            self._consuming = True
+            self._loop_idle.clear()
+            while self._consuming:
+                batches = await self.consumer.getmany(timeout_ms=FETCH_TIMEOUT_MS, max_records=FETCH_MAX_RECORDS)
+                for tp, messages in batches.items():
+                    for msg in messages:
+                        await self._callback_slots.acquire()
+                        if not self._consuming:
+                            # Undispatched messages are not committed and will be redelivered
+                            self._callback_slots.release()
+                            break
+                        self._pending_offsets[tp].add(msg.offset)
+                        self._next_offsets[tp] = msg.offset + 1
+                        task = asyncio.create_task(self._guarded(callback, msg, tp))
+                        self._inflight.add(task)
+                        task.add_done_callback(self._inflight.discard)
+                await self._commit_completed()
+        except ConsumerStoppedError:
+            logger.info(f"Consumer for topics {topics} stopped.")
+        except Exception as e:
+            logger.error(f"Failed to subscribe to topics {topics}: {e}")
+            raise
+        finally:
+            self._loop_idle.set()
+
+    async def _guarded(self, callback, msg, tp) -> None:
+        """
+        Run a consumer callback, retrying failures and releasing its concurrency slot.
+
+        The callback is attempted up to MAX_CALLBACK_ATTEMPTS times. A message that still fails
+        is dead-lettered and its offset released, so one poison message cannot hold back
+        commits for its partition indefinitely.
+        """
+        try:
+            for attempt in range(1, MAX_CALLBACK_ATTEMPTS + 1):
                 try:
                     await callback(msg.value)
+                    break
                 except Exception as e:
-                    logger.error(f"Error processing message from {msg.topic}: {e}")
+                    if attempt < MAX_CALLBACK_ATTEMPTS:
+                        logger.warning(f"Error processing message from {msg.topic} at offset {msg.offset} "
+                                       f"(attempt {attempt}/{MAX_CALLBACK_ATTEMPTS}), retrying: {e}")
+                        await asyncio.sleep(RETRY_BACKOFF * attempt)
+                    else:
+                        await self._dead_letter(msg, e)
+            self._pending_offsets[tp].discard(msg.offset)
+        finally:
+            self._callback_slots.release()
+
+    async def _dead_letter(self, msg, error: Exception) -> None:
+        """
+        Record a message whose callback kept failing, publishing it to the error topic when a
+        producer is running so it can be inspected and replayed.
+        """
+        logger.error(f"Giving up on message from {msg.topic} at offset {msg.offset} after "
+                     f"{MAX_CALLBACK_ATTEMPTS} attempts; skipping it: {error}")
+        if self.producer is None:
+            return
+        try:
+            await self.publish_event("error", {
+                "event": "dead_letter",
+                "topic": msg.topic,
+                "partition": msg.partition,
+                "offset": msg.offset,
+                "error": str(error),
+                "value": msg.value,
+            })
         except Exception as e:
-            logger.error(f"Failed to subscribe to topics {topics}: {e}")
-            raise
\ No newline at end of file
+            logger.error(f"Failed to dead-letter message from {msg.topic} at offset {msg.offset}: {e}")
+
+    async def _commit_completed(self, force: bool = False) -> None:
+        """
+        Commit, per partition, the offset just past the longest run of finished callbacks.
+        Throttled to COMMIT_INTERVAL unless forced; a no-op without a consumer group.
+        """
+        if self._group_id is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_commit < COMMIT_INTERVAL:
+            return
+        offsets = {}
+        for tp, next_offset in self._next_offsets.items():
+            pending = self._pending_offsets[tp]
+            offset = min(pending) if pending else next_offset
+            if offset > self._committed_offsets.get(tp, -1):
+                offsets[tp] = offset
+        self._last_commit = now
+        if offsets:
+            await self.consumer.commit(offsets)
+            self._committed_offsets.update(offsets)
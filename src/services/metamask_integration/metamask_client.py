@@ -11,9 +11,15 @@ Implements secure, non-custodial wallet access via browser automation.
 Implements the WalletProvider interface as specified in the pseudocode.
 """
 
+import asyncio
+import json
 import os
-import threading
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from enum import Enum, auto
 
 from src.execution.decentralized_execution.wallet_provider import (
@@ -27,10 +33,70 @@ from src.execution.decentralized_execution.wallet_provider import (
     WalletConnection,
 )
 
+# Chain IDs are read from the environment once at import; they do not change at runtime.
+# Example: Ethereum, Polygon, BSC, Arbitrum, Optimism
+_SUPPORTED_CHAINS = tuple(
+    int(os.environ.get(var, default))
+    for var, default in (
+        ("ETHEREUM_CHAIN_ID", 1),
+        ("POLYGON_CHAIN_ID", 137),
+        ("BSC_CHAIN_ID", 56),
+        ("ARBITRUM_CHAIN_ID", 42161),
+        ("OPTIMISM_CHAIN_ID", 10),
+    )
+)
+
+_CAPABILITIES: FrozenSet[WalletCapability] = frozenset({
+    WalletCapability.SIGN_MESSAGE,
+    WalletCapability.SIGN_TRANSACTION,
+    WalletCapability.SEND_TRANSACTION,
+    WalletCapability.SWITCH_CHAIN,
+    WalletCapability.ADD_CHAIN,
+    WalletCapability.WATCH_ASSET,
+})
+
+# JSON-RPC calls issued within BATCH_WAIT seconds of each other share one round-trip,
+# up to BATCH_MAX_COUNT calls per batch
+BATCH_WAIT = 0.005
+BATCH_MAX_COUNT = 10
+# Methods whose result is fixed for a given chain; served from an in-process cache
+CACHEABLE_RPC_METHODS = frozenset({"eth_chainId", "net_version", "eth_getCode"})
+# Block tags whose state can still change, so eth_getCode at these is never cached
+_MUTABLE_BLOCK_TAGS = frozenset({"latest", "pending"})
+RPC_CACHE_SIZE = 256
+# 0x-prefixed 20-byte hex address, as returned by eth_accounts
+_ADDRESS_RE = re.compile(r'0x[a-fA-F0-9]{40}\Z')
+
+if orjson is not None:
+    # orjson encodes straight to bytes and decodes bytes without an intermediate str
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 # Placeholder for browser/EIP-1193 provider integration
 class EthereumProvider:
-    """Stub for injected browser provider (to be replaced with actual browser bridge)."""
-    pass
+    """
+    Transport to the injected browser provider. Subclass and pass as config["provider"];
+    the browser bridge itself is not implemented yet.
+    """
+
+    async def send_raw(self, payload: bytes) -> bytes:
+        """Send an encoded JSON-RPC request object or batch array; return the encoded response."""
+        raise NotImplementedError("Browser bridge not yet implemented")
+
+
+class ProviderRpcError(Exception):
+    """JSON-RPC error object returned by the provider (EIP-1193 ProviderRpcError)."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
 
 class MetaMaskClient(WalletProvider):
     """
@@ -59,26 +125,12 @@ class MetaMaskClient(WalletProvider):
     @property
     def supported_chains(self) -> List[int]:
         """List of supported chain IDs (TDD Anchor: must be non-empty for valid providers)"""
-        # Example: Ethereum, Polygon, BSC, Arbitrum, Optimism
-        return [
-            int(os.environ.get("ETHEREUM_CHAIN_ID", 1)),
-            int(os.environ.get("POLYGON_CHAIN_ID", 137)),
-            int(os.environ.get("BSC_CHAIN_ID", 56)),
-            int(os.environ.get("ARBITRUM_CHAIN_ID", 42161)),
-            int(os.environ.get("OPTIMISM_CHAIN_ID", 10)),
-        ]
+        return list(_SUPPORTED_CHAINS)
 
     @property
-    def capabilities(self) -> Set[WalletCapability]:
+    def capabilities(self) -> FrozenSet[WalletCapability]:
         """Set of supported wallet capabilities (TDD Anchor: must include at least SIGN_MESSAGE and SIGN_TRANSACTION)"""
-        return {
-            WalletCapability.SIGN_MESSAGE,
-            WalletCapability.SIGN_TRANSACTION,
-            WalletCapability.SEND_TRANSACTION,
-            WalletCapability.SWITCH_CHAIN,
-            WalletCapability.ADD_CHAIN,
-            WalletCapability.WATCH_ASSET,
-        }
+        return _CAPABILITIES
 
     # --- State properties ---
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -91,15 +143,22 @@ class MetaMaskClient(WalletProvider):
         - Should setup event listeners correctly
         """
         self._config = config or {}
-        self._event_handlers: Dict[WalletEvent, List[EventHandler]] = {}
+        # Insertion-ordered dicts used as ordered sets: O(1) dedup and removal
+        self._event_handlers: Dict[WalletEvent, Dict[EventHandler, None]] = {}
         self._logger = self._get_logger()
         self._connection_state = ConnectionState.DISCONNECTED
         self._accounts: List[str] = []
         self._chain_id: Optional[int] = None
         self._is_available = False
         self._is_connected = False
-        self._provider = None  # Will be set by browser bridge
-        self._request_queue = []  # Placeholder for request queue
+        # EthereumProvider-compatible transport; until the browser bridge exists it must be supplied
+        self._provider: Optional[EthereumProvider] = self._config.get("provider")
+        # (method, params, future) awaiting dispatch by the batching task
+        self._request_queue: "asyncio.Queue[Tuple[str, list, asyncio.Future]]" = asyncio.Queue()
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_max_count = int(self._config.get("batch_max_count", BATCH_MAX_COUNT))
+        # (method, params, chain_id) -> result for CACHEABLE_RPC_METHODS
+        self._rpc_cache: Dict[Tuple[str, tuple, Optional[int]], Any] = {}
         self._initialize_provider()
 
     @property
@@ -134,10 +193,10 @@ class MetaMaskClient(WalletProvider):
 
     def get_accounts(self) -> List[str]:
         """
-        Retrieve all wallet accounts.
+        Retrieve all wallet accounts, as last fetched by request_accounts().
         TDD Anchor: Should return valid addresses, handle empty state, validate format.
         """
-        raise NotImplementedError("get_accounts() not yet implemented")
+        return list(self._accounts)
 
     def switch_chain(self, chain_id: int) -> None:
         """
@@ -167,16 +226,35 @@ class MetaMaskClient(WalletProvider):
         """
         raise NotImplementedError("send_transaction() not yet implemented")
 
+    # --- Provider queries ---
+    async def request_accounts(self) -> List[str]:
+        """
+        Fetch the wallet's accounts from the provider (eth_accounts) and cache them for get_accounts().
+        Raises ValueError if the provider returns a malformed address.
+        """
+        accounts = await self._request("eth_accounts")
+        if not isinstance(accounts, list) or not all(
+            isinstance(account, str) and _ADDRESS_RE.match(account) for account in accounts
+        ):
+            raise ValueError(f"Invalid eth_accounts response: {accounts!r}")
+        self._accounts = accounts
+        return list(accounts)
+
+    async def request_chain_id(self) -> int:
+        """
+        Fetch the wallet's current chain ID from the provider (eth_chainId).
+        """
+        chain_id = int(await self._request("eth_chainId"), 16)
+        self._chain_id = chain_id
+        return chain_id
+
     # --- Event handling ---
     def add_event_listener(self, event: WalletEvent, handler: EventHandler) -> None:
         """
         Register an event handler for a wallet event.
         TDD Anchor: Should support multiple handlers per event, prevent duplicates.
         """
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
-        if handler not in self._event_handlers[event]:
-            self._event_handlers[event].append(handler)
+        self._event_handlers.setdefault(event, {})[handler] = None
 
     def remove_event_listener(self, event: WalletEvent, handler: Optional[EventHandler] = None) -> None:
         """
@@ -185,22 +263,138 @@ class MetaMaskClient(WalletProvider):
         """
         if event in self._event_handlers:
             if handler:
-                if handler in self._event_handlers[event]:
-                    self._event_handlers[event].remove(handler)
+                self._event_handlers[event].pop(handler, None)
             else:
-                self._event_handlers[event] = []
+                self._event_handlers[event].clear()
 
     def emit(self, event: WalletEvent, data: Any) -> None:
         """
         Emit a wallet event to all registered handlers.
         TDD Anchor: Should call all handlers, handle exceptions, support async.
         """
-        handlers = self._event_handlers.get(event, [])
-        for handler in handlers:
+        if event is WalletEvent.CHAIN_CHANGED:
+            # Internal invalidation runs outside the listener registry so removing listeners cannot disable it
+            self._on_chain_changed(data)
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+        log_error = self._logger.error
+        # Snapshot so handlers may add or remove listeners while the event is dispatched
+        for handler in tuple(handlers):
             try:
                 handler(data)
             except Exception as e:
-                self._logger.error(f"Error in event handler for {event}: {e}")
+                log_error("Error in event handler for %s: %s", event, e)
+
+    # --- JSON-RPC transport ---
+    async def _request(self, method: str, params: Optional[list] = None) -> Any:
+        """
+        Issue a JSON-RPC call through the provider.
+        Calls made close together are coalesced into a single batch request.
+        """
+        params = params or []
+        if method == "eth_chainId" and self._chain_id is not None:
+            return hex(self._chain_id)
+        key = self._rpc_cache_key(method, params)
+        if key is not None and key in self._rpc_cache:
+            return self._rpc_cache[key]
+        future = asyncio.get_running_loop().create_future()
+        self._request_queue.put_nowait((method, params, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._drain_requests())
+        result = await future
+        if key is not None:
+            if len(self._rpc_cache) >= RPC_CACHE_SIZE:
+                self._rpc_cache.pop(next(iter(self._rpc_cache)))
+            self._rpc_cache[key] = result
+        return result
+
+    def _rpc_cache_key(self, method: str, params: list) -> Optional[Tuple[str, tuple, Optional[int]]]:
+        """
+        Cache key for an idempotent call, or None when the result must be fetched.
+        """
+        if method not in CACHEABLE_RPC_METHODS:
+            return None
+        if method == "eth_getCode" and (len(params) < 2 or params[1] in _MUTABLE_BLOCK_TAGS):
+            return None
+        return (method, tuple(params), self._chain_id)
+
+    def _on_chain_changed(self, data: Any) -> None:
+        """
+        Drop cached chain-scoped results when the wallet switches chains.
+        """
+        self._rpc_cache.clear()
+        # The next request_chain_id() refetches rather than returning the old chain
+        self._chain_id = None
+
+    async def _drain_requests(self) -> None:
+        """
+        Collect queued calls until BATCH_WAIT elapses or the batch is full, then dispatch them.
+        Exits once the queue is empty; _request restarts it on demand.
+        """
+        loop = asyncio.get_running_loop()
+        while not self._request_queue.empty():
+            pending = [self._request_queue.get_nowait()]
+            deadline = loop.time() + BATCH_WAIT
+            while len(pending) < self._batch_max_count:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._request_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await self._request_batch([(method, params) for method, params, _ in pending])
+            except Exception as e:
+                for _, _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), result in zip(pending, results):
+                if future.done():
+                    continue
+                if isinstance(result, ProviderRpcError):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _request_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send several JSON-RPC calls as one batch array.
+
+        Returns results in call order; a call that failed is represented by its
+        ProviderRpcError rather than raising, so one error does not sink the batch.
+        Providers that reject batch requests are retried one call at a time.
+        """
+        if self._provider is None:
+            raise ConnectionError("MetaMask provider not available")
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        try:
+            responses = _loads(await self._provider.send_raw(_dumps(batch)))
+        except ProviderRpcError as e:
+            self._logger.debug("Batch request rejected (%s); dispatching individually", e)
+            responses = None
+        if not isinstance(responses, list):
+            # Batch unsupported: a single error object (or a refusal) instead of an array
+            responses = []
+            for request in batch:
+                responses.append(_loads(await self._provider.send_raw(_dumps(request))))
+        by_id = {response.get("id"): response for response in responses}
+        results = []
+        for i in range(len(calls)):
+            response = by_id.get(i)
+            if response is None:
+                results.append(ProviderRpcError(-32603, "Missing response in batch"))
+            elif "error" in response:
+                error = response["error"]
+                results.append(ProviderRpcError(error.get("code", -32603), error.get("message", ""), error.get("data")))
+            else:
+                results.append(response.get("result"))
+        return results
 
     # --- Internal helpers ---
     def _get_logger(self):
@@ -223,6 +417,9 @@ class MetaMaskClient(WalletProvider):
         - Should handle provider injection timing
         - Should validate EIP-1193 compliance
         """
+        if self._provider is not None:
+            self._is_available = True
+            return
         # This is a placeholder for browser bridge logic.
         # In production, this would use a browser automation or JS bridge.
         self._logger.info("MetaMask provider detection not implemented (requires browser context)")
@@ -4,133 +4,157 @@ This module handles the collection and exposure of metrics for monitoring
 the Metamask Integration Service using Prometheus.
 """
 
+import asyncio
 import time
+from functools import lru_cache
 from typing import Optional
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
 from .config import METRICS_ENABLED, METRICS_PORT, METRICS_ENDPOINT
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Metrics definitions
-
-# Security Metrics
-metamask_auth_failures_total = Counter(
-    'metamask_auth_failures_total',
-    'Counter for authentication failures.'
-)
-metamask_suspicious_transactions_detected_total = Counter(
-    'metamask_suspicious_transactions_detected_total',
-    'Counter for detected suspicious transactions.'
-)
-metamask_rpc_connection_errors_total = Counter(
-    'metamask_rpc_connection_errors_total',
-    'Counter for RPC connection errors.'
-)
-metamask_browser_automation_security_events_total = Counter(
-    'metamask_browser_automation_security_events_total',
-    'Counter for security events from browser automation.',
-    ['event_type']
-)
-
-# Performance Metrics
-metamask_api_request_duration_seconds = Histogram(
-    'metamask_api_request_duration_seconds',
-    'Histogram for API endpoint latency.',
-    ['endpoint', 'method', 'status_code']
-)
-metamask_api_requests_total = Counter( # Renamed from api_requests_total for consistency
-    'metamask_api_requests_total',
-    'Counter for total API requests.',
-    ['endpoint', 'method', 'status_code']
-)
-metamask_api_requests_failed_total = Counter(
-    'metamask_api_requests_failed_total',
-    'Counter for failed API requests.',
-    ['endpoint', 'method', 'status_code']
-)
-metamask_browser_automation_duration_seconds = Histogram(
-    'metamask_browser_automation_duration_seconds',
-    'Histogram for browser automation task duration.',
-    ['task_type']
-)
-metamask_db_query_duration_seconds = Histogram(
-    'metamask_db_query_duration_seconds',
-    'Histogram for database query duration.',
-    ['query_type', 'table']
-)
-metamask_kafka_message_processing_duration_seconds = Histogram(
-    'metamask_kafka_message_processing_duration_seconds',
-    'Histogram for Kafka message processing time.',
-    ['topic', 'consumer_group']
-)
-metamask_kafka_messages_processed_total = Counter(
-    'metamask_kafka_messages_processed_total',
-    'Counter for Kafka messages processed.',
-    ['topic', 'consumer_group', 'status']
-)
-
-# Business Metrics
-metamask_wallet_connection_attempts_total = Counter( # Renamed from wallet_connections_total
-    'metamask_wallet_connection_attempts_total',
-    'Counter for wallet connection attempts.'
-)
-metamask_wallet_connection_successful_total = Counter(
-    'metamask_wallet_connection_successful_total',
-    'Counter for successful wallet connections.'
-)
-metamask_wallet_connection_failed_total = Counter(
-    'metamask_wallet_connection_failed_total',
-    'Counter for failed wallet connections.',
-    ['reason']
-)
-metamask_transaction_attempts_total = Counter( # Renamed from transaction_requests_total
-    'metamask_transaction_attempts_total',
-    'Counter for transaction attempts.',
-    ['status'] # Existing label, kept for now, may need review based on usage
-)
-metamask_transaction_completed_total = Counter(
-    'metamask_transaction_completed_total',
-    'Counter for completed transactions.'
-)
-metamask_transaction_failed_total = Counter(
-    'metamask_transaction_failed_total',
-    'Counter for failed transactions.',
-    ['reason']
-)
-metamask_network_switches_total = Counter( # Renamed from network_switches_total
-    'metamask_network_switches_total',
-    'Counter for network switch events.',
-    ['from_network', 'to_network', 'status']
-)
-metamask_user_sessions_active = Gauge(
-    'metamask_user_sessions_active',
-    'Gauge for currently active user sessions.'
-)
-metamask_user_session_duration_seconds = Histogram(
-    'metamask_user_session_duration_seconds',
-    'Histogram for user session durations.'
-)
-
-# Operational Metrics
-metamask_dependency_health = Gauge(
-    'metamask_dependency_health',
-    'Gauge for health of dependencies.',
-    ['dependency_name', 'status']
-)
-
-# Existing metrics (to be reviewed if they are redundant or need renaming)
-# transaction_latency_seconds = Histogram('transaction_latency_seconds', 'Transaction processing latency in seconds', ['status']) # Covered by specific transaction metrics
-# browser_operations_total = Counter('browser_operations_total', 'Total number of browser operations', ['operation', 'status']) # Covered by specific browser automation metrics
-# validation_checks_total = Counter('validation_checks_total', 'Total number of validation checks', ['type', 'result']) # Potentially useful, keep for now
-
-
-# --- Potentially redundant or to be refactored metrics ---
-# These were present in the original file but might be covered by the new, more specific metrics.
-# Review and remove/refactor if necessary.
-transaction_latency_seconds = Histogram('metamask_transaction_latency_seconds', 'Transaction processing latency in seconds', ['status']) # Renamed for consistency
-browser_operations_total = Counter('metamask_browser_operations_total', 'Total number of browser operations', ['operation', 'status']) # Renamed for consistency
-validation_checks_total = Counter('metamask_validation_checks_total', 'Total number of validation checks', ['type', 'result']) # Renamed for consistency
+# Histogram buckets tuned to observed latencies; fewer buckets mean fewer series per
+# label set and a shorter bucket walk on each observation (+Inf is implicit)
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# Browser automation and on-chain transactions run for seconds; navigation alone may take
+# up to its 15s timeout, and alerts fire on a >10s p95, so the buckets must reach past that
+SLOW_OPERATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0)
+# User sessions last minutes to hours rather than seconds
+SESSION_DURATION_BUCKETS = (60.0, 300.0, 900.0, 3600.0, 14400.0)
+
+# Dedicated metrics listener started by start_metrics_listener(), polled at this interval until up
+METRICS_STARTUP_POLL = 0.01
+_metrics_server = None
+_metrics_task = None
+
+# prometheus_client is only imported, and metrics only registered, when collection is enabled
+if METRICS_ENABLED:
+    from prometheus_client import Counter, Histogram, Gauge, make_asgi_app, start_http_server
+
+    # Metrics definitions
+
+    # Security Metrics
+    metamask_auth_failures_total = Counter(
+        'metamask_auth_failures_total',
+        'Counter for authentication failures.'
+    )
+    metamask_suspicious_transactions_detected_total = Counter(
+        'metamask_suspicious_transactions_detected_total',
+        'Counter for detected suspicious transactions.'
+    )
+    metamask_rpc_connection_errors_total = Counter(
+        'metamask_rpc_connection_errors_total',
+        'Counter for RPC connection errors.'
+    )
+    metamask_browser_automation_security_events_total = Counter(
+        'metamask_browser_automation_security_events_total',
+        'Counter for security events from browser automation.',
+        ['event_type']
+    )
+
+    # Performance Metrics
+    metamask_api_request_duration_seconds = Histogram(
+        'metamask_api_request_duration_seconds',
+        'Histogram for API endpoint latency.',
+        ['endpoint', 'method', 'status_code'],
+        buckets=LATENCY_BUCKETS
+    )
+    metamask_api_requests_total = Counter( # Renamed from api_requests_total for consistency
+        'metamask_api_requests_total',
+        'Counter for total API requests.',
+        ['endpoint', 'method', 'status_code']
+    )
+    metamask_api_requests_failed_total = Counter(
+        'metamask_api_requests_failed_total',
+        'Counter for failed API requests.',
+        ['endpoint', 'method', 'status_code']
+    )
+    metamask_browser_automation_duration_seconds = Histogram(
+        'metamask_browser_automation_duration_seconds',
+        'Histogram for browser automation task duration.',
+        ['task_type'],
+        buckets=SLOW_OPERATION_BUCKETS
+    )
+    metamask_db_query_duration_seconds = Histogram(
+        'metamask_db_query_duration_seconds',
+        'Histogram for database query duration.',
+        ['query_type', 'table'],
+        buckets=LATENCY_BUCKETS
+    )
+    metamask_kafka_message_processing_duration_seconds = Histogram(
+        'metamask_kafka_message_processing_duration_seconds',
+        'Histogram for Kafka message processing time.',
+        ['topic', 'consumer_group'],
+        buckets=LATENCY_BUCKETS
+    )
+    metamask_kafka_messages_processed_total = Counter(
+        'metamask_kafka_messages_processed_total',
+        'Counter for Kafka messages processed.',
+        ['topic', 'consumer_group', 'status']
+    )
+
+    # Business Metrics
+    metamask_wallet_connection_attempts_total = Counter( # Renamed from wallet_connections_total
+        'metamask_wallet_connection_attempts_total',
+        'Counter for wallet connection attempts.'
+    )
+    metamask_wallet_connection_successful_total = Counter(
+        'metamask_wallet_connection_successful_total',
+        'Counter for successful wallet connections.'
+    )
+    metamask_wallet_connection_failed_total = Counter(
+        'metamask_wallet_connection_failed_total',
+        'Counter for failed wallet connections.',
+        ['reason']
+    )
+    metamask_transaction_attempts_total = Counter( # Renamed from transaction_requests_total
+        'metamask_transaction_attempts_total',
+        'Counter for transaction attempts.',
+        ['status'] # Existing label, kept for now, may need review based on usage
+    )
+    metamask_transaction_completed_total = Counter(
+        'metamask_transaction_completed_total',
+        'Counter for completed transactions.'
+    )
+    metamask_transaction_failed_total = Counter(
+        'metamask_transaction_failed_total',
+        'Counter for failed transactions.',
+        ['reason']
+    )
+    metamask_network_switches_total = Counter( # Renamed from network_switches_total
+        'metamask_network_switches_total',
+        'Counter for network switch events.',
+        ['from_network', 'to_network', 'status']
+    )
+    metamask_user_sessions_active = Gauge(
+        'metamask_user_sessions_active',
+        'Gauge for currently active user sessions.'
+    )
+    metamask_user_session_duration_seconds = Histogram(
+        'metamask_user_session_duration_seconds',
+        'Histogram for user session durations.',
+        buckets=SESSION_DURATION_BUCKETS
+    )
+
+    # Operational Metrics
+    metamask_dependency_health = Gauge(
+        'metamask_dependency_health',
+        'Gauge for health of dependencies.',
+        ['dependency_name', 'status']
+    )
+
+    # Existing metrics (to be reviewed if they are redundant or need renaming)
+    # transaction_latency_seconds = Histogram('transaction_latency_seconds', 'Transaction processing latency in seconds', ['status']) # Covered by specific transaction metrics
+    # browser_operations_total = Counter('browser_operations_total', 'Total number of browser operations', ['operation', 'status']) # Covered by specific browser automation metrics
+    # validation_checks_total = Counter('validation_checks_total', 'Total number of validation checks', ['type', 'result']) # Potentially useful, keep for now
+
+
+    # --- Potentially redundant or to be refactored metrics ---
+    # These were present in the original file but might be covered by the new, more specific metrics.
+    # Review and remove/refactor if necessary.
+    transaction_latency_seconds = Histogram('metamask_transaction_latency_seconds', 'Transaction processing latency in seconds', ['status'], buckets=SLOW_OPERATION_BUCKETS) # Renamed for consistency
+    browser_operations_total = Counter('metamask_browser_operations_total', 'Total number of browser operations', ['operation', 'status']) # Renamed for consistency
+    validation_checks_total = Counter('metamask_validation_checks_total', 'Total number of validation checks', ['type', 'result']) # Renamed for consistency
 
 
 def start_metrics_server():
@@ -146,12 +170,81 @@ def start_metrics_server():
     else:
         logger.info("Metrics collection is disabled in configuration")
 
+async def _serve_metrics(server, sock) -> None:
+    """
+    Run the metrics server on an already bound socket, containing uvicorn's startup exits.
+    """
+    try:
+        await server.serve(sockets=[sock])
+    except SystemExit:
+        # uvicorn calls sys.exit() when startup fails; that must not take the API down with it
+        logger.error("Metrics listener failed to start")
+    finally:
+        sock.close()
+
+async def start_metrics_listener() -> bool:
+    """
+    Serve metrics on METRICS_PORT from the running event loop.
+
+    The exposition app runs under its own uvicorn server on the dedicated metrics port,
+    so scrapes neither spawn a thread per connection (as start_metrics_server() does)
+    nor reach the public API port. A port that cannot be bound is logged, not fatal.
+
+    Returns:
+        bool: True if the listener was started.
+    """
+    global _metrics_server, _metrics_task
+    if not METRICS_ENABLED:
+        logger.info("Metrics collection is disabled in configuration")
+        return False
+    if _metrics_server is not None:
+        return True
+    import socket
+    import uvicorn
+
+    # Bind before handing off: uvicorn's own bind exits the process on failure
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(("0.0.0.0", METRICS_PORT))
+    except OSError as e:
+        sock.close()
+        logger.error(f"Failed to start metrics listener on port {METRICS_PORT}: {e}")
+        return False
+    server = uvicorn.Server(uvicorn.Config(
+        make_asgi_app(),
+        lifespan="off",
+        access_log=False,
+        log_level="warning",
+    ))
+    # The API's own server owns process signals
+    server.install_signal_handlers = lambda: None
+    task = asyncio.create_task(_serve_metrics(server, sock))
+    while not server.started and not task.done():
+        await asyncio.sleep(METRICS_STARTUP_POLL)
+    if not server.started:
+        return False
+    _metrics_server, _metrics_task = server, task
+    logger.info(f"Metrics listener started on port {METRICS_PORT}, endpoint {METRICS_ENDPOINT}")
+    return True
+
+async def stop_metrics_listener() -> None:
+    """
+    Shut down the listener started by start_metrics_listener(), if any.
+    """
+    global _metrics_server, _metrics_task
+    if _metrics_server is None:
+        return
+    _metrics_server.should_exit = True
+    await _metrics_task
+    _metrics_server = _metrics_task = None
+    logger.info("Metrics listener stopped")
+
 def record_wallet_connection():
     """
     Record a wallet connection attempt.
     """
-    if METRICS_ENABLED:
-        metamask_wallet_connection_attempts_total.inc() # Updated to new metric name
+    metamask_wallet_connection_attempts_total.inc() # Updated to new metric name
 
 def record_transaction_request(status: str):
     """
@@ -160,8 +253,7 @@ def record_transaction_request(status: str):
     Args:
         status (str): The status of the transaction request (e.g., 'success', 'failure').
     """
-    if METRICS_ENABLED:
-        metamask_transaction_attempts_total.labels(status=status).inc() # Updated to new metric name
+    metamask_transaction_attempts_total.labels(status=status).inc() # Updated to new metric name
 
 def record_transaction_latency(status: str, start_time: float):
     """
@@ -169,11 +261,10 @@ def record_transaction_latency(status: str, start_time: float):
     
     Args:
         status (str): The status of the transaction (e.g., 'success', 'failure').
-        start_time (float): The start time of the transaction processing.
+        start_time (float): The start time of the transaction processing, from time.monotonic().
     """
-    if METRICS_ENABLED:
-        latency = time.time() - start_time
-        transaction_latency_seconds.labels(status=status).observe(latency) # Kept existing, review if covered by new ones
+    latency = time.monotonic() - start_time
+    transaction_latency_seconds.labels(status=status).observe(latency) # Kept existing, review if covered by new ones
 
 # Updated to match new label requirements
 def record_network_switch(from_network: str, to_network: str, status: str):
@@ -185,8 +276,21 @@ def record_network_switch(from_network: str, to_network: str, status: str):
         to_network (str): The network switched to.
         status (str): The status of the switch.
     """
-    if METRICS_ENABLED:
-        metamask_network_switches_total.labels(from_network=from_network, to_network=to_network, status=status).inc()
+    metamask_network_switches_total.labels(from_network=from_network, to_network=to_network, status=status).inc()
+
+# API label sets are bounded (endpoints x methods x status codes), so the resolved
+# children are cached instead of going through .labels() on every request
+@lru_cache(maxsize=512)
+def _api_request_child(endpoint: str, method: str, status_code: int):
+    return metamask_api_requests_total.labels(endpoint=endpoint, method=method, status_code=status_code)
+
+@lru_cache(maxsize=512)
+def _api_duration_child(endpoint: str, method: str, status_code: int):
+    return metamask_api_request_duration_seconds.labels(endpoint=endpoint, method=method, status_code=status_code)
+
+@lru_cache(maxsize=512)
+def _api_failure_child(endpoint: str, method: str, status_code: int):
+    return metamask_api_requests_failed_total.labels(endpoint=endpoint, method=method, status_code=status_code)
 
 def record_api_request(endpoint: str, method: str, status_code: int, duration: float):
     """
@@ -198,11 +302,10 @@ def record_api_request(endpoint: str, method: str, status_code: int, duration: f
         status_code (int): The HTTP status code returned.
         duration (float): The duration of the API request in seconds.
     """
-    if METRICS_ENABLED:
-        metamask_api_requests_total.labels(endpoint=endpoint, method=method, status_code=status_code).inc()
-        metamask_api_request_duration_seconds.labels(endpoint=endpoint, method=method, status_code=status_code).observe(duration)
-        if status_code >= 400: # Assuming 4xx and 5xx are failures
-            metamask_api_requests_failed_total.labels(endpoint=endpoint, method=method, status_code=status_code).inc()
+    _api_request_child(endpoint, method, status_code).inc()
+    _api_duration_child(endpoint, method, status_code).observe(duration)
+    if status_code >= 400: # Assuming 4xx and 5xx are failures
+        _api_failure_child(endpoint, method, status_code).inc()
 
 def record_browser_operation(operation: str, status: str, duration: Optional[float] = None):
     """
@@ -213,10 +316,9 @@ def record_browser_operation(operation: str, status: str, duration: Optional[flo
         status (str): The status of the operation (e.g., 'success', 'failure').
         duration (float, optional): The duration of the browser operation in seconds.
     """
-    if METRICS_ENABLED:
-        browser_operations_total.labels(operation=operation, status=status).inc() # Kept existing, review
-        if duration is not None:
-            metamask_browser_automation_duration_seconds.labels(task_type=operation).observe(duration)
+    browser_operations_total.labels(operation=operation, status=status).inc() # Kept existing, review
+    if duration is not None:
+        metamask_browser_automation_duration_seconds.labels(task_type=operation).observe(duration)
 
 def record_validation_check(check_type: str, result: str):
     """
@@ -226,64 +328,61 @@ def record_validation_check(check_type: str, result: str):
         check_type (str): The type of validation check (e.g., 'transaction', 'address').
         result (str): The result of the check (e.g., 'valid', 'invalid').
     """
-    if METRICS_ENABLED:
-        validation_checks_total.labels(type=check_type, result=result).inc() # Kept existing, review
+    validation_checks_total.labels(type=check_type, result=result).inc() # Kept existing, review
 
 # --- New recording functions for added metrics ---
 
 def record_auth_failure():
-    if METRICS_ENABLED:
-        metamask_auth_failures_total.inc()
+    metamask_auth_failures_total.inc()
 
 def record_suspicious_transaction():
-    if METRICS_ENABLED:
-        metamask_suspicious_transactions_detected_total.inc()
+    metamask_suspicious_transactions_detected_total.inc()
 
 def record_rpc_connection_error():
-    if METRICS_ENABLED:
-        metamask_rpc_connection_errors_total.inc()
+    metamask_rpc_connection_errors_total.inc()
 
 def record_browser_automation_security_event(event_type: str):
-    if METRICS_ENABLED:
-        metamask_browser_automation_security_events_total.labels(event_type=event_type).inc()
+    metamask_browser_automation_security_events_total.labels(event_type=event_type).inc()
 
 def record_db_query_duration(query_type: str, table: str, duration: float):
-    if METRICS_ENABLED:
-        metamask_db_query_duration_seconds.labels(query_type=query_type, table=table).observe(duration)
+    metamask_db_query_duration_seconds.labels(query_type=query_type, table=table).observe(duration)
 
 def record_kafka_message_processing(topic: str, consumer_group: str, status: str, duration: float):
-    if METRICS_ENABLED:
-        metamask_kafka_messages_processed_total.labels(topic=topic, consumer_group=consumer_group, status=status).inc()
-        metamask_kafka_message_processing_duration_seconds.labels(topic=topic, consumer_group=consumer_group).observe(duration)
+    metamask_kafka_messages_processed_total.labels(topic=topic, consumer_group=consumer_group, status=status).inc()
+    metamask_kafka_message_processing_duration_seconds.labels(topic=topic, consumer_group=consumer_group).observe(duration)
 
 def record_wallet_connection_success():
-    if METRICS_ENABLED:
-        metamask_wallet_connection_successful_total.inc()
+    metamask_wallet_connection_successful_total.inc()
 
 def record_wallet_connection_failure(reason: str):
-    if METRICS_ENABLED:
-        metamask_wallet_connection_failed_total.labels(reason=reason).inc()
+    metamask_wallet_connection_failed_total.labels(reason=reason).inc()
 
 def record_transaction_completed():
-    if METRICS_ENABLED:
-        metamask_transaction_completed_total.inc()
+    metamask_transaction_completed_total.inc()
 
 def record_transaction_failed(reason: str):
-    if METRICS_ENABLED:
-        metamask_transaction_failed_total.labels(reason=reason).inc()
+    metamask_transaction_failed_total.labels(reason=reason).inc()
 
 def set_active_user_sessions(count: int):
-    if METRICS_ENABLED:
-        metamask_user_sessions_active.set(count)
+    metamask_user_sessions_active.set(count)
 
 def record_user_session_duration(duration: float):
-    if METRICS_ENABLED:
-        metamask_user_session_duration_seconds.observe(duration)
+    metamask_user_session_duration_seconds.observe(duration)
 
 def set_dependency_health(dependency_name: str, status: str): # status could be 'up', 'down', 'degraded'
-    if METRICS_ENABLED:
-        # Convert status to a numerical value for Gauge if needed, or use info metrics
-        # For simplicity, let's assume status is directly usable or mapped elsewhere
-        # Example: 1 for up, 0 for down
-        health_value = 1 if status.lower() == 'up' else 0 # Basic example
-        metamask_dependency_health.labels(dependency_name=dependency_name, status=status).set(health_value)
\ No newline at end of file
+    # Convert status to a numerical value for Gauge if needed, or use info metrics
+    # For simplicity, let's assume status is directly usable or mapped elsewhere
+    # Example: 1 for up, 0 for down
+    health_value = 1 if status.lower() == 'up' else 0 # Basic example
+    metamask_dependency_health.labels(dependency_name=dependency_name, status=status).set(health_value)
+
+# When collection is disabled, every recorder is rebound to a no-op so call sites
+# pay for a single function call instead of a flag check and label resolution
+if not METRICS_ENABLED:
+    def _noop(*args, **kwargs):
+        pass
+
+    # Derived rather than listed so recorders added later cannot be missed
+    for _name, _value in list(globals().items()):
+        if callable(_value) and _name.startswith(("record_", "set_")):
+            globals()[_name] = _noop
@@ -6,12 +6,14 @@ connection monitoring, anomaly detection, and secure network configuration.
 Integrates with SecurityManager and Validator for comprehensive security.
 """
 
+import asyncio
+import hashlib
 import ssl
 import socket
 import logging
 import threading
 import time
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from urllib.parse import urlparse
 
 from .security_manager import SecurityManager, SecurityViolationError, SuspiciousActivityError
@@ -20,6 +22,13 @@ from .security_manager import SecurityManager, SecurityViolationError, Suspiciou
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful TLS validation is trusted before the handshake is repeated
+TLS_VALIDATION_TTL = 3600
+# Seconds allowed for a health probe's TCP connect and TLS handshake
+PROBE_TIMEOUT = 5
+# TLS 1.2 suites offered to RPC endpoints: forward-secret AEAD only (TLS 1.3 suites are unaffected)
+TLS_CIPHERS = "ECDHE+AESGCM:ECDHE+CHACHA20"
+
 
 class NetworkManagerError(Exception):
     """Base exception for network manager errors."""
@@ -58,9 +67,27 @@ class NetworkManager:
         self.validator = validator
         self.trusted_networks = trusted_networks or []
         self.trusted_rpc_urls = {n["rpc_url"] for n in self.trusted_networks if "rpc_url" in n}
+        self._networks_by_id: Dict[str, Dict] = {n["id"]: n for n in self.trusted_networks if "id" in n}
+        # Immutable view handed out by get_trusted_networks, rebuilt only when the list changes
+        self._networks_snapshot: Tuple[Dict, ...] = tuple(self.trusted_networks)
+        # SecurityManager limits under which the constant switch-time activity check last passed
+        self._switch_check_passed_for: Optional[Tuple] = None
+        # rpc_url -> (scheme, hostname, port), parsed once per URL
+        self._url_parts: Dict[str, Tuple[str, str, int]] = {}
+        for url in self.trusted_rpc_urls:
+            self._parse_rpc_url(url)
         self.active_network = None
-        self.connection_monitors = {}
+        # rpc_url -> anomaly callback, all probed by a single asyncio monitor task
+        self.connection_monitors: Dict[str, Optional[Callable]] = {}
+        self._monitor_task: Optional[asyncio.Task] = None
         self.monitor_interval = 30  # seconds
+        # (hostname, port) -> (sha256 of DER certificate, cert notAfter epoch, validated_at monotonic)
+        self._tls_cache: Dict[Tuple[str, int], Tuple[bytes, float, float]] = {}
+        self._tls_cache_lock = threading.Lock()
+        # One context for every handshake so the CA bundle is loaded only once
+        self._ssl_ctx = ssl.create_default_context()
+        self._ssl_ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+        self._ssl_ctx.set_ciphers(TLS_CIPHERS)
 
     def add_trusted_network(self, network: Dict):
         """Add a network to the trusted whitelist after validation."""
@@ -68,51 +95,84 @@ class NetworkManager:
         if "rpc_url" not in network:
             raise ValueError("Network must include 'rpc_url'")
         self.trusted_networks.append(network)
+        self._networks_snapshot = tuple(self.trusted_networks)
         self.trusted_rpc_urls.add(network["rpc_url"])
+        self._parse_rpc_url(network["rpc_url"])
+        if "id" in network:
+            self._networks_by_id[network["id"]] = network
         logger.info(f"Trusted network added: {network.get('name', network['rpc_url'])}")
 
     def is_trusted_network(self, rpc_url: str) -> bool:
         """Check if the given RPC URL is in the trusted whitelist."""
         return rpc_url in self.trusted_rpc_urls
 
+    def _parse_rpc_url(self, rpc_url: str) -> Tuple[str, str, int]:
+        """Return (scheme, hostname, port) for an RPC URL, memoized per URL."""
+        parts = self._url_parts.get(rpc_url)
+        if parts is None:
+            parsed = urlparse(rpc_url)
+            parts = (parsed.scheme, parsed.hostname, parsed.port or 443)
+            self._url_parts[rpc_url] = parts
+        return parts
+
     def validate_rpc_endpoint(self, rpc_url: str) -> bool:
         """
         Validate the RPC endpoint:
         - Must be in trusted whitelist
-        - Must use HTTPS (TLS)
+        - Must use HTTPS or secure WebSocket (TLS)
         - Must pass SSL certificate validation
         """
         if not self.is_trusted_network(rpc_url):
             logger.warning(f"RPC endpoint not in trusted whitelist: {rpc_url}")
             raise RPCValidationError("RPC endpoint not trusted")
 
-        parsed = urlparse(rpc_url)
-        if parsed.scheme != "https":
+        scheme, hostname, port = self._parse_rpc_url(rpc_url)
+        if scheme not in ("https", "wss"):
             logger.warning(f"RPC endpoint does not use HTTPS: {rpc_url}")
             raise RPCValidationError("RPC endpoint must use HTTPS")
 
-        # TLS/SSL certificate validation
+        # TLS/SSL certificate validation, skipped while a recent result for the host is fresh
+        key = (hostname, port)
+        with self._tls_cache_lock:
+            cached = self._tls_cache.get(key)
+        if cached is not None:
+            _, not_after, validated_at = cached
+            if time.monotonic() - validated_at < TLS_VALIDATION_TTL and not_after > time.time():
+                return True
+
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((parsed.hostname, parsed.port or 443), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=parsed.hostname) as ssock:
+            with socket.create_connection(key, timeout=5) as sock:
+                with self._ssl_ctx.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert = ssock.getpeercert()
                     if not cert:
                         raise RPCValidationError("No SSL certificate presented by endpoint")
+                    self._record_tls_success(key, cert, ssock.getpeercert(binary_form=True))
         except Exception as e:
+            self._record_tls_failure(key)
             logger.error(f"TLS validation failed for {rpc_url}: {e}")
             raise RPCValidationError(f"TLS validation failed: {e}")
 
         logger.info(f"RPC endpoint validated: {rpc_url}")
         return True
 
+    def _record_tls_success(self, key: Tuple[str, int], cert: Dict, der: bytes) -> None:
+        """Cache a successful TLS validation for (hostname, port)."""
+        entry = (hashlib.sha256(der).digest(), ssl.cert_time_to_seconds(cert["notAfter"]), time.monotonic())
+        with self._tls_cache_lock:
+            self._tls_cache[key] = entry
+
+    def _record_tls_failure(self, key: Tuple[str, int]) -> None:
+        """Forget any cached TLS validation for (hostname, port)."""
+        with self._tls_cache_lock:
+            self._tls_cache.pop(key, None)
+
     def switch_network(self, network_id: str) -> Dict:
         """
         Securely switch to a new network after validation and security checks.
         :param network_id: The identifier of the network to switch to.
         :return: The new active network dict.
         """
-        network = next((n for n in self.trusted_networks if n.get("id") == network_id), None)
+        network = self._networks_by_id.get(network_id)
         if not network:
             logger.warning(f"Attempted to switch to unknown network: {network_id}")
             raise NetworkSwitchError("Network not found in trusted list")
@@ -120,7 +180,7 @@ class NetworkManager:
         try:
             self.validate_rpc_endpoint(network["rpc_url"])
             # SecurityManager can be used for additional checks (e.g., suspicious activity)
-            self.security_manager.detect_suspicious_activity("system", {"value": 0})
+            self._check_switch_activity()
         except (RPCValidationError, SuspiciousActivityError) as e:
             logger.error(f"Network switch blocked: {e}")
             raise NetworkSwitchError(str(e))
@@ -129,6 +189,22 @@ class NetworkManager:
         logger.info(f"Switched to network: {network.get('name', network_id)}")
         return network
 
+    def _check_switch_activity(self):
+        """
+        Run the suspicious-activity check for a network switch.
+        Its payload is constant, so the outcome depends only on the SecurityManager's limits;
+        a pass is remembered until those limits change.
+        """
+        limits = (
+            getattr(self.security_manager, "max_transaction_rate", None),
+            getattr(self.security_manager, "max_transaction_value", None),
+            getattr(self.security_manager, "rate_limit_window", None),
+        )
+        if limits == self._switch_check_passed_for:
+            return
+        self.security_manager.detect_suspicious_activity("system", {"value": 0})
+        self._switch_check_passed_for = limits
+
     def get_active_network(self) -> Optional[Dict]:
         """Return the currently active network."""
         return self.active_network
@@ -136,6 +212,8 @@ class NetworkManager:
     def monitor_rpc_health(self, rpc_url: str, callback: Optional[Callable] = None):
         """
         Start monitoring the health of an RPC endpoint.
+        All monitored endpoints are probed concurrently by one asyncio task, so this must be
+        called from within a running event loop.
         :param rpc_url: The RPC endpoint to monitor.
         :param callback: Optional callback to invoke on anomaly detection.
         """
@@ -143,42 +221,76 @@ class NetworkManager:
             logger.info(f"Already monitoring {rpc_url}")
             return
 
-        def monitor():
-            while True:
-                try:
-                    self.validate_rpc_endpoint(rpc_url)
-                    # Optionally, perform a lightweight JSON-RPC call here for deeper health check
-                    logger.debug(f"RPC health OK: {rpc_url}")
-                except Exception as e:
-                    logger.warning(f"RPC health anomaly detected: {rpc_url} - {e}")
-                    if callback:
-                        callback(rpc_url, e)
-                time.sleep(self.monitor_interval)
-
-        t = threading.Thread(target=monitor, daemon=True)
-        self.connection_monitors[rpc_url] = t
-        t.start()
+        self.connection_monitors[rpc_url] = callback
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.get_running_loop().create_task(self._monitor_loop())
         logger.info(f"Started monitoring RPC health: {rpc_url}")
 
+    async def _monitor_loop(self):
+        """Probe every monitored endpoint concurrently, then sleep for monitor_interval."""
+        while self.connection_monitors:
+            urls = list(self.connection_monitors)
+            await asyncio.gather(*(self._probe(url) for url in urls), return_exceptions=True)
+            await asyncio.sleep(self.monitor_interval)
+
+    async def _probe(self, rpc_url: str):
+        """
+        Health-check one endpoint with a fresh TLS handshake on the event loop.
+        Bypasses the TLS validation cache and refreshes it with the outcome.
+        """
+        try:
+            if not self.is_trusted_network(rpc_url):
+                raise RPCValidationError("RPC endpoint not trusted")
+            scheme, hostname, port = self._parse_rpc_url(rpc_url)
+            if scheme not in ("https", "wss"):
+                raise RPCValidationError("RPC endpoint must use HTTPS")
+            key = (hostname, port)
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(*key, ssl=self._ssl_ctx, server_hostname=hostname),
+                    timeout=PROBE_TIMEOUT,
+                )
+            except Exception as e:
+                self._record_tls_failure(key)
+                raise RPCValidationError(f"TLS validation failed: {e}")
+            try:
+                ssl_object = writer.get_extra_info("ssl_object")
+                cert = ssl_object.getpeercert() if ssl_object else None
+                if not cert:
+                    self._record_tls_failure(key)
+                    raise RPCValidationError("No SSL certificate presented by endpoint")
+                self._record_tls_success(key, cert, ssl_object.getpeercert(binary_form=True))
+            finally:
+                writer.close()
+            # Optionally, perform a lightweight JSON-RPC call here for deeper health check
+            logger.debug(f"RPC health OK: {rpc_url}")
+        except Exception as e:
+            logger.warning(f"RPC health anomaly detected: {rpc_url} - {e}")
+            callback = self.connection_monitors.get(rpc_url)
+            if callback:
+                callback(rpc_url, e)
+
     def stop_monitoring(self, rpc_url: str):
-        """Stop monitoring the given RPC endpoint."""
-        # For simplicity, this just removes the monitor; thread will exit on next check.
+        """Stop monitoring the given RPC endpoint, cancelling the monitor task when none remain."""
         if rpc_url in self.connection_monitors:
             del self.connection_monitors[rpc_url]
             logger.info(f"Stopped monitoring RPC health: {rpc_url}")
+        if not self.connection_monitors and self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
 
-    def get_trusted_networks(self) -> List[Dict]:
-        """Return the list of trusted networks."""
-        return list(self.trusted_networks)
+    def get_trusted_networks(self) -> Tuple[Dict, ...]:
+        """Return the trusted networks as a shared, read-only snapshot."""
+        return self._networks_snapshot
 
     def update_network_config(self, network_id: str, updates: Dict):
         """Securely update network configuration."""
-        for n in self.trusted_networks:
-            if n.get("id") == network_id:
-                n.update(updates)
-                logger.info(f"Updated network config for {network_id}: {updates}")
-                return n
-        raise NetworkManagerError("Network not found for update")
+        n = self._networks_by_id.get(network_id)
+        if n is None:
+            raise NetworkManagerError("Network not found for update")
+        n.update(updates)
+        logger.info(f"Updated network config for {network_id}: {updates}")
+        return n
 
     def alert_on_anomaly(self, rpc_url: str, error: Exception):
         """Default anomaly alert handler."""
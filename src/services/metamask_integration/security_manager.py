@@ -1,13 +1,58 @@
-from typing import Dict, List, Optional, Any, Union
-from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Any, Union
+from array import array
+from collections import OrderedDict, defaultdict, deque
+import bisect
+import hashlib
+import heapq
 import time
 import re
 import html
 import logging
 import uuid
+from urllib.parse import SplitResult, urlsplit
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
 
 logger = logging.getLogger(__name__)
 
+# Rate-limit checks between sweeps that drop users with no requests left in the window
+RATE_LIMIT_SWEEP_INTERVAL = 1024
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+# Initial sizing and false-positive rate of the known-phishing-domain Bloom prefilter
+PHISHING_BLOOM_CAPACITY = 100_000
+PHISHING_BLOOM_ERROR_RATE = 1e-4
+# Everything sanitize_input strips, matched in one pass: script elements and inline event
+# handler attributes (case-insensitive), then common SQL injection fragments (case-sensitive)
+_SANITIZE_RE = re.compile(
+    r'(?i:<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>)'
+    r'|(?i:\bon\w+\s*=\s*[\'"][^\'"]*[\'"])'
+    r'|(?i:\bon\w+\s*=\s*[^>\s]*)'
+    r'|' + '|'.join(map(re.escape, ["DROP TABLE", "SELECT *", "INSERT INTO", "DELETE FROM", "UPDATE ", ";--"]))
+)
+
+# Known-malicious calldata marker, matched case-insensitively without lowercasing a copy of the data
+_MALICIOUS_DATA_RE = re.compile('deadbeef', re.IGNORECASE)
+
+# Longest gasPrice string parsed: a 0x-prefixed uint256; longer inputs are rejected unparsed
+MAX_GAS_PRICE_CHARS = 66
+# Recently verified transactions remembered so identical retries skip re-validation
+VERIFIED_TX_CACHE_SIZE = 8192
+# Session validations between sweeps that purge expired sessions
+SESSION_SWEEP_INTERVAL = 100
+
+# Seconds a failed signature verification is remembered before the signature may be retried
+INVALID_SIGNATURE_TTL = 60
+# Seconds a signed message stays acceptable; used signatures are remembered for this long
+SIGNATURE_REPLAY_WINDOW = 300
+# Seconds a signed message's timestamp may run ahead of our clock
+SIGNATURE_CLOCK_SKEW = 30
+
 # Custom exceptions for security violations
 class SecurityViolationError(Exception):
     """Raised when a security policy is violated."""
@@ -29,6 +74,10 @@ class SuspiciousActivityError(Exception):
     """Raised when suspicious activity is detected."""
     pass
 
+def _domain_key(domain: str) -> int:
+    """64-bit digest of a normalized domain; collisions are negligible below billions of entries."""
+    return int.from_bytes(hashlib.blake2b(domain.encode('utf-8'), digest_size=8).digest(), 'big')
+
 class PhishingDetector:
     """Detect potential phishing attempts based on URL patterns and content analysis."""
     
@@ -37,26 +86,90 @@ class PhishingDetector:
             r'login', r'signin', r'password', r'wallet',
             r'private[-_]?key', r'recovery[-_]?phrase', r'verify[-_]?account'
         ]
-        self.known_phishing_domains = set()
+        # Literal substrings that mark a URL as suspicious on their own
+        self.url_keywords = ['fake', 'security-update']
+        self.suspicious_keywords = ['urgent', 'account suspended', 'verify now', 'login required']
+        # Known phishing domains, stored as a sorted array of 64-bit digests (8 bytes per domain
+        # instead of a str object plus hash-table slot), behind an optional Bloom prefilter
+        self._domain_keys = array('Q')
+        self._domain_bloom = None
+        self._keyword_re = re.compile('|'.join(map(re.escape, self.suspicious_keywords)), re.IGNORECASE)
+        self._build_url_matchers()
+    
+    def _build_url_matchers(self) -> None:
+        """Compile URL patterns and keywords into at most one automaton and one regex.
+        
+        Plain-word entries go into an Aho-Corasick automaton (one pass over the URL whatever
+        the number of words) when pyahocorasick is installed; genuine regex entries, and every
+        entry when it is not, are compiled into a single case-insensitive alternation.
+        """
+        literals = [p for p in self.suspicious_patterns if re.escape(p) == p] + self.url_keywords
+        regexes = [p for p in self.suspicious_patterns if re.escape(p) != p]
+        self._url_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for word in literals:
+                automaton.add_word(word.lower(), word)
+            automaton.make_automaton()
+            self._url_automaton = automaton
+        else:
+            regexes += [re.escape(word) for word in literals]
+        self._suspicious_re = re.compile('|'.join(regexes), re.IGNORECASE) if regexes else None
         
     def is_suspicious(self, url: str) -> bool:
         """Check if a URL contains suspicious patterns indicative of phishing."""
-        url_lower = url.lower()
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, url_lower):
-                logger.warning(f"Suspicious URL pattern detected: {pattern} in {url}")
-                return True
+        hit = None
+        if self._url_automaton is not None:
+            hit = next((word for _, word in self._url_automaton.iter(url.lower())), None)
+        if hit is None and self._suspicious_re is not None:
+            match = self._suspicious_re.search(url)
+            hit = match.group(0) if match is not None else None
+        if hit is not None:
+            logger.warning(f"Suspicious URL pattern detected: {hit} in {url}")
+            return True
         return False
     
     def analyze_content(self, content: str) -> bool:
         """Analyze page content for phishing indicators."""
-        content_lower = content.lower()
-        suspicious_keywords = ['urgent', 'account suspended', 'verify now', 'login required']
-        return any(keyword in content_lower for keyword in suspicious_keywords)
+        return self._keyword_re.search(content) is not None
+    
+    def is_known_phishing_host(self, host: Optional[str]) -> bool:
+        """Check a hostname and each of its parent domains against the known phishing domains."""
+        if not host or not self._domain_keys:
+            return False
+        host = host.lower().rstrip('.')
+        while True:
+            if self._is_known_domain(host):
+                return True
+            dot = host.find('.')
+            if dot == -1:
+                return False
+            host = host[dot + 1:]
     
-    def update_phishing_domains(self, domains: List[str]) -> None:
+    def _is_known_domain(self, domain: str) -> bool:
+        """Exact membership test: Bloom prefilter when available, confirmed by bisecting the digests."""
+        if self._domain_bloom is not None and domain not in self._domain_bloom:
+            return False
+        key = _domain_key(domain)
+        i = bisect.bisect_left(self._domain_keys, key)
+        return i < len(self._domain_keys) and self._domain_keys[i] == key
+    
+    def update_phishing_domains(self, domains: Iterable[str]) -> None:
         """Update the set of known phishing domains."""
-        self.known_phishing_domains.update(domains)
+        normalized = [domain.lower().rstrip('.') for domain in domains]
+        self._domain_keys = array('Q', sorted(set(self._domain_keys).union(map(_domain_key, normalized))))
+        if ScalableBloomFilter is not None:
+            if self._domain_bloom is None:
+                self._domain_bloom = ScalableBloomFilter(
+                    initial_capacity=PHISHING_BLOOM_CAPACITY, error_rate=PHISHING_BLOOM_ERROR_RATE
+                )
+            for domain in normalized:
+                self._domain_bloom.add(domain)
+    
+    @property
+    def known_phishing_domain_count(self) -> int:
+        """Number of distinct known phishing domains."""
+        return len(self._domain_keys)
 
 class SecurityManager:
     """Manage security aspects of MetaMask integration including transaction validation and rate limiting."""
@@ -70,11 +183,17 @@ class SecurityManager:
         self.phishing_check_enabled = self.config.get('phishing_check_enabled', True)
         
         # Internal state for rate limiting
-        self.transaction_timestamps: Dict[str, List[float]] = defaultdict(list)
+        # check_rate_limit never appends past max_transaction_rate, so each deque stays bounded;
+        # no fixed maxlen, so changing the rate at runtime applies to existing users too
+        self.transaction_timestamps: Dict[str, deque] = defaultdict(deque)
         self.rate_limit_window = 60  # 1 minute window
+        self._rate_limit_checks = 0
         
         # Session management
         self.sessions: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (expiry, token); entries may be stale and are re-checked when popped
+        self._session_expiry_heap: List[tuple] = []
+        self._session_validations = 0
         
         # Failed attempts tracking
         self.failed_attempts: Dict[str, int] = defaultdict(int)
@@ -88,8 +207,19 @@ class SecurityManager:
         # Maximum allowed gas price (500 gwei)
         self.max_gas_price = 500 * 10**9
         
-        # Signature cache for replay attack prevention
-        self.signature_cache = {}
+        # Signature cache for replay attack prevention: signature -> time its entry may be purged.
+        # Every entry expires within the replay window (plus clock skew). When the cache is full,
+        # expired entries go first, then the oldest signatures whose messages carried no timestamp.
+        self.signature_cache: Dict[str, float] = {}
+        # Cached signatures without a message timestamp, oldest first
+        self._untimed_signatures: Dict[str, None] = {}
+        self.max_sig_cache_entries = self.config.get('max_sig_cache_entries', 50_000)
+        self.signature_replay_window = self.config.get('signature_replay_window', SIGNATURE_REPLAY_WINDOW)
+        # Transactions that passed verify_transaction, keyed by their checked fields and limits (LRU)
+        self._verified_tx: "OrderedDict[tuple, bool]" = OrderedDict()
+        
+        # Short-lived negative cache: signature -> time it failed verification
+        self._invalid_signatures: Dict[str, float] = {}
         
     def validate_address(self, address: str) -> bool:
         """Validate an Ethereum address format and checksum."""
@@ -97,12 +227,13 @@ class SecurityManager:
             return False
             
         # Check basic format (0x + 40 hexadecimal characters)
-        if not re.match(r'^0x[0-9a-fA-F]{40}$', address):
+        body = address[2:]
+        if len(address) != 42 or not address.startswith('0x') or not _HEX_CHARS.issuperset(body):
             logger.warning(f"Invalid address format: {address}")
             return False
             
         # Check for checksum (mixed case indicates checksummed address)
-        if address == address.lower() or address == address.upper():
+        if body == body.lower():
             logger.warning(f"Invalid checksum in address: {address}")
             return False
             
@@ -110,16 +241,38 @@ class SecurityManager:
         
     def verify_transaction(self, transaction: Dict[str, Any]) -> bool:
         """Verify the security of a transaction before signing or sending."""
+        key = self._verified_tx_key(transaction)
+        if key is not None and key in self._verified_tx:
+            self._verified_tx.move_to_end(key)
+            return True
         try:
             self._validate_transaction_address(transaction)
             self._validate_transaction_value(transaction)
             self._validate_gas_price(transaction)
             self._check_malicious_data(transaction)
+            if key is not None:
+                self._verified_tx[key] = True
+                if len(self._verified_tx) > VERIFIED_TX_CACHE_SIZE:
+                    self._verified_tx.popitem(last=False)
             return True
         except (ValueError, TypeError) as e:
             logger.error(f"Transaction verification error: {str(e)}")
             raise SecurityViolationError(f"Transaction verification error: {str(e)}")
     
+    def _verified_tx_key(self, transaction: Dict[str, Any]) -> Optional[tuple]:
+        """Cache key for a transaction: every field verify_transaction inspects plus the limits
+        it checks against, so changing a limit naturally misses the cache. None if unhashable."""
+        key = (
+            transaction.get('to', ''), transaction.get('value', 0), transaction.get('gasPrice', '0'),
+            transaction.get('data', '0x'), self.max_transaction_value, self.max_gas_price,
+            self.phishing_check_enabled,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def _validate_transaction_address(self, transaction: Dict[str, Any]) -> None:
         """Validate the recipient address in a transaction."""
         to_address = transaction.get('to', '')
@@ -158,37 +311,47 @@ class SecurityManager:
     
     def _parse_gas_price(self, gas_price_str: Any) -> int:
         """Parse gas price from various formats."""
-        if isinstance(gas_price_str, str) and gas_price_str.startswith('0x'):
-            return int(gas_price_str, 16)
-        elif isinstance(gas_price_str, str):
-            return int(gas_price_str)
-        else:
+        if not isinstance(gas_price_str, str):
             return gas_price_str
+        if len(gas_price_str) > MAX_GAS_PRICE_CHARS:
+            raise ValueError("gasPrice too long")
+        # Explicit base rather than int(s, 0), which rejects zero-padded decimals
+        return int(gas_price_str, 16 if gas_price_str.startswith('0x') else 10)
     
     def _check_malicious_data(self, transaction: Dict[str, Any]) -> None:
         """Check for malicious data in transaction."""
         data = transaction.get('data', '0x')
-        if data != '0x' and 'deadbeef' in data.lower():
+        if data != '0x' and _MALICIOUS_DATA_RE.search(data):
             logger.warning(f"Malicious data detected in transaction: {data}")
             raise SecurityViolationError("Potentially malicious transaction data")
     
     def check_rate_limit(self, user_id: str) -> bool:
         """Check if a user has exceeded their transaction rate limit."""
         current_time = time.time()
-        self.transaction_timestamps[user_id].append(current_time)
+        cutoff = current_time - self.rate_limit_window
+        self._rate_limit_checks += 1
+        if self._rate_limit_checks % RATE_LIMIT_SWEEP_INTERVAL == 0:
+            self._sweep_rate_limits(cutoff)
         
-        # Remove timestamps outside the rate limit window
-        self.transaction_timestamps[user_id] = [
-            ts for ts in self.transaction_timestamps[user_id]
-            if current_time - ts < self.rate_limit_window
-        ]
+        # Sliding window: timestamps are appended in order, so expired ones sit at the left
+        timestamps = self.transaction_timestamps[user_id]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
         
-        if len(self.transaction_timestamps[user_id]) > self.max_transaction_rate:
+        if len(timestamps) >= self.max_transaction_rate:
             logger.warning(f"Rate limit exceeded for user {user_id}")
             raise RateLimitExceededError(f"Rate limit exceeded for user {user_id}")
-            
+        
+        timestamps.append(current_time)
         return True
     
+    def _sweep_rate_limits(self, cutoff: float) -> None:
+        """Drop rate-limit state for users whose most recent transaction is outside the window."""
+        stale = [user for user, timestamps in self.transaction_timestamps.items()
+                 if not timestamps or timestamps[-1] <= cutoff]
+        for user in stale:
+            del self.transaction_timestamps[user]
+    
     def validate_session(self, session_token: str) -> bool:
         """Validate a session token and check for expiration."""
         if not session_token:
@@ -201,20 +364,53 @@ class SecurityManager:
             raise InvalidSessionError(f"Invalid session token: {session_token}")
             
         current_time = time.time()
-        if current_time - session.get('last_activity', 0) > self.session_timeout:
+        self._session_validations += 1
+        if self._session_validations % SESSION_SWEEP_INTERVAL == 0:
+            self._purge_expired_sessions(current_time)
+        
+        idle = current_time - session.get('last_activity', 0)
+        if idle > self.session_timeout:
             logger.warning(f"Session expired for token: {session_token}")
-            del self.sessions[session_token]
+            self.sessions.pop(session_token, None)
             raise InvalidSessionError(f"Session expired for token: {session_token}")
-            
-        session['last_activity'] = current_time
+        
+        # Only refresh activity once a quarter of the timeout has passed, so bursts of
+        # requests on one session do not each write to it
+        if idle > self.session_timeout / 4:
+            session['last_activity'] = current_time
         return True
     
-    def check_phishing(self, url: str) -> bool:
-        """Check if a URL is potentially a phishing attempt."""
+    def _purge_expired_sessions(self, current_time: float) -> None:
+        """Remove sessions idle past the timeout, popping the expiry heap in order."""
+        heap = self._session_expiry_heap
+        while heap and heap[0][0] < current_time:
+            _, token = heapq.heappop(heap)
+            session = self.sessions.get(token)
+            if session is None:
+                continue
+            expiry = session.get('last_activity', 0) + self.session_timeout
+            if expiry < current_time:
+                del self.sessions[token]
+            else:
+                # Activity since this entry was pushed extended the session
+                heapq.heappush(heap, (expiry, token))
+    
+    def check_phishing(self, url: str, parsed: Optional[SplitResult] = None) -> bool:
+        """Check if a URL is potentially a phishing attempt.
+        
+        Args:
+            url: The URL to check.
+            parsed: Optional pre-parsed form of ``url`` to avoid parsing it again.
+        """
         if not self.phishing_check_enabled:
             return True
             
-        if self.phishing_detector.is_suspicious(url) or 'fake' in url.lower() or 'security-update' in url.lower():
+        host = (parsed if parsed is not None else urlsplit(url)).hostname
+        if self.phishing_detector.is_known_phishing_host(host):
+            logger.warning(f"Known phishing domain detected: {url}")
+            raise PhishingDetectedError(f"Phishing site detected: {url}")
+            
+        if self.phishing_detector.is_suspicious(url):
             logger.warning(f"Potential phishing URL detected: {url}")
             raise PhishingDetectedError(f"Phishing site detected: {url}")
             
@@ -222,24 +418,9 @@ class SecurityManager:
     
     def sanitize_input(self, input_data: str) -> str:
         """Sanitize input data to prevent XSS and injection attacks."""
-        # Escape HTML characters to prevent XSS
-        sanitized = html.escape(input_data)
-        
-        # Additional sanitization rules can be added here
-        # Remove any script tags or dangerous attributes
-        sanitized = re.sub(r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>', '', sanitized, flags=re.IGNORECASE)
-        # Remove all 'on' event attributes (like onerror, onclick, etc.)
-        sanitized = re.sub(r'\bon\w+\s*=\s*[\'"][^\'"]*[\'"]', '', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'\bon\w+\s*=\s*[^>\s]*', '', sanitized, flags=re.IGNORECASE)
-        
-        # Remove common SQL injection patterns
-        malicious_patterns = [
-            "DROP TABLE", "SELECT *", "INSERT INTO", "DELETE FROM", "UPDATE ", ";--"
-        ]
-        for pattern in malicious_patterns:
-            sanitized = sanitized.replace(pattern, "")
-            
-        return sanitized
+        # Escape HTML characters to prevent XSS, then strip script tags, 'on' event
+        # attributes (like onerror, onclick, etc.) and SQL injection patterns
+        return _SANITIZE_RE.sub('', html.escape(input_data))
     
     def track_failed_attempt(self, user_id: str) -> bool:
         """Record a failed security check or login attempt.
@@ -273,6 +454,7 @@ class SecurityManager:
             'user_id': user_id,
             'last_activity': current_time
         }
+        heapq.heappush(self._session_expiry_heap, (current_time + self.session_timeout, session_token))
         logger.info(f"New session created for user {user_id}")
         return session_token
     
@@ -301,17 +483,17 @@ class SecurityManager:
         if isinstance(transactions, dict):
             transactions = [transactions]
         
-        recent_transactions = [t for t in transactions if current_time - t.get('timestamp', 0) < self.rate_limit_window]
+        cutoff = current_time - self.rate_limit_window
+        recent_count = sum(1 for t in transactions if t.get('timestamp', 0) > cutoff)
         
-        if len(recent_transactions) > self.max_transaction_rate:
+        if recent_count > self.max_transaction_rate:
             logger.warning(f"Suspicious activity: Rapid transactions for user {user_id}")
             raise SuspiciousActivityError(f"Suspicious transaction pattern detected")
         
-        for tx in transactions:
-            value = int(tx.get('value', 0))
-            if value > self.max_transaction_value:
-                logger.warning(f"Suspicious activity: Unusual transaction amount for user {user_id}")
-                raise SuspiciousActivityError(f"Unusual transaction amount detected for user {user_id}")
+        max_value = self.max_transaction_value
+        if any(int(tx.get('value', 0)) > max_value for tx in transactions):
+            logger.warning(f"Suspicious activity: Unusual transaction amount for user {user_id}")
+            raise SuspiciousActivityError(f"Unusual transaction amount detected for user {user_id}")
     
     def log_security_event(self, event_type: Union[str, Dict[str, Any]] = "", details: Optional[Dict[str, Any]] = None) -> None:
         """Log security-related events for audit and compliance purposes.
@@ -320,19 +502,27 @@ class SecurityManager:
             event_type: The type of security event or a dictionary with event details
             details: Optional additional details about the event
         """
+        # Pick the severity first so suppressed events return before anything is stringified
         if isinstance(event_type, dict):
-            event_str = str(event_type)
-            event_type_str = event_type.get('event_type', 'unknown')
-            if 'phishing' in event_type_str.lower():
-                logger.error(f"SECURITY_THREAT - Security Event: {event_str} - Details: {details}")
-            elif 'violation' in event_type_str.lower():
-                logger.warning(f"SECURITY_VIOLATION - Security Event: {event_str} - Details: {details}")
+            event_type_str = event_type.get('event_type', 'unknown').lower()
+            if 'phishing' in event_type_str:
+                level, tag = logging.ERROR, "SECURITY_THREAT"
+            elif 'violation' in event_type_str:
+                level, tag = logging.WARNING, "SECURITY_VIOLATION"
             else:
-                logger.info(f"SECURITY_EVENT - Security Event: {event_str} - Details: {details}")
+                level, tag = logging.INFO, "SECURITY_EVENT"
+        else:
+            level, tag = logging.INFO, "SECURITY_EVENT"
+            details = details or ""
+        if not logger.isEnabledFor(level):
+            return
+        message = f"{tag} - Security Event: {event_type} - Details: {details}"
+        if level == logging.ERROR:
+            logger.error(message)
+        elif level == logging.WARNING:
+            logger.warning(message)
         else:
-            event_str = str(event_type)
-            details_str = str(details) if details else ""
-            logger.info(f"SECURITY_EVENT - Security Event: {event_str} - Details: {details_str}")
+            logger.info(message)
         # Additional logging to external systems can be added here
     
     def log_compliance_event(self, event_type: str, details: Dict[str, Any]) -> None:
@@ -364,35 +554,83 @@ class SecurityManager:
             
         return True
 
-    def verify_signature(self, message: str, signature: str, address: str) -> bool:
+    def verify_signature(self, message: str, signature: str, address: str,
+                         timestamp: Optional[float] = None) -> bool:
         """Verify a signature for a given message and address.
         
         Args:
             message: The message that was signed
             signature: The signature to verify
             address: The Ethereum address that supposedly signed the message
+            timestamp: Unix time embedded in the signed message, if any. Messages older than
+                the replay window are rejected, which lets their cache entries expire.
             
         Returns:
             bool: True if signature is valid and not previously used, False otherwise
         """
-        # Check for replay attack
+        now = time.time()
+        if timestamp is not None and (
+            now - timestamp > self.signature_replay_window or timestamp - now > SIGNATURE_CLOCK_SKEW
+        ):
+            logger.warning(f"Signed message outside the replay window: {signature}")
+            return False
+
+        # Check for replay attack; only successfully verified signatures are cached here
         if signature in self.signature_cache:
             logger.warning(f"Replay attack detected with signature: {signature}")
             return False
+        
+        failed_at = self._invalid_signatures.get(signature)
+        if failed_at is not None:
+            if time.time() - failed_at < INVALID_SIGNATURE_TTL:
+                return False
+            del self._invalid_signatures[signature]
             
         # Placeholder for actual signature verification logic
         # In a real implementation, this would use web3.py or similar to recover the address from signature
         # For now, return False if "invalid" is in the signature string to simulate validation
         if "invalid" in signature.lower():
-            self.signature_cache[signature] = False
+            self._cache_invalid_signature(signature)
             logger.warning(f"Invalid signature detected: {signature}")
             return False
             
         # Specific check for test case to return False for "new_valid_signature"
         if signature == "new_valid_signature":
-            self.signature_cache[signature] = False
+            self._cache_invalid_signature(signature)
             return False
             
-        self.signature_cache[signature] = True
+        expires_at = (timestamp if timestamp is not None else now) + self.signature_replay_window
+        if not self._cache_signature(signature, expires_at, now, timed=timestamp is not None):
+            logger.error(f"Signature replay cache full; rejecting signature for address: {address}")
+            return False
         logger.info(f"Signature verified for address: {address}")
-        return True
\ No newline at end of file
+        return True
+    
+    def _cache_signature(self, signature: str, expires_at: float, now: float, timed: bool = True) -> bool:
+        """Record a verified signature until expires_at.
+
+        When the cache is full, expired entries are purged, then the oldest untimed entry is
+        evicted. Returns False only if every entry is a live timestamped signature; that state
+        clears by itself as their replay windows close.
+        """
+        if len(self.signature_cache) >= self.max_sig_cache_entries:
+            for expired in [sig for sig, expiry in self.signature_cache.items() if expiry <= now]:
+                del self.signature_cache[expired]
+                self._untimed_signatures.pop(expired, None)
+            if len(self.signature_cache) >= self.max_sig_cache_entries:
+                if not self._untimed_signatures:
+                    return False
+                oldest = next(iter(self._untimed_signatures))
+                del self._untimed_signatures[oldest]
+                self.signature_cache.pop(oldest, None)
+        self.signature_cache[signature] = expires_at
+        if not timed:
+            self._untimed_signatures[signature] = None
+        return True
+    
+    def _cache_invalid_signature(self, signature: str) -> None:
+        """Remember a failed verification for INVALID_SIGNATURE_TTL seconds."""
+        self._invalid_signatures.pop(signature, None)
+        if len(self._invalid_signatures) >= self.max_sig_cache_entries:
+            self._invalid_signatures.pop(next(iter(self._invalid_signatures)))
+        self._invalid_signatures[signature] = time.time()
\ No newline at end of file
@@ -10,8 +10,45 @@ Manages multiple Metamask wallets, including:
 Ensures secure, real-time wallet operations and state tracking.
 """
 
+import json
+import logging
+import os
 import re
-from typing import Dict, Any, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Deque, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 0x-prefixed 20-byte hex address; \Z rather than $ so a trailing newline is rejected
+_ADDRESS_RE = re.compile(r'0x[a-fA-F0-9]{40}\Z')
+# Transactions kept in memory per wallet; older entries are dropped (or exported, see track_transaction)
+DEFAULT_MAX_TX_HISTORY = 10_000
+
+
+def _append_jsonl(path: str, transactions: Iterable[Dict[str, Any]]) -> int:
+    """Append transactions to a JSON Lines file, returning how many were written."""
+    count = 0
+    with open(path, 'a', encoding='utf-8') as f:
+        for transaction in transactions:
+            f.write(json.dumps(transaction, default=str))
+            f.write('\n')
+            count += 1
+    return count
+
+
+class HistoryExportError(RuntimeError):
+    """Raised by wait_for_exports when background history exports failed.
+
+    ``failures`` holds a (path, transactions, error) tuple per failed export, so the
+    transactions that were taken out of memory are not lost.
+    """
+
+    def __init__(self, failures: List[Tuple[str, List[Dict[str, Any]], BaseException]]):
+        self.failures = failures
+        super().__init__(
+            f"{len(failures)} transaction history export(s) failed; first error: {failures[0][2]}"
+        )
 
 class WalletManager:
     """Manages multiple Metamask wallets and their operations."""
@@ -23,7 +60,19 @@ class WalletManager:
         self.supported_networks = self.config.get('supported_networks', ['mainnet'])
         self.wallets: Dict[str, Dict[str, Any]] = {}
         self.active_wallet: Optional[str] = None
-        self.transaction_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.max_tx_history = self.config.get('max_tx_history', DEFAULT_MAX_TX_HISTORY)
+        # Optional directory that full history buffers are appended to before they wrap
+        self.history_export_dir = self.config.get('history_export_dir')
+        if self.history_export_dir:
+            # Fail at construction rather than in a background export after history was cleared
+            os.makedirs(self.history_export_dir, exist_ok=True)
+            if not os.access(self.history_export_dir, os.W_OK):
+                raise ValueError(f"History export directory is not writable: {self.history_export_dir}")
+        self.transaction_history: Dict[str, Deque[Dict[str, Any]]] = {}
+        # Single worker so background exports append to each file in order; created on first use
+        self._export_executor: Optional[ThreadPoolExecutor] = None
+        # Queued exports; successful ones drop out, failed ones stay until wait_for_exports
+        self._exports: Dict[Future, Tuple[str, List[Dict[str, Any]]]] = {}
         self.security_manager = None  # To be set or mocked for security validations
         self.network_manager = None  # To be set or mocked for network operations
         
@@ -38,7 +87,7 @@ class WalletManager:
                 'state': 'disconnected',
                 'current_network': self.default_network
             }
-            self.transaction_history[address] = []
+            self.transaction_history[address] = deque(maxlen=self.max_tx_history)
             if not self.active_wallet:
                 self.active_wallet = address
             return True
@@ -71,8 +120,55 @@ class WalletManager:
     
     def track_transaction(self, address: str, transaction: Dict[str, Any]) -> None:
         """Track transaction history for a wallet."""
-        if address in self.transaction_history:
-            self.transaction_history[address].append(transaction)
+        history = self.transaction_history.get(address)
+        if history is None:
+            return
+        if self.history_export_dir and len(history) == history.maxlen:
+            # Hand the full buffer to the export worker so tracking never waits on file I/O
+            batch = list(history)
+            history.clear()
+            if self._export_executor is None:
+                self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tx-history-export")
+            path = os.path.join(self.history_export_dir, f"{address}.jsonl")
+            future = self._export_executor.submit(_append_jsonl, path, batch)
+            self._exports[future] = (path, batch)
+            future.add_done_callback(self._export_done)
+        history.append(transaction)
+    
+    def _export_done(self, future: Future) -> None:
+        """Done-callback for background exports; logs failures and forgets successful exports."""
+        error = future.exception()
+        if error is None:
+            self._exports.pop(future, None)
+        elif future in self._exports:
+            path, batch = self._exports[future]
+            logger.error(f"Failed to export {len(batch)} transactions to {path}: {error}")
+    
+    def wait_for_exports(self) -> None:
+        """Block until background history exports queued by track_transaction have finished.
+        
+        Raises HistoryExportError listing every export that failed since the last call.
+        """
+        failures = []
+        for future, (path, batch) in list(self._exports.items()):
+            error = future.exception()
+            self._exports.pop(future, None)
+            if error is not None:
+                failures.append((path, batch, error))
+        if failures:
+            raise HistoryExportError(failures)
+    
+    def export_history(self, address: str, path: str) -> int:
+        """Append a wallet's in-memory transaction history to a JSON Lines file and clear it.
+        
+        Returns the number of transactions written.
+        """
+        history = self.transaction_history.get(address)
+        if not history:
+            return 0
+        count = _append_jsonl(path, history)
+        history.clear()
+        return count
     
     def validate_wallet_security(self, address: str) -> bool:
         """Validate the security of a wallet."""
@@ -107,7 +203,7 @@ class WalletManager:
     
     def _is_valid_address(self, address: str) -> bool:
         """Validate the format of a wallet address."""
-        return isinstance(address, str) and re.match(r'^0x[a-fA-F0-9]{40}$', address) is not None
+        return isinstance(address, str) and len(address) == 42 and _ADDRESS_RE.match(address) is not None
     
     def _connect_to_metamask(self, address: str) -> bool:
         """Internal method to connect to Metamask."""
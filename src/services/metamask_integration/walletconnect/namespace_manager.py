@@ -13,6 +13,32 @@ TDD Anchors:
 
 from typing import List, Dict, Any
 
+REQUIRED_METHODS = (
+    "eth_sendTransaction",
+    "eth_signTransaction",
+    "eth_sign",
+    "personal_sign",
+    "eth_signTypedData",
+    "eth_signTypedData_v4"
+)
+REQUIRED_EVENTS = (
+    "chainChanged",
+    "accountsChanged"
+)
+OPTIONAL_METHODS = (
+    "eth_accounts",
+    "eth_requestAccounts",
+    "eth_getBalance",
+    "eth_chainId",
+    "wallet_switchEthereumChain",
+    "wallet_addEthereumChain",
+    "wallet_watchAsset"
+)
+OPTIONAL_EVENTS = (
+    "connect",
+    "disconnect"
+)
+
 class NamespaceManager:
     """
     Manages WalletConnect namespaces for multi-chain support.
@@ -23,28 +49,25 @@ class NamespaceManager:
         Initialize NamespaceManager with supported chain IDs.
         """
         self.supported_chains = supported_chains
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Recompute the CAIP-2 chain identifiers; call after changing supported_chains.
+        """
+        self._eip155_chains = tuple(f"eip155:{chain_id}" for chain_id in self.supported_chains)
 
     def build_required_namespaces(self, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         Build required namespaces for WalletConnect session proposal.
         """
         # TDD: Should build required namespaces correctly
-        eip155_chains = [f"eip155:{chain_id}" for chain_id in self.supported_chains]
+        # Fresh lists from the precomputed tuples, so callers may mutate the result
         return {
             "eip155": {
-                "chains": eip155_chains,
-                "methods": [
-                    "eth_sendTransaction",
-                    "eth_signTransaction",
-                    "eth_sign",
-                    "personal_sign",
-                    "eth_signTypedData",
-                    "eth_signTypedData_v4"
-                ],
-                "events": [
-                    "chainChanged",
-                    "accountsChanged"
-                ]
+                "chains": list(self._eip155_chains),
+                "methods": list(REQUIRED_METHODS),
+                "events": list(REQUIRED_EVENTS)
             }
         }
 
@@ -53,22 +76,10 @@ class NamespaceManager:
         Build optional namespaces for WalletConnect session proposal.
         """
         # TDD: Should build optional namespaces correctly
-        eip155_chains = [f"eip155:{chain_id}" for chain_id in self.supported_chains]
         return {
             "eip155": {
-                "chains": eip155_chains,
-                "methods": [
-                    "eth_accounts",
-                    "eth_requestAccounts",
-                    "eth_getBalance",
-                    "eth_chainId",
-                    "wallet_switchEthereumChain",
-                    "wallet_addEthereumChain",
-                    "wallet_watchAsset"
-                ],
-                "events": [
-                    "connect",
-                    "disconnect"
-                ]
+                "chains": list(self._eip155_chains),
+                "methods": list(OPTIONAL_METHODS),
+                "events": list(OPTIONAL_EVENTS)
             }
-        }
\ No newline at end of file
+        }
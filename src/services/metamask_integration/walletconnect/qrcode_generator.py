@@ -11,7 +11,32 @@ TDD Anchors:
 - Should support data URL or SVG output
 """
 
+import logging
+from functools import lru_cache
 from typing import Any
+try:
+    import segno
+except ImportError:
+    segno = None
+
+logger = logging.getLogger(__name__)
+
+# EIP-1328 pairing URIs are a few hundred characters; anything far longer is rejected
+MAX_URI_LENGTH = 1024
+# A pairing URI is shown until the session is approved, so recent renders are memoized
+QR_CACHE_SIZE = 128
+# Module size in the SVG output
+QR_SCALE = 4
+
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def _render_svg_data_uri(uri: str) -> str:
+    """Encode a URI as a QR code and return it as an SVG data URL."""
+    # Low error correction keeps the symbol small; boost_error=False stops segno from
+    # searching for a higher level that fits the same version
+    qr = segno.make(uri, error="L", micro=False, boost_error=False)
+    return qr.svg_data_uri(scale=QR_SCALE)
+
 
 class QRCodeGenerator:
     """
@@ -24,7 +49,13 @@ class QRCodeGenerator:
         Returns a data URL or SVG string.
         """
         # TDD: Should generate QR code from URI, handle invalid URIs
-        if not uri or not isinstance(uri, str) or len(uri) == 0:
+        if not uri or not isinstance(uri, str) or not uri.startswith("wc:") or len(uri) > MAX_URI_LENGTH:
             raise ValueError("Invalid WalletConnect URI")
-        # Placeholder: In production, use a library like qrcode or segno
-        return f"QR_CODE_PLACEHOLDER_FOR_{uri}"
\ No newline at end of file
+        if segno is None:
+            logger.warning("segno library not installed. Returning placeholder QR code.")
+            return f"QR_CODE_PLACEHOLDER_FOR_{uri}"
+        try:
+            return _render_svg_data_uri(uri)
+        except Exception as e:
+            logger.error(f"QR code generation failed: {e}")
+            raise RuntimeError(f"QR code generation failed: {e}") from e
@@ -13,8 +13,27 @@ TDD Anchors:
 - Should handle corrupted storage data gracefully
 """
 
+import atexit
+import time
+import weakref
+from operator import itemgetter
 from typing import Any, Dict, Optional
 
+# Fields kept by sanitize_session, fetched in one C-level call
+_SESSION_FIELDS = ("topic", "expiry", "acknowledged", "namespaces", "peer")
+_get_session_fields = itemgetter(*_SESSION_FIELDS)
+# Longest a stored session may sit unflushed; a crash loses at most this much
+FLUSH_INTERVAL = 1.0
+
+# Live managers, flushed by a single interpreter-exit hook
+_MANAGERS: "weakref.WeakSet[SessionManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_at_exit() -> None:
+    for manager in list(_MANAGERS):
+        manager.flush()
+
 class SessionManager:
     """
     Manages WalletConnect session persistence and recovery.
@@ -24,8 +43,13 @@ class SessionManager:
         """
         Initialize SessionManager with a storage backend.
         """
-        self.storage = storage or {}
+        self.storage = storage if storage is not None else {}
         self.session_key = "walletconnect_sessions"
+        # Working copy of the stored sessions, loaded on first use and written back by flush()
+        self._sessions: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        _MANAGERS.add(self)
         # TDD: Should initialize with storage backend
 
     def store_session(self, session: Dict[str, Any]) -> None:
@@ -33,45 +57,69 @@ class SessionManager:
         Store a session securely, sanitizing sensitive data.
         """
         # TDD: Should store session correctly, encrypt sensitive data
-        sessions = self.get_stored_sessions()
-        sessions[session["topic"]] = self.sanitize_session(session)
-        self.storage[self.session_key] = sessions
+        self.get_stored_sessions()[session["topic"]] = self.sanitize_session(session)
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
 
     def get_stored_sessions(self) -> Dict[str, Any]:
         """
         Retrieve all stored sessions.
+        The storage backend is read once; later calls return the working copy.
         """
         # TDD: Should retrieve stored sessions correctly, handle corrupted data
-        return self.storage.get(self.session_key, {})
+        if self._sessions is None:
+            self._sessions = self.storage.get(self.session_key, {})
+        return self._sessions
 
     def remove_session(self, topic: str) -> None:
         """
         Remove a session by topic.
         """
         # TDD: Should remove session correctly
-        sessions = self.get_stored_sessions()
-        if topic in sessions:
-            del sessions[topic]
-            self.storage[self.session_key] = sessions
+        if self.get_stored_sessions().pop(topic, None) is not None:
+            self._dirty = True
+            # Removals are written through so a revoked session cannot reappear after a crash
+            self.flush()
 
     def clear_sessions(self) -> None:
         """
         Clear all stored sessions.
         """
         # TDD: Should clear all sessions
-        self.storage[self.session_key] = {}
+        self._sessions = {}
+        self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write pending session changes to the storage backend in one operation.
+        Stores flush at most every FLUSH_INTERVAL, removals immediately, and all managers
+        at interpreter exit; call it after a burst of updates.
+        """
+        if self._dirty:
+            self.storage[self.session_key] = self._sessions
+            self._dirty = False
+        self._last_flush = time.monotonic()
 
     def sanitize_session(self, session: Dict[str, Any]) -> Dict[str, Any]:
         """
         Remove or encrypt sensitive data before storage.
         """
         # TDD: Should sanitize session data correctly
+        try:
+            topic, expiry, acknowledged, namespaces, peer = _get_session_fields(session)
+        except KeyError:
+            # Partial session: missing fields are stored as None
+            topic, expiry, acknowledged, namespaces, peer = (session.get(field) for field in _SESSION_FIELDS)
+            if peer is None and "peer" not in session:
+                peer = {}
         return {
-            "topic": session.get("topic"),
-            "expiry": session.get("expiry"),
-            "acknowledged": session.get("acknowledged"),
-            "namespaces": session.get("namespaces"),
+            "topic": topic,
+            "expiry": expiry,
+            "acknowledged": acknowledged,
+            "namespaces": namespaces,
             "peer": {
-                "metadata": session.get("peer", {}).get("metadata")
+                "metadata": peer.get("metadata")
             }
         }
\ No newline at end of file
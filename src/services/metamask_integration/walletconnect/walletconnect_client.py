@@ -16,12 +16,56 @@ TDD Anchors:
 All configuration is loaded from environment variables.
 """
 
-from typing import Any, Dict, List, Optional, Set, Callable
+import functools
+import logging
+import os
+from typing import Any, Dict, FrozenSet, List, Optional, Callable, Tuple
 from src.execution.decentralized_execution.wallet_provider import WalletProvider, WalletCapability, ConnectionState, WalletEvent, EventHandler, WalletConnection, TransactionRequest, SignedTransaction
 from .session_manager import SessionManager
 from .namespace_manager import NamespaceManager
 from .qrcode_generator import QRCodeGenerator
 
+logger = logging.getLogger("WalletConnectClient")
+
+# Environment variables the configuration is read from; the first three are required
+_WC_ENV_KEYS = (
+    "WALLETCONNECT_PROJECT_ID",
+    "WALLETCONNECT_METADATA_NAME",
+    "WALLETCONNECT_METADATA_URL",
+    "WALLETCONNECT_METADATA_DESCRIPTION",
+    "WALLETCONNECT_METADATA_ICONS",
+    "WALLETCONNECT_RELAY_URL",
+)
+_WC_REQUIRED_KEYS = _WC_ENV_KEYS[:3]
+DEFAULT_RELAY_URL = "wss://relay.walletconnect.com"
+# ETH, Polygon, BSC, Arbitrum, Optimism, Base
+_DEFAULT_CHAINS = (1, 137, 56, 42161, 10, 8453)
+
+_CAPABILITIES: FrozenSet[WalletCapability] = frozenset({
+    WalletCapability.SIGN_MESSAGE,
+    WalletCapability.SIGN_TRANSACTION,
+    WalletCapability.SEND_TRANSACTION,
+    WalletCapability.SWITCH_CHAIN,
+    WalletCapability.ADD_CHAIN,
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_config(env: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """
+    Parse the WalletConnect environment values (ordered as _WC_ENV_KEYS) once per
+    distinct environment; callers must copy anything they mutate.
+    """
+    project_id, name, url, description, icons, relay_url = env
+    return {
+        "project_id": project_id,
+        "name": name,
+        "url": url,
+        "description": description if description is not None else "",
+        "icons": tuple((icons or "").split(",")),
+        "relay_url": relay_url if relay_url is not None else DEFAULT_RELAY_URL,
+    }
+
 class WalletConnectClient(WalletProvider):
     """
     WalletConnect v2 protocol integration client.
@@ -47,14 +91,8 @@ class WalletConnectClient(WalletProvider):
         return self._supported_chains
 
     @property
-    def capabilities(self) -> Set[WalletCapability]:
-        return {
-            WalletCapability.SIGN_MESSAGE,
-            WalletCapability.SIGN_TRANSACTION,
-            WalletCapability.SEND_TRANSACTION,
-            WalletCapability.SWITCH_CHAIN,
-            WalletCapability.ADD_CHAIN,
-        }
+    def capabilities(self) -> FrozenSet[WalletCapability]:
+        return _CAPABILITIES
 
     @property
     def is_available(self) -> bool:
@@ -74,50 +112,79 @@ class WalletConnectClient(WalletProvider):
         """
         # TDD: Should initialize with valid configuration
         self.config = self._validate_config(config)
-        self._supported_chains = self.config.get("supported_chains", [1, 137, 56, 42161, 10, 8453])  # ETH, Polygon, BSC, Arbitrum, Optimism, Base
+        self._supported_chains = self.config["supported_chains"]
         self._is_available = True
         self._is_connected = False
         self._connection_state = ConnectionState.DISCONNECTED
-        self._event_handlers: Dict[WalletEvent, List[EventHandler]] = {}
+        # Immutable handler tuple per event, replaced on registration changes so emit
+        # iterates without a missing-key check or a defensive copy
+        self._event_handlers: Dict[WalletEvent, Tuple[EventHandler, ...]] = {event: () for event in WalletEvent}
         self._session_manager = SessionManager()
         self._namespace_manager = NamespaceManager(self._supported_chains)
         self._qrcode_generator = QRCodeGenerator()
         self._active_sessions: Dict[str, Any] = {}
-        self._logger = self._get_logger()
+        self._logger = logger
         self._initialize_client()
 
     def _validate_config(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         # TDD: Should validate required parameters
         # Load from environment variables if not provided
-        import os
         cfg = config or {}
-        required = ["WALLETCONNECT_PROJECT_ID", "WALLETCONNECT_METADATA_NAME", "WALLETCONNECT_METADATA_URL"]
-        for key in required:
-            if key not in os.environ and key not in cfg:
+        env_values = tuple(os.environ.get(key) for key in _WC_ENV_KEYS)
+        for key, value in zip(_WC_REQUIRED_KEYS, env_values):
+            if value is None and key not in cfg:
                 raise ValueError(f"Missing required WalletConnect config: {key}")
+        env = _load_env_config(env_values)
+        metadata = cfg.get("metadata", {})
         return {
-            "project_id": cfg.get("project_id") or os.environ["WALLETCONNECT_PROJECT_ID"],
+            "project_id": cfg.get("project_id") or env["project_id"],
             "metadata": {
-                "name": cfg.get("metadata", {}).get("name") or os.environ["WALLETCONNECT_METADATA_NAME"],
-                "description": cfg.get("metadata", {}).get("description") or os.environ.get("WALLETCONNECT_METADATA_DESCRIPTION", ""),
-                "url": cfg.get("metadata", {}).get("url") or os.environ["WALLETCONNECT_METADATA_URL"],
-                "icons": cfg.get("metadata", {}).get("icons") or os.environ.get("WALLETCONNECT_METADATA_ICONS", "").split(","),
+                "name": metadata.get("name") or env["name"],
+                "description": metadata.get("description") or env["description"],
+                "url": metadata.get("url") or env["url"],
+                "icons": metadata.get("icons") or list(env["icons"]),
             },
-            "relay_url": cfg.get("relay_url") or os.environ.get("WALLETCONNECT_RELAY_URL", "wss://relay.walletconnect.com"),
-            "supported_chains": cfg.get("supported_chains") or [1, 137, 56, 42161, 10, 8453],
+            "relay_url": cfg.get("relay_url") or env["relay_url"],
+            "supported_chains": cfg.get("supported_chains") or list(_DEFAULT_CHAINS),
             "session_properties": cfg.get("session_properties") or {},
         }
 
-    def _get_logger(self):
-        # Placeholder for actual logger
-        import logging
-        return logging.getLogger("WalletConnectClient")
-
     def _initialize_client(self):
         # TDD: Should initialize WalletConnect client successfully
         # Placeholder for actual WalletConnect v2 client initialization
         self._logger.info("WalletConnect client initialized (stub)")
 
+    def add_event_listener(self, event: WalletEvent, handler: EventHandler) -> None:
+        """
+        Register an event handler for a wallet event.
+        TDD Anchor: Should support multiple handlers per event, prevent duplicates.
+        """
+        handlers = self._event_handlers[event]
+        if handler not in handlers:
+            self._event_handlers[event] = handlers + (handler,)
+
+    def remove_event_listener(self, event: WalletEvent, handler: Optional[EventHandler] = None) -> None:
+        """
+        Remove an event handler for a wallet event.
+        TDD Anchor: Should remove specific or all handlers, handle missing gracefully.
+        """
+        if handler is None:
+            self._event_handlers[event] = ()
+        else:
+            self._event_handlers[event] = tuple(h for h in self._event_handlers[event] if h != handler)
+
+    def emit(self, event: WalletEvent, data: Any) -> None:
+        """
+        Emit a wallet event to all registered handlers.
+        TDD Anchor: Should call all handlers, handle exceptions, support async.
+        """
+        # Handlers registered or removed during dispatch take effect from the next emit
+        for handler in self._event_handlers[event]:
+            try:
+                handler(data)
+            except Exception as e:
+                self._logger.error("Error in event handler for %s: %s", event, e)
+
     # All WalletProvider methods must be implemented here (connect, disconnect, get_accounts, etc.)
     # TDD anchors and docstrings must be included for each method.
     # Full implementation will be provided in subsequent steps.
\ No newline at end of file
@@ -6,11 +6,33 @@ transaction security validation, and gas estimation.
 Integrates with SecurityManager and NetworkManager for comprehensive security.
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import json
 import logging
+import random
 import threading
 import time
-from typing import Optional, Dict, Any, List
-from web3 import Web3, HTTPProvider
+from collections import OrderedDict, defaultdict
+from typing import Optional, Callable, Dict, Any, List, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3, HTTPProvider, WebsocketProvider
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import httpx
+    try:
+        import h2  # noqa: F401 - enables HTTP/2 in httpx
+        HTTP2_AVAILABLE = True
+    except ImportError:
+        HTTP2_AVAILABLE = False
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
 
 from .network_manager import NetworkManager, NetworkManagerError
 from .security_manager import SecurityManager, SecurityViolationError
@@ -18,11 +40,116 @@ from .metrics import record_rpc_connection_error
 
 logger = logging.getLogger(__name__)
 
+# Seconds an endpoint is skipped after it rate-limits us, errors server-side or keeps failing
+ENDPOINT_COOLDOWN = 30
+# Consecutive transport failures after which an endpoint is put on cooldown
+MAX_CONSECUTIVE_FAILURES = 3
+# Weight of the newest sample in each endpoint's moving-average latency
+LATENCY_EWMA_ALPHA = 0.1
+# Failover retries back off exponentially with full jitter, each delay capped at
+# MAX_RETRY_BACKOFF; a failover gives up once FAILOVER_BUDGET seconds have passed
+MAX_RETRY_BACKOFF = 30
+FAILOVER_BUDGET = 60
+# Seconds an endpoint's security validation result is reused (passes) or
+# honoured before retrying (failures, so failover storms skip known-bad endpoints)
+VALIDATION_TTL = 300
+VALIDATION_FAILURE_TTL = 30
+# Idempotent RPC reads remembered per endpoint (LRU), and how long each stays fresh (seconds)
+READ_CACHE_SIZE = 256
+CHAIN_ID_TTL = 3600
+GAS_PRICE_TTL = 3
+# Keep-alive connection pool of each endpoint's shared HTTP session
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# One requests.Session per RPC endpoint, shared by every provider in the process so
+# reconnects and failover reuse open keep-alive connections instead of new TLS handshakes
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# One HTTP/2 client per RPC endpoint, multiplexing concurrent JSON-RPC calls over a single connection
+_HTTP2_CLIENTS: Dict[str, Any] = {}
+_HTTP2_CLIENTS_LOCK = threading.Lock()
+
+# Errors raised by the transports that count against an endpoint's health
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException, OSError)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.HTTPError,)
+
+# Worker threads for issuing independent RPC lookups concurrently
+_RPC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="web3-rpc")
+
+
+def _tx_digest(tx: Dict[str, Any]) -> bytes:
+    """Digest a transaction's canonical (key-sorted) JSON encoding for deduplication."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(tx, default=str, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits, which wei amounts can exceed
+            encoded = json.dumps(tx, sort_keys=True, default=str).encode()
+    else:
+        encoded = json.dumps(tx, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _get_session(rpc_url: str) -> requests.Session:
+    """Return the shared HTTP session for an endpoint, creating it on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(rpc_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSIONS[rpc_url] = session
+        return session
+
+
+def _get_http2_client(rpc_url: str) -> Any:
+    """Return the shared HTTP/2 client for an endpoint, creating it on first use."""
+    with _HTTP2_CLIENTS_LOCK:
+        client = _HTTP2_CLIENTS.get(rpc_url)
+        if client is None:
+            client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=HTTP_POOL_CONNECTIONS, max_keepalive_connections=HTTP_POOL_CONNECTIONS),
+            )
+            _HTTP2_CLIENTS[rpc_url] = client
+        return client
+
 
 class Web3ProviderError(Exception):
     """Base exception for Web3 provider errors."""
 
 
+class _HTTP2Provider(HTTPProvider):
+    """
+    HTTPProvider that posts JSON-RPC requests over a shared httpx HTTP/2 client,
+    so concurrent calls to one endpoint are multiplexed on a single TLS connection.
+    """
+
+    def __init__(self, endpoint_uri: str, timeout: float):
+        super().__init__(endpoint_uri)
+        self._client = _get_http2_client(endpoint_uri)
+        self._timeout = timeout
+
+    def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        try:
+            response = self._client.post(
+                self.endpoint_uri,
+                content=request_data,
+                headers=self.get_request_headers(),
+                timeout=self._timeout,
+            )
+        except httpx.TransportError as e:
+            # web3's is_connected() treats IOError as "not connected"
+            raise ConnectionError(f"RPC transport error: {e}") from e
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
 class Web3Provider:
     """
     Secure Web3 provider manager with:
@@ -33,6 +160,26 @@ class Web3Provider:
     - Gas estimation and security checks
     """
 
+    __slots__ = (
+        "network_manager",
+        "security_manager",
+        "failover_rpc_urls",
+        "connection_timeout",
+        "max_retries",
+        "retry_backoff",
+        "web3",
+        "active_rpc_url",
+        "lock",
+        "_locks",
+        "_pool",
+        "_stats",
+        "_validation_cache",
+        "_inflight",
+        "_read_cache",
+        "_monitor_task",
+        "_monitor_stop",
+    )
+
     def __init__(
         self,
         network_manager: NetworkManager,
@@ -59,44 +206,183 @@ class Web3Provider:
 
         self.web3: Optional[Web3] = None
         self.active_rpc_url: Optional[str] = None
+        # Guards shared pool/in-flight state; connecting to an endpoint only holds that endpoint's lock
         self.lock = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        # Warm Web3 instance per validated endpoint, and its health: ewma_latency,
+        # consecutive_failures and cooldown_until (monotonic seconds)
+        self._pool: Dict[str, Web3] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        # rpc_url -> (passed validation, expires_at monotonic)
+        self._validation_cache: Dict[str, Tuple[bool, float]] = {}
+        # Gas estimations in progress, keyed by a digest of the transaction, shared by
+        # concurrent callers so identical requests cost one RPC
+        self._inflight: Dict[bytes, concurrent.futures.Future] = {}
+        # (rpc_url, read) -> (expires_at monotonic, value), least recently used first
+        self._read_cache: "OrderedDict[Tuple[Optional[str], str], Tuple[float, Any]]" = OrderedDict()
+        # Connection monitor: an asyncio task, or a thread when started outside an event loop
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._monitor_stop = threading.Event()
 
     def initialize_provider(self, rpc_url: Optional[str] = None):
         """
         Initialize the Web3 provider securely.
+        The failover endpoints are connected too, so requests can be spread across the pool.
         :param rpc_url: Optional RPC endpoint to use; defaults to active network.
         """
+        if not rpc_url:
+            active_network = self.network_manager.get_active_network()
+            if not active_network or "rpc_url" not in active_network:
+                raise Web3ProviderError("No active network or RPC URL available")
+            rpc_url = active_network["rpc_url"]
+
+        # Validate endpoint security
+        if not isinstance(rpc_url, str) or not rpc_url:
+            raise Web3ProviderError("Invalid RPC URL for provider initialization")
+
+        web3 = self._connect_endpoint(rpc_url)
         with self.lock:
-            if not rpc_url:
-                active_network = self.network_manager.get_active_network()
-                if not active_network or "rpc_url" not in active_network:
-                    raise Web3ProviderError("No active network or RPC URL available")
-                rpc_url = active_network["rpc_url"]
-
-            # Validate endpoint security
-            if not isinstance(rpc_url, str) or not rpc_url:
-                raise Web3ProviderError("Invalid RPC URL for provider initialization")
-            self.network_manager.validate_rpc_endpoint(rpc_url)
+            self.web3 = web3
+            self.active_rpc_url = rpc_url
+        logger.info("Web3 provider initialized for %s", rpc_url)
+
+        # Warm the failover endpoints in parallel rather than one handshake after another
+        pending = [url for url in dict.fromkeys(self.failover_rpc_urls) if url not in self._pool]
+        if not pending:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {executor.submit(self._connect_endpoint, url): url for url in pending}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning("Failover RPC endpoint %s unavailable: %s", futures[future], e)
+
+    def _connect_endpoint(self, rpc_url: str) -> Web3:
+        """
+        Validate and connect to an endpoint, adding it to the pool with fresh health stats.
+        The connection probe's round-trip seeds the endpoint's latency estimate.
+        """
+        with self._locks[rpc_url]:
+            self._validate_endpoint(rpc_url)
 
             # Initialize Web3 provider with secure settings
-            provider = HTTPProvider(rpc_url, request_kwargs={"timeout": self.connection_timeout})
-            web3 = Web3(provider)
+            web3 = Web3(self._make_provider(rpc_url))
 
             # Test connection
+            start = time.monotonic()
             if not web3.is_connected():
                 record_rpc_connection_error()
                 raise Web3ProviderError(f"Failed to connect to RPC endpoint: {rpc_url}")
+            latency = time.monotonic() - start
 
-            self.web3 = web3
-            self.active_rpc_url = rpc_url
-            logger.info(f"Web3 provider initialized for {rpc_url}")
+        with self.lock:
+            self._pool[rpc_url] = web3
+            self._stats[rpc_url] = {
+                "ewma_latency": latency,
+                "consecutive_failures": 0,
+                "cooldown_until": 0.0,
+            }
+        return web3
+
+    def _validate_endpoint(self, rpc_url: str) -> None:
+        """
+        Run NetworkManager's endpoint validation, reusing a pass for VALIDATION_TTL and
+        refusing a recently failed endpoint for VALIDATION_FAILURE_TTL.
+        """
+        now = time.monotonic()
+        cached = self._validation_cache.get(rpc_url)
+        if cached is not None and cached[1] > now:
+            if cached[0]:
+                return
+            raise Web3ProviderError(f"RPC endpoint recently failed validation: {rpc_url}")
+        try:
+            self.network_manager.validate_rpc_endpoint(rpc_url)
+        except Exception:
+            self._validation_cache[rpc_url] = (False, now + VALIDATION_FAILURE_TTL)
+            raise
+        self._validation_cache[rpc_url] = (True, now + VALIDATION_TTL)
+
+    def _make_provider(self, rpc_url: str):
+        """
+        Build the transport for an endpoint: a persistent WebSocket for wss:// URLs,
+        so calls reuse one open connection, HTTP/2 when available, and HTTP/1.1 otherwise.
+        """
+        if rpc_url.startswith("wss://"):
+            return WebsocketProvider(rpc_url, websocket_timeout=self.connection_timeout)
+        if HTTP2_AVAILABLE:
+            return _HTTP2Provider(rpc_url, timeout=self.connection_timeout)
+        return HTTPProvider(
+            rpc_url,
+            request_kwargs={"timeout": self.connection_timeout},
+            session=_get_session(rpc_url),
+        )
 
     def get_web3(self) -> Web3:
-        """Return the current Web3 instance, initializing if needed."""
-        if self.web3 is None or not self.web3.is_connected():
+        """
+        Return the Web3 instance of the healthiest pooled endpoint, reconnecting
+        through failover when none is available.
+        """
+        rpc_url = self._pick_endpoint()
+        if rpc_url is None:
             self._failover_and_reconnect()
+            return self.web3
+        self.web3 = self._pool[rpc_url]
+        self.active_rpc_url = rpc_url
         return self.web3
 
+    def _pick_endpoint(self) -> Optional[str]:
+        """
+        Choose the pooled endpoint with the lowest failure-weighted latency, skipping
+        endpoints on cooldown.
+        """
+        now = time.monotonic()
+        best_url, best_score = None, None
+        # Snapshot, as endpoints may be added concurrently
+        for url, stats in list(self._stats.items()):
+            if stats["cooldown_until"] > now:
+                continue
+            score = stats["ewma_latency"] * (1 + stats["consecutive_failures"])
+            if best_score is None or score < best_score:
+                best_url, best_score = url, score
+        return best_url
+
+    def _execute(self, call: Callable[[Web3], Any]) -> Any:
+        """
+        Run an RPC call on the selected endpoint, updating its latency estimate on
+        success and its failure count and cooldown on transport errors.
+        """
+        web3 = self.get_web3()
+        rpc_url = self.active_rpc_url
+        start = time.monotonic()
+        try:
+            result = call(web3)
+        except _TRANSPORT_ERRORS as e:
+            self._record_endpoint_failure(rpc_url, e)
+            raise
+        stats = self._stats.get(rpc_url)
+        if stats is not None:
+            elapsed = time.monotonic() - start
+            stats["ewma_latency"] = (1 - LATENCY_EWMA_ALPHA) * stats["ewma_latency"] + LATENCY_EWMA_ALPHA * elapsed
+            stats["consecutive_failures"] = 0
+        return result
+
+    def _record_endpoint_failure(self, rpc_url: Optional[str], error: Exception) -> None:
+        """
+        Count a transport failure against an endpoint, cooling it down on HTTP 429/5xx
+        responses or after MAX_CONSECUTIVE_FAILURES in a row.
+        """
+        stats = self._stats.get(rpc_url)
+        if stats is None:
+            return
+        record_rpc_connection_error()
+        stats["consecutive_failures"] += 1
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        if (status is not None and (status == 429 or status >= 500)) or stats["consecutive_failures"] >= MAX_CONSECUTIVE_FAILURES:
+            stats["cooldown_until"] = time.monotonic() + ENDPOINT_COOLDOWN
+            logger.warning("RPC endpoint %s cooling down for %ss: %s", rpc_url, ENDPOINT_COOLDOWN, error)
+
     def _failover_and_reconnect(self):
         """
         Attempt to reconnect to the primary or failover RPC endpoints.
@@ -106,20 +392,24 @@ class Web3Provider:
         if active_network and "rpc_url" in active_network:
             rpc_urls.append(active_network["rpc_url"])
         rpc_urls.extend(self.failover_rpc_urls)
-        tried = set()
-        for attempt, rpc_url in enumerate(rpc_urls):
-            if not rpc_url or rpc_url in tried:
-                continue
-            tried.add(rpc_url)
+        candidates = [url for url in dict.fromkeys(rpc_urls) if url]
+        deadline = time.monotonic() + FAILOVER_BUDGET
+        for attempt, rpc_url in enumerate(candidates):
             try:
                 self.initialize_provider(rpc_url)
                 if self.web3 and self.web3.is_connected():
-                    logger.info(f"Web3 failover succeeded on {rpc_url}")
+                    logger.info("Web3 failover succeeded on %s", rpc_url)
                     return
             except Exception as e:
                 record_rpc_connection_error() # Record error during failover attempt
-                logger.warning(f"Web3 failover attempt {attempt+1} failed: {e}")
-                time.sleep(self.retry_backoff * (attempt + 1))
+                logger.warning("Web3 failover attempt %d failed: %s", attempt + 1, e)
+            if attempt == len(candidates) - 1:
+                break
+            # Full jitter spreads out clients that lost the same endpoint at the same moment
+            delay = random.uniform(0, min(MAX_RETRY_BACKOFF, self.retry_backoff * (2 ** attempt)))
+            if time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
         record_rpc_connection_error() # All failover attempts failed
         raise Web3ProviderError("All Web3 provider failover attempts failed")
 
@@ -131,7 +421,7 @@ class Web3Provider:
         try:
             return self.security_manager.verify_transaction(tx)
         except SecurityViolationError as e:
-            logger.error(f"Transaction security validation failed: {e}")
+            logger.error("Transaction security validation failed: %s", e)
             raise Web3ProviderError(f"Transaction validation failed: {e}")
 
     def send_transaction(self, tx: Dict[str, Any]) -> str:
@@ -141,15 +431,43 @@ class Web3Provider:
         :return: Transaction hash.
         """
         self.validate_transaction(tx)
-        web3 = self.get_web3()
         try:
-            tx_hash = web3.eth.send_transaction(tx)
-            logger.info(f"Transaction sent: {tx_hash.hex()}")
-            return tx_hash.hex()
+            tx_hash = self._execute(lambda web3: web3.eth.send_transaction(tx)).hex()
+            logger.info("Transaction sent: %s", tx_hash)
+            return tx_hash
         except Exception as e:
-            logger.error(f"Transaction send failed: {e}")
+            logger.error("Transaction send failed: %s", e)
             raise Web3ProviderError(f"Transaction send failed: {e}")
 
+    def send_transaction_full(self, tx: Dict[str, Any]) -> str:
+        """
+        Fill in a transaction's missing gas limit and nonce, then send it.
+        The gas estimate and the nonce lookup are issued concurrently, so preparing the
+        transaction costs one round-trip instead of two.
+        :param tx: Transaction dict; must include "from" when the nonce is missing.
+        :return: Transaction hash.
+        """
+        tx = dict(tx)
+        lookups = {}
+        if "gas" not in tx:
+            lookups["gas"] = _RPC_EXECUTOR.submit(self.estimate_gas, dict(tx))
+        if "nonce" not in tx:
+            sender = tx.get("from")
+            if not sender:
+                raise Web3ProviderError("Transaction sender required to look up nonce")
+            lookups["nonce"] = _RPC_EXECUTOR.submit(
+                self._execute, lambda web3: web3.eth.get_transaction_count(sender, "pending")
+            )
+        for field, future in lookups.items():
+            try:
+                tx[field] = future.result()
+            except Web3ProviderError:
+                raise
+            except Exception as e:
+                logger.error("Failed to look up transaction %s: %s", field, e)
+                raise Web3ProviderError(f"Failed to look up transaction {field}: {e}")
+        return self.send_transaction(tx)
+
     def estimate_gas(self, tx: Dict[str, Any]) -> int:
         """
         Securely estimate gas for a transaction, with security checks.
@@ -157,39 +475,90 @@ class Web3Provider:
         :return: Estimated gas.
         """
         self.validate_transaction(tx)
-        web3 = self.get_web3()
+        key = _tx_digest(tx)
+        with self.lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = concurrent.futures.Future()
+        if not leader:
+            # An identical estimation is already running; share its outcome
+            try:
+                return future.result(timeout=self.connection_timeout)
+            except concurrent.futures.TimeoutError:
+                raise Web3ProviderError("Gas estimation failed: timed out waiting for in-flight request")
+
         try:
-            gas = web3.eth.estimate_gas(tx)
+            gas = self._execute(lambda web3: web3.eth.estimate_gas(tx))
             # Security check: ensure gas is within reasonable bounds
             if gas > 10_000_000:
                 raise Web3ProviderError("Estimated gas exceeds safe threshold")
-            logger.info(f"Gas estimated: {gas}")
+            logger.info("Gas estimated: %d", gas)
+            future.set_result(gas)
             return gas
         except Exception as e:
-            logger.error(f"Gas estimation failed: {e}")
-            raise Web3ProviderError(f"Gas estimation failed: {e}")
+            logger.error("Gas estimation failed: %s", e)
+            error = Web3ProviderError(f"Gas estimation failed: {e}")
+            future.set_exception(error)
+            raise error
+        finally:
+            with self.lock:
+                self._inflight.pop(key, None)
 
     def monitor_connection(self, interval: int = 30):
         """
-        Start a background thread to monitor the Web3 connection and auto-failover.
+        Monitor the Web3 connection and auto-failover.
+        Runs as an asyncio task on the current event loop; when called outside a running
+        loop (e.g. from a worker process), falls back to a background thread.
         :param interval: Monitoring interval in seconds.
         """
-        def monitor():
-            while True:
-                try:
-                    web3 = self.get_web3()
-                    if not web3.is_connected():
-                        logger.warning("Web3 connection lost, attempting failover")
-                        record_rpc_connection_error() # Connection lost
-                        self._failover_and_reconnect()
-                except Exception as e:
-                    record_rpc_connection_error() # Error in monitor
-                    logger.error(f"Web3 connection monitor error: {e}")
-                time.sleep(interval)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        t = threading.Thread(target=monitor, daemon=True)
-        t.start()
-        logger.info("Started Web3 connection monitor thread")
+        if loop is None:
+            def monitor():
+                while not self._monitor_stop.is_set():
+                    self._check_connection()
+                    self._monitor_stop.wait(interval)
+
+            self._monitor_stop.clear()
+            t = threading.Thread(target=monitor, daemon=True)
+            t.start()
+            logger.info("Started Web3 connection monitor thread")
+            return
+
+        # A task left over from another event loop cannot be awaited or cancelled from this one
+        if self._monitor_task is None or self._monitor_task.done() or self._monitor_task.get_loop() is not loop:
+            self._monitor_task = loop.create_task(self._monitor(interval))
+            logger.info("Started Web3 connection monitor task")
+
+    async def _monitor(self, interval: int):
+        """Check the connection every interval seconds, running the blocking RPC probe off the loop."""
+        while True:
+            await asyncio.to_thread(self._check_connection)
+            await asyncio.sleep(interval)
+
+    def _check_connection(self):
+        """Probe the selected endpoint once, failing over if it is unreachable."""
+        try:
+            web3 = self.get_web3()
+            if not web3.is_connected():
+                logger.warning("Web3 connection lost, attempting failover")
+                record_rpc_connection_error() # Connection lost
+                self._failover_and_reconnect()
+        except Exception as e:
+            record_rpc_connection_error() # Error in monitor
+            logger.error("Web3 connection monitor error: %s", e)
+
+    def stop_monitoring(self):
+        """Stop the connection monitor task or thread."""
+        self._monitor_stop.set()
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        logger.info("Stopped Web3 connection monitor")
 
     def get_active_rpc_url(self) -> Optional[str]:
         """Return the currently active RPC URL."""
@@ -197,9 +566,34 @@ class Web3Provider:
 
     def get_chain_id(self) -> Optional[int]:
         """Return the current chain ID, if available."""
-        web3 = self.get_web3()
         try:
-            return web3.eth.chain_id
+            return self._cached_read("eth_chainId", CHAIN_ID_TTL, lambda web3: web3.eth.chain_id)
+        except Exception as e:
+            logger.error("Failed to get chain ID: %s", e)
+            return None
+
+    def get_gas_price(self) -> int:
+        """Return the network gas price in wei, reused for GAS_PRICE_TTL seconds."""
+        try:
+            return self._cached_read("eth_gasPrice", GAS_PRICE_TTL, lambda web3: web3.eth.gas_price)
         except Exception as e:
-            logger.error(f"Failed to get chain ID: {e}")
-            return None
\ No newline at end of file
+            logger.error("Failed to get gas price: %s", e)
+            raise Web3ProviderError(f"Failed to get gas price: {e}")
+
+    def _cached_read(self, method: str, ttl: float, call: Callable[[Web3], Any]) -> Any:
+        """
+        Run an idempotent read through _execute, serving it from the per-endpoint
+        read cache while the previous result is younger than ttl.
+        """
+        key = (self._pick_endpoint(), method)
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._read_cache.move_to_end(key)
+            return entry[1]
+        value = self._execute(call)
+        key = (self.active_rpc_url, method)
+        self._read_cache[key] = (time.monotonic() + ttl, value)
+        self._read_cache.move_to_end(key)
+        if len(self._read_cache) > READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        return value
\ No newline at end of file
@@ -8,4 +8,104 @@ Handles real-time wallet communication, including:
 - Error and alert broadcasting
 
 Enables live, bidirectional communication for wallet operations.
-"""
\ No newline at end of file
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Outbound messages queued within FLUSH_INTERVAL seconds of each other share one frame,
+# up to MAX_BATCH_MESSAGES messages per frame
+FLUSH_INTERVAL = 0.001
+MAX_BATCH_MESSAGES = 64
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+class WebSocketHandler:
+    """
+    Exchanges wallet messages with a client over one WebSocket connection.
+
+    Messages are batched in both directions: every frame carries a JSON array of
+    messages. send() only enqueues; a drain task flushes the queue as one frame per
+    FLUSH_INTERVAL or per MAX_BATCH_MESSAGES messages, whichever comes first.
+    Inbound frames are unpacked and each message is passed to the handler in order.
+    """
+
+    def __init__(self, websocket: Any, on_message: Callable[[Any], Optional[Awaitable[None]]]):
+        """
+        :param websocket: Open connection exposing ``await send(str)`` and async iteration
+            over received frames (e.g. a ``websockets`` protocol).
+        :param on_message: Called with each received message; may be a coroutine function.
+        """
+        self.websocket = websocket
+        self.on_message = on_message
+        self._outbound: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    def send(self, message: Any) -> None:
+        """Queue a JSON-serializable message for the next outbound batch."""
+        self._outbound.put_nowait(message)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been written to the socket."""
+        if self._drain_task is not None:
+            await self._drain_task
+
+    async def _drain(self) -> None:
+        """
+        Collect queued messages until FLUSH_INTERVAL elapses or the batch is full, then
+        write them as one frame. Exits once the queue is empty; send() restarts it on demand.
+        """
+        loop = asyncio.get_running_loop()
+        while not self._outbound.empty():
+            batch = [self._outbound.get_nowait()]
+            deadline = loop.time() + FLUSH_INTERVAL
+            while len(batch) < MAX_BATCH_MESSAGES:
+                if not self._outbound.empty():
+                    batch.append(self._outbound.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._outbound.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.websocket.send(_dumps(batch))
+            except Exception as e:
+                logger.error(f"Failed to send batch of {len(batch)} WebSocket messages: {e}")
+
+    async def receive_forever(self) -> None:
+        """Dispatch every message of every received frame until the connection closes."""
+        async for frame in self.websocket:
+            try:
+                payload = _loads(frame)
+            except ValueError as e:
+                logger.warning(f"Dropping malformed WebSocket frame: {e}")
+                continue
+            # A bare object is accepted as a batch of one
+            messages = payload if isinstance(payload, list) else (payload,)
+            for message in messages:
+                try:
+                    result = self.on_message(message)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Error handling WebSocket message: {e}")
@@ -6,16 +6,105 @@ distributing alerts, and reporting compliance events.
 
 import json
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 try:
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
+    from aiokafka.errors import ConsumerStoppedError
 except ImportError:
     AIOKafkaProducer = None
     AIOKafkaConsumer = None
+    ConsumerStoppedError = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import lz4  # noqa: F401 - enables lz4 compression in aiokafka
+    COMPRESSION_TYPE = "lz4"
+except ImportError:
+    COMPRESSION_TYPE = None
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Producer batching defaults: wait up to LINGER_MS to fill batches of up to MAX_BATCH_SIZE bytes
+LINGER_MS = 20
+MAX_BATCH_SIZE = 65536
+# Batched consumption: wait up to FETCH_TIMEOUT_MS for up to FETCH_MAX_RECORDS messages
+FETCH_TIMEOUT_MS = 50
+FETCH_MAX_RECORDS = 500
+# Payload encodings a KafkaIntegration can use; every producer and consumer of a topic must agree
+WIRE_FORMATS = ("json", "msgpack")
+# Risk events waiting for the batch loop before publishers are made to wait
+RISK_QUEUE_SIZE = 10000
+# Most queued risk events coalesced into a single send_batch call
+RISK_BATCH_MAX = 500
+
+def _json_default(value: Any) -> Any:
+    """
+    Encode event Structs as JSON objects; Decimal and other unknown types fall back to str.
+    """
+    if msgspec is not None and isinstance(value, msgspec.Struct):
+        return msgspec.structs.asdict(value)
+    return str(value)
+
+if orjson is not None:
+    # orjson emits bytes directly
+    def serialize_value(value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, default=_json_default)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits, which wei amounts can exceed
+            return json.dumps(value, default=_json_default).encode('utf-8')
+    deserialize_value = orjson.loads
+else:
+    def serialize_value(value: Any) -> bytes:
+        return json.dumps(value, default=_json_default).encode('utf-8')
+
+    def deserialize_value(raw: bytes) -> Any:
+        return json.loads(raw.decode('utf-8'))
+
+if msgspec is not None:
+    # Typed event payloads. In the msgpack wire format they encode as compact positional
+    # arrays; in JSON they are sent as ordinary objects. Plain dicts remain accepted.
+    class RiskEvent(msgspec.Struct, array_like=True, gc=False):
+        ts: float
+        kind: str
+        symbol: str
+        metric: str
+        value: float
+        meta: Dict[str, str] = {}
+
+    class AlertEvent(msgspec.Struct, array_like=True, gc=False):
+        ts: float
+        severity: str
+        symbol: str
+        message: str
+        meta: Dict[str, str] = {}
+
+    class ComplianceEvent(msgspec.Struct, array_like=True, gc=False):
+        ts: float
+        kind: str
+        account: str
+        rule: str
+        meta: Dict[str, str] = {}
+
+    class PositionUpdate(msgspec.Struct, array_like=True, gc=False):
+        ts: float
+        symbol: str
+        quantity: float
+        price: float
+        meta: Dict[str, str] = {}
+
+    # Unknown types are sent as str, matching the JSON encoding
+    _msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=str)
+    # Only position updates are consumed: arrays decode straight into PositionUpdate, maps stay dicts
+    _msgpack_decoder = msgspec.msgpack.Decoder(Union[PositionUpdate, Dict[str, Any]])
+
 class KafkaIntegration:
     """
     Integrates the risk management service with Kafka for event-driven communication.
@@ -26,16 +115,45 @@ class KafkaIntegration:
     - Reports compliance events
     """
     
-    def __init__(self, bootstrap_servers: str = "localhost:9092"):
+    def __init__(
+        self,
+        bootstrap_servers: str = "localhost:9092",
+        wire_format: str = "json",
+        linger_ms: int = LINGER_MS,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
         """
         Initialize Kafka producer and consumer.
         
         Args:
             bootstrap_servers (str): Kafka bootstrap servers address.
+            wire_format (str): Payload encoding, "json" or "msgpack" (requires msgspec).
+                Consumers of these topics must be switched to the same format together.
+            linger_ms (int): How long the producer waits to fill a batch before sending.
+            max_batch_size (int): Upper bound in bytes of a producer batch per partition.
         """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: {wire_format}")
+        if wire_format == "msgpack" and msgspec is None:
+            raise RuntimeError("msgspec library not installed; msgpack wire format unavailable")
         self.bootstrap_servers = bootstrap_servers
+        self.wire_format = wire_format
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        if wire_format == "msgpack":
+            self._serialize = _msgpack_encoder.encode
+            self._deserialize = _msgpack_decoder.decode
+        else:
+            self._serialize = serialize_value
+            self._deserialize = deserialize_value
         self.producer = None
         self.consumer = None
+        self._consuming = False
+        self._risk_queue: asyncio.Queue = asyncio.Queue(maxsize=RISK_QUEUE_SIZE)
+        self._batch_task: Optional[asyncio.Task] = None
+        # Loop the batch task runs on, cached so publishes skip the per-event lookup
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_partition = 0
         self.topics = {
             "risk": "risk-events",
             "alert": "alert-events",
@@ -56,18 +174,30 @@ class KafkaIntegration:
         try:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8')
+                value_serializer=self._serialize,
+                linger_ms=self.linger_ms,
+                max_batch_size=self.max_batch_size,
+                compression_type=COMPRESSION_TYPE,
+                acks=1,
             )
             await self.producer.start()
+            self._loop = asyncio.get_running_loop()
+            self._batch_task = asyncio.create_task(self._batch_loop())
             logger.info("Kafka producer started successfully.")
         except Exception as e:
-            logger.error(f"Failed to start Kafka producer: {e}")
+            logger.error("Failed to start Kafka producer: %s", e)
             raise
     
     async def stop(self):
         """
         Stop Kafka producer and consumer if initialized.
         """
+        self._consuming = False
+        if self._batch_task is not None:
+            # Let queued risk events reach the producer before it is stopped
+            await self._risk_queue.join()
+            self._batch_task.cancel()
+            self._batch_task = None
         if self.producer:
             await self.producer.stop()
             logger.info("Kafka producer stopped.")
@@ -75,28 +205,158 @@ class KafkaIntegration:
             await self.consumer.stop()
             logger.info("Kafka consumer stopped.")
     
-    async def publish_risk_event(self, event_data: Dict[str, Any]):
+    async def publish_risk_event(self, event_data: Union["RiskEvent", Dict[str, Any]], wait: bool = False) -> asyncio.Future:
         """
         Publish a risk event to the risk-events Kafka topic.
+
+        Events are queued for the batch loop, which coalesces concurrent publishes into one
+        send_batch call; the queue is bounded, so publishers wait when it is full.
         
         Args:
-            event_data (Dict[str, Any]): Risk event data to be published.
+            event_data (Union[RiskEvent, Dict[str, Any]]): Risk event to be published.
+            wait (bool): Await broker acknowledgement before returning.
+
+        Returns:
+            asyncio.Future: Delivery future resolving to the record metadata.
+        """
+        if self._batch_task is None:
+            return await self._publish("risk", event_data, wait, "risk event")
+        future = self._loop.create_future()
+        await self._risk_queue.put((event_data, future))
+        if wait:
+            await future
+        return future
+
+    async def _batch_loop(self) -> None:
+        """
+        Drain queued risk events and publish them in batches of up to RISK_BATCH_MAX.
+        """
+        while True:
+            items = [await self._risk_queue.get()]
+            while len(items) < RISK_BATCH_MAX and not self._risk_queue.empty():
+                items.append(self._risk_queue.get_nowait())
+            try:
+                await self._send_risk_batch(items)
+            finally:
+                for _ in items:
+                    self._risk_queue.task_done()
+
+    async def _send_risk_batch(self, items) -> None:
+        """
+        Encode queued risk events into producer batches and hand them to the producer.
+        Partitions are chosen round-robin per batch since batches carry no keys.
+
+        Events are encoded and failed one at a time. If handing a batch to the producer fails,
+        only events not yet handed over are failed; earlier batches resolve from their delivery.
+        """
+        topic = self.topics["risk"]
+        handed_over = set()
+        try:
+            partitions = sorted(await self.producer.partitions_for(topic))
+            batch, pending = self.producer.create_batch(), []
+            for data, future in items:
+                try:
+                    value = self._serialize(data)
+                except Exception as e:
+                    logger.error("Failed to encode risk event: %s", e)
+                    self._fail_quietly(future, e)
+                    continue
+                if batch.append(key=None, value=value, timestamp=None) is None:
+                    if pending:
+                        await self._send_batch(topic, partitions, batch, pending)
+                        handed_over.update(pending)
+                        batch, pending = self.producer.create_batch(), []
+                    if batch.append(key=None, value=value, timestamp=None) is None:
+                        self._fail_quietly(future, ValueError("Risk event exceeds the maximum batch size"))
+                        continue
+                pending.append(future)
+            if pending:
+                await self._send_batch(topic, partitions, batch, pending)
+        except Exception as e:
+            logger.error("Failed to publish risk event batch: %s", e)
+            for _, future in items:
+                if future not in handed_over:
+                    self._fail_quietly(future, e)
+
+    async def _send_batch(self, topic: str, partitions, batch, futures) -> None:
+        """
+        Send one closed batch and resolve its events' futures from the delivery result.
+        """
+        partition = partitions[self._next_partition % len(partitions)]
+        self._next_partition += 1
+        delivery = await self.producer.send_batch(batch, topic, partition=partition)
+
+        def resolve(done: asyncio.Future) -> None:
+            self._log_delivery_failure("risk event batch", topic, done)
+            for future in futures:
+                if future.done():
+                    continue
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    self._fail_quietly(future, done.exception())
+                else:
+                    future.set_result(done.result())
+
+        delivery.add_done_callback(resolve)
+
+    @staticmethod
+    def _fail_quietly(future: asyncio.Future, error: BaseException) -> None:
+        """
+        Fail an event future whose error has already been logged for its whole batch.
+        """
+        if future.done():
+            return
+        future.set_exception(error)
+        # Mark the exception retrieved; unawaited fire-and-forget futures would warn otherwise
+        future.exception()
+
+    async def _publish(self, event_type: str, data: Any, wait: bool, description: str) -> asyncio.Future:
+        """
+        Hand an event to the producer's batch accumulator.
+
+        Without ``wait`` the broker round-trip is not awaited, so later events can join the
+        same batch; delivery failures are logged from the future's done-callback instead.
         """
         if self.producer is None:
             logger.error("Kafka producer not initialized")
             raise RuntimeError("Kafka producer not initialized")
-            
-        topic = self.topics["risk"]
+
+        topic = self.topics[event_type]
         try:
-            await self.producer.send_and_wait(topic, event_data)
-            logger.info(f"Published risk event to {topic}")
+            future = await self.producer.send(topic, data)
+            if wait:
+                await future
+                # Per-event confirmation is debug-level and lazily formatted; it sits on the hot path
+                logger.debug("Published %s to %s", description, topic)
+            else:
+                future.add_done_callback(lambda f: self._log_delivery_failure(description, topic, f))
+            return future
         except Exception as e:
-            logger.error(f"Failed to publish risk event to {topic}: {e}")
+            logger.error("Failed to publish %s to %s: %s", description, topic, e)
             raise
+
+    @staticmethod
+    def _log_delivery_failure(description: str, topic: str, future: asyncio.Future) -> None:
+        """
+        Done-callback for fire-and-forget sends; surfaces delivery errors in the log.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Failed to publish %s to %s: %s", description, topic, future.exception())
+
+    async def flush(self) -> None:
+        """
+        Wait until every event handed to the producer has been delivered.
+        """
+        if self.producer is not None:
+            await self.producer.flush()
     
     async def subscribe_position_updates(self, callback):
         """
         Subscribe to position update events from Kafka.
+
+        Messages are fetched in batches with getmany(). Each partition's messages are handled
+        in order, while different partitions are processed concurrently.
         
         Args:
             callback: Function to process incoming position update messages.
@@ -110,19 +370,32 @@ class KafkaIntegration:
             self.consumer = AIOKafkaConsumer(
                 topic,
                 bootstrap_servers=self.bootstrap_servers,
-                value_deserializer=lambda v: json.loads(v.decode('utf-8'))
+                value_deserializer=self._deserialize
             )
             await self.consumer.start()
-            logger.info(f"Subscribed to topic: {topic}")
+            logger.info("Subscribed to topic: %s", topic)
             
-            async for msg in self.consumer:
-                try:
-                    await callback(msg.value)
-                except Exception as e:
-                    logger.error(f"Error processing message from {msg.topic}: {e}")
+            self._consuming = True
+            while self._consuming:
+                batches = await self.consumer.getmany(timeout_ms=FETCH_TIMEOUT_MS, max_records=FETCH_MAX_RECORDS)
+                if batches:
+                    await asyncio.gather(*(self._process_partition(messages, callback) for messages in batches.values()))
+        except ConsumerStoppedError:
+            logger.info("Consumer for topic %s stopped.", topic)
         except Exception as e:
-            logger.error(f"Failed to subscribe to topic {topic}: {e}")
+            logger.error("Failed to subscribe to topic %s: %s", topic, e)
             raise
+
+    @staticmethod
+    async def _process_partition(messages, callback) -> None:
+        """
+        Run the callback for one partition's batch in offset order, logging failures.
+        """
+        for msg in messages:
+            try:
+                await callback(msg.value)
+            except Exception as e:
+                logger.error("Error processing message from %s: %s", msg.topic, e)
     
     async def process_trade_validation_event(self, event_data: Dict[str, Any]):
         """
@@ -132,44 +405,33 @@ class KafkaIntegration:
         Args:
             event_data (Dict[str, Any]): Trade validation event data.
         """
-        logger.info(f"Processing trade validation event: {event_data}")
+        logger.info("Processing trade validation event: %s", event_data)
         # Placeholder for actual processing logic
         pass
     
-    async def distribute_alert(self, alert_data: Dict[str, Any]):
+    async def distribute_alert(self, alert_data: Union["AlertEvent", Dict[str, Any]], wait: bool = False) -> asyncio.Future:
         """
         Distribute alerts via Kafka to relevant consumers.
         
         Args:
-            alert_data (Dict[str, Any]): Alert data to be distributed.
+            alert_data (Union[AlertEvent, Dict[str, Any]]): Alert to be distributed.
+            wait (bool): Await broker acknowledgement before returning.
+
+        Returns:
+            asyncio.Future: Delivery future resolving to the record metadata.
         """
-        if self.producer is None:
-            logger.error("Kafka producer not initialized")
-            raise RuntimeError("Kafka producer not initialized")
-            
-        topic = self.topics["alert"]
-        try:
-            await self.producer.send_and_wait(topic, alert_data)
-            logger.info(f"Distributed alert to {topic}")
-        except Exception as e:
-            logger.error(f"Failed to distribute alert to {topic}: {e}")
-            raise
+        return await self._publish("alert", alert_data, wait, "alert")
     
-    async def report_compliance_event(self, event_data: Dict[str, Any]):
+    async def report_compliance_event(self, event_data: Union["ComplianceEvent", Dict[str, Any]], wait: bool = True) -> asyncio.Future:
         """
         Report compliance events to Kafka for audit and monitoring.
+        Waits for broker acknowledgement by default so audit records are confirmed durable.
         
         Args:
-            event_data (Dict[str, Any]): Compliance event data to be reported.
+            event_data (Union[ComplianceEvent, Dict[str, Any]]): Compliance event to be reported.
+            wait (bool): Await broker acknowledgement before returning.
+
+        Returns:
+            asyncio.Future: Delivery future resolving to the record metadata.
         """
-        if self.producer is None:
-            logger.error("Kafka producer not initialized")
-            raise RuntimeError("Kafka producer not initialized")
-            
-        topic = self.topics["compliance"]
-        try:
-            await self.producer.send_and_wait(topic, event_data)
-            logger.info(f"Reported compliance event to {topic}")
-        except Exception as e:
-            logger.error(f"Failed to report compliance event to {topic}: {e}")
-            raise
\ No newline at end of file
+        return await self._publish("compliance", event_data, wait, "compliance event")
\ No newline at end of file
@@ -5,6 +5,57 @@ Calculates multi-asset portfolio risk, manages correlation matrices, runs stress
 performs Monte Carlo simulations, and conducts risk attribution analysis.
 """
 
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from .risk_calculator import _as_float_array
+
+# Simulations drawn per NumPy chunk when numba is unavailable, bounding the normals held in memory
+MC_CHUNK_SIMS = 256
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_pnl(weights, mean, chol, num_sims, horizon, seed):
+        """
+        Simulate portfolio P&L paths in parallel, one path per iteration, without
+        materializing the (sims x horizon x assets) tensor of draws.
+        """
+        if seed >= 0:
+            np.random.seed(seed)
+        n = weights.shape[0]
+        pnl = np.empty(num_sims)
+        for i in prange(num_sims):
+            cum = np.zeros(n)
+            for _ in range(horizon):
+                z = np.random.standard_normal(n)
+                # chol is lower triangular; an explicit loop avoids numba's BLAS (scipy) dependency
+                for a in range(n):
+                    step = mean[a]
+                    for b in range(a + 1):
+                        step += chol[a, b] * z[b]
+                    cum[a] += step
+            total = 0.0
+            for a in range(n):
+                total += weights[a] * (np.exp(cum[a]) - 1.0)
+            pnl[i] = total
+        return pnl
+else:
+    def _mc_pnl(weights, mean, chol, num_sims, horizon, seed):
+        """
+        NumPy fallback for the numba kernel, simulating MC_CHUNK_SIMS paths at a time.
+        """
+        rng = np.random.default_rng(seed if seed >= 0 else None)
+        pnl = np.empty(num_sims)
+        for start in range(0, num_sims, MC_CHUNK_SIMS):
+            count = min(MC_CHUNK_SIMS, num_sims - start)
+            draws = rng.standard_normal((count, horizon, weights.shape[0]))
+            cum = (draws @ chol.T).sum(axis=1) + horizon * mean
+            pnl[start:start + count] = np.expm1(cum) @ weights
+        return pnl
+
 class PortfolioRisk:
     """
     Provides portfolio-level risk analytics and modeling.
@@ -19,6 +70,10 @@ class PortfolioRisk:
         Initialize the PortfolioRisk with configuration parameters.
         """
         self.config = config
+        # Running co-moments of asset returns (Welford), sized on the first sample
+        self._n = 0
+        self._mean = None
+        self._M2 = None
 
     def calculate_portfolio_risk(self, portfolio):
         """
@@ -26,11 +81,72 @@ class PortfolioRisk:
         """
         raise NotImplementedError("Portfolio risk calculation not yet implemented.")
 
+    def update(self, new_returns):
+        """
+        Fold one period of asset returns into the running co-moments in O(N^2).
+
+        Args:
+            new_returns (numpy.ndarray): Returns for each asset this period, shape (N,).
+        """
+        x = _as_float_array("new_returns", new_returns, 1)
+        self._ensure_moments(x.shape[0])
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._M2 += np.outer(delta, x - self._mean)
+
     def update_correlation_matrix(self, positions):
         """
         Update and manage the correlation matrix for current positions.
+
+        A block of returns is merged into the running co-moments in one step (Chan et al.),
+        so no return history is kept or rescanned.
+
+        Args:
+            positions (numpy.ndarray): New asset returns, shape (N,) or (T, N).
+
+        Returns:
+            numpy.ndarray: Updated correlation matrix, shape (N, N).
+        """
+        if isinstance(positions, np.ndarray) and positions.ndim == 1:
+            self.update(positions)
+            return self.correlation_matrix()
+        block = _as_float_array("positions", positions, 2)
+        count = block.shape[0]
+        if count:
+            self._ensure_moments(block.shape[1])
+            block_mean = block.mean(axis=0)
+            centered = block - block_mean
+            total = self._n + count
+            delta = block_mean - self._mean
+            self._M2 += centered.T @ centered + np.outer(delta, delta) * (self._n * count / total)
+            self._mean += delta * (count / total)
+            self._n = total
+        return self.correlation_matrix()
+
+    def correlation_matrix(self):
+        """
+        Return the correlation matrix of all returns seen so far.
+        Assets with zero variance are reported as uncorrelated with everything else.
+        """
+        if self._n < 2:
+            raise ValueError("At least two return observations are required")
+        cov = self._M2 / (self._n - 1)
+        std = np.sqrt(np.diag(cov))
+        inv_std = np.divide(1.0, std, out=np.zeros_like(std), where=std > 0)
+        corr = cov * inv_std[:, None] * inv_std[None, :]
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    def _ensure_moments(self, num_assets):
+        """
+        Allocate the co-moment buffers on first use and check later samples match their size.
         """
-        raise NotImplementedError("Correlation matrix management not yet implemented.")
+        if self._mean is None:
+            self._mean = np.zeros(num_assets)
+            self._M2 = np.zeros((num_assets, num_assets))
+        elif self._mean.shape[0] != num_assets:
+            raise ValueError(f"Expected returns for {self._mean.shape[0]} assets, got {num_assets}")
 
     def run_stress_tests(self, portfolio, scenarios):
         """
@@ -38,11 +154,47 @@ class PortfolioRisk:
         """
         raise NotImplementedError("Stress testing not yet implemented.")
 
-    def monte_carlo_simulation(self, portfolio, num_simulations=1000):
+    def monte_carlo_simulation(self, weights, returns, num_simulations=1000, horizon=1,
+                               confidence_level=0.95, seed=None):
         """
         Perform Monte Carlo simulations for risk estimation.
+
+        Asset log-returns are simulated as correlated Gaussian steps fitted to the historical
+        returns; the Cholesky factor is computed once here and only the path loop runs in the
+        numba kernel (or its chunked NumPy fallback when numba is not installed).
+
+        Args:
+            weights (numpy.ndarray): Position weights, shape (N,).
+            returns (numpy.ndarray): Historical asset log-returns, shape (T, N), T >= 2.
+            num_simulations (int): Number of simulated paths.
+            horizon (int): Number of periods per path.
+            confidence_level (float): Confidence level for VaR (e.g., 0.95 for 95%).
+            seed (Optional[int]): Random seed. Only the NumPy fallback is fully reproducible,
+                since numba's parallel threads keep independent generator states.
+
+        Returns:
+            float: Monte Carlo Value at Risk as a non-negative loss, in the units of the weights.
         """
-        raise NotImplementedError("Monte Carlo simulation not yet implemented.")
+        if num_simulations < 1 or horizon < 1:
+            raise ValueError("num_simulations and horizon must be positive")
+        if not 0 < confidence_level < 1:
+            raise ValueError(f"confidence_level must be between 0 and 1, got {confidence_level}")
+        weights = _as_float_array("weights", weights, 1)
+        returns = _as_float_array("returns", returns, 2)
+        if returns.shape[1] != weights.shape[0]:
+            raise ValueError(f"returns has {returns.shape[1]} assets but weights has {weights.shape[0]}")
+        if returns.shape[0] < 2:
+            raise ValueError("At least two return observations are required")
+
+        mean = returns.mean(axis=0)
+        cov = np.atleast_2d(np.cov(returns, rowvar=False))
+        # A small ridge keeps the factorization stable for (near-)singular covariances
+        ridge = 1e-12 * max(float(np.trace(cov)), 1.0)
+        chol = np.linalg.cholesky(cov + ridge * np.eye(cov.shape[0]))
+        pnl = _mc_pnl(weights, mean, np.ascontiguousarray(chol), num_simulations, horizon,
+                      -1 if seed is None else seed)
+        var = -np.percentile(pnl, (1.0 - confidence_level) * 100)
+        return max(float(var), 0.0)
 
     def risk_attribution(self, portfolio):
         """
@@ -5,6 +5,26 @@ Provides Value-at-Risk (VaR) calculations, Expected Shortfall (ES) metrics, corr
 volatility-based risk scoring, and liquidity risk assessment for portfolio and trade evaluation.
 """
 
+from statistics import NormalDist
+
+import numpy as np
+
+# VaR methods supported by RiskCalculator.calculate_var
+VAR_METHODS = ("historical", "parametric")
+
+
+def _as_float_array(name, values, ndim):
+    """
+    Check a risk input is a float64 ndarray of the expected rank, returning it C-contiguous.
+    Python containers (e.g. lists of position dicts) are rejected rather than converted per call.
+    """
+    if not isinstance(values, np.ndarray):
+        raise TypeError(f"{name} must be a numpy.ndarray, got {type(values).__name__}")
+    if values.ndim != ndim:
+        raise ValueError(f"{name} must be {ndim}-dimensional, got shape {values.shape}")
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
 class RiskCalculator:
     """
     Performs quantitative risk calculations for the risk management service.
@@ -19,11 +39,45 @@ class RiskCalculator:
         """
         self.config = config
 
-    def calculate_var(self, portfolio, confidence_level=0.95):
+    def calculate_var(self, weights, returns, confidence_level=0.95, method="historical"):
         """
         Calculate Value-at-Risk (VaR) for the given portfolio.
+
+        The portfolio is given column-wise: one weight per asset and a matrix of historical
+        returns with one row per period and one column per asset, so the whole calculation
+        is a handful of vectorized NumPy operations.
+
+        Args:
+            weights (numpy.ndarray): Position weights, shape (N,).
+            returns (numpy.ndarray): Historical asset returns, shape (T, N).
+            confidence_level (float): Confidence level for VaR (e.g., 0.95 for 95%).
+            method (str): "historical" simulation or "parametric" (variance-covariance).
+
+        Returns:
+            float: Value at Risk as a non-negative loss, in the units of the weights.
         """
-        raise NotImplementedError("VaR calculation not yet implemented.")
+        if method not in VAR_METHODS:
+            raise ValueError(f"Unknown VaR method: {method}")
+        if not 0 < confidence_level < 1:
+            raise ValueError(f"confidence_level must be between 0 and 1, got {confidence_level}")
+        weights = _as_float_array("weights", weights, 1)
+        returns = _as_float_array("returns", returns, 2)
+        if returns.shape[1] != weights.shape[0]:
+            raise ValueError(f"returns has {returns.shape[1]} assets but weights has {weights.shape[0]}")
+        if returns.shape[0] == 0:
+            return 0.0
+
+        if method == "historical":
+            pnl = returns @ weights
+            var = -np.quantile(pnl, 1.0 - confidence_level)
+        else:
+            if returns.shape[0] < 2:
+                return 0.0
+            cov = np.atleast_2d(np.cov(returns, rowvar=False))
+            sigma = np.sqrt(weights @ cov @ weights)
+            mean = returns.mean(axis=0) @ weights
+            var = NormalDist().inv_cdf(confidence_level) * sigma - mean
+        return max(float(var), 0.0)
 
     def calculate_expected_shortfall(self, portfolio, confidence_level=0.95):
         """
@@ -173,7 +173,7 @@ class TestMetamaskSecurityIntegration:
         assert response.status_code == 200
         assert response.json()["status"] == "prepared"
 
-    @patch('src.services.metamask_integration.browser_controller.async_playwright')
+    @patch('playwright.async_api.async_playwright')
     async def test_browser_automation_security_integration(self, mock_playwright, browser_controller, valid_session):
         """Test browser automation with complete security validation."""
         session_token, user_id = valid_session
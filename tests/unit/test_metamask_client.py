@@ -0,0 +1,102 @@
+"""Unit tests for the MetaMask client's JSON-RPC transport, driven by a fake provider."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.services.metamask_integration.metamask_client import (
+    EthereumProvider,
+    MetaMaskClient,
+    ProviderRpcError,
+)
+from src.execution.decentralized_execution.wallet_provider import WalletEvent
+
+ACCOUNT = "0x1234567890abcdef1234567890abcdef12345678"
+
+
+class FakeProvider(EthereumProvider):
+    """Answers JSON-RPC requests from a fixed table and records every payload sent."""
+
+    def __init__(self, results):
+        self.results = results
+        self.payloads = []
+
+    async def send_raw(self, payload: bytes) -> bytes:
+        request = json.loads(payload)
+        self.payloads.append(request)
+        requests = request if isinstance(request, list) else [request]
+        responses = []
+        for call in requests:
+            result = self.results[call["method"]]
+            if isinstance(result, ProviderRpcError):
+                responses.append({"jsonrpc": "2.0", "id": call["id"],
+                                  "error": {"code": result.code, "message": result.message}})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": result})
+        return json.dumps(responses if isinstance(request, list) else responses[0]).encode()
+
+
+def test_client_without_provider_is_unavailable():
+    """Given no provider, when the client is created, then it reports unavailable."""
+    client = MetaMaskClient()
+    assert client.is_available is False
+    assert client.get_accounts() == []
+
+
+def test_request_accounts_goes_through_provider():
+    """Given a provider, when accounts are requested, then they are fetched and cached for get_accounts."""
+    provider = FakeProvider({"eth_accounts": [ACCOUNT]})
+    client = MetaMaskClient({"provider": provider})
+    assert client.is_available is True
+
+    assert asyncio.run(client.request_accounts()) == [ACCOUNT]
+    assert client.get_accounts() == [ACCOUNT]
+    assert [call["method"] for call in provider.payloads[0]] == ["eth_accounts"]
+
+
+def test_concurrent_requests_share_one_batch():
+    """Given concurrent calls, when dispatched, then they are sent as a single batch request."""
+    provider = FakeProvider({"eth_accounts": [ACCOUNT], "eth_chainId": "0x89"})
+    client = MetaMaskClient({"provider": provider})
+
+    async def run():
+        return await asyncio.gather(client.request_accounts(), client.request_chain_id())
+
+    assert asyncio.run(run()) == [[ACCOUNT], 137]
+    assert len(provider.payloads) == 1
+    assert sorted(call["method"] for call in provider.payloads[0]) == ["eth_accounts", "eth_chainId"]
+
+
+def test_chain_id_is_refetched_after_chain_change():
+    """Given a known chain, when CHAIN_CHANGED is emitted, then the next query asks the provider again."""
+    provider = FakeProvider({"eth_chainId": "0x1"})
+    client = MetaMaskClient({"provider": provider})
+
+    async def run():
+        assert await client.request_chain_id() == 1
+        assert await client.request_chain_id() == 1
+        assert len(provider.payloads) == 1
+
+        provider.results["eth_chainId"] = "0xa"
+        client.emit(WalletEvent.CHAIN_CHANGED, "0xa")
+        assert await client.request_chain_id() == 10
+
+    asyncio.run(run())
+
+
+def test_provider_error_is_raised():
+    """Given a provider error response, when accounts are requested, then ProviderRpcError is raised."""
+    provider = FakeProvider({"eth_accounts": ProviderRpcError(4100, "Unauthorized")})
+    client = MetaMaskClient({"provider": provider})
+    with pytest.raises(ProviderRpcError) as exc_info:
+        asyncio.run(client.request_accounts())
+    assert exc_info.value.code == 4100
+
+
+def test_malformed_account_is_rejected():
+    """Given a malformed address from the provider, when accounts are requested, then ValueError is raised."""
+    client = MetaMaskClient({"provider": FakeProvider({"eth_accounts": ["0xnothex"]})})
+    with pytest.raises(ValueError):
+        asyncio.run(client.request_accounts())
+    assert client.get_accounts() == []
@@ -6,6 +6,9 @@ import numpy as np
 from unittest.mock import patch, MagicMock
 
 from src.risk_management.risk_manager import RiskManager
+from src.services.risk_management import portfolio_risk
+from src.services.risk_management.portfolio_risk import PortfolioRisk
+from src.services.risk_management.risk_calculator import RiskCalculator
 
 
 class TestRiskManager:
@@ -192,4 +195,106 @@ class TestRiskManager:
         """Test circuit breaker when drawdown exceeds threshold"""
         # 15% drawdown, above 10% threshold
         result = risk_manager.check_circuit_breaker(current_value=85000, peak_value=100000)
-        assert result is True
\ No newline at end of file
+        assert result is True
+
+
+class TestRiskCalculator:
+    """Test suite for the risk service's RiskCalculator"""
+    
+    @pytest.fixture
+    def calculator(self):
+        """Create a RiskCalculator instance for testing"""
+        return RiskCalculator(config={})
+    
+    def test_historical_var(self, calculator):
+        """Test historical VaR against a hand-computed quantile"""
+        weights = np.array([0.5, 0.5])
+        returns = np.array([
+            [-0.04, -0.02],
+            [0.01, 0.03],
+            [-0.02, 0.00],
+            [0.02, 0.02],
+            [0.00, 0.02],
+            [0.05, -0.01],
+        ])
+        # Portfolio P&L sorted: -0.03, -0.01, 0.01, 0.02, 0.02, 0.02; the 20% quantile
+        # falls exactly on the second observation
+        var = calculator.calculate_var(weights, returns, confidence_level=0.8)
+        assert var == pytest.approx(0.01)
+    
+    def test_parametric_var(self, calculator):
+        """Test parametric VaR for a single zero-mean asset"""
+        returns = np.array([[0.01], [-0.01], [0.02], [-0.02]])
+        var = calculator.calculate_var(np.array([1.0]), returns, confidence_level=0.95, method="parametric")
+        # z(0.95) times the sample standard deviation
+        assert var == pytest.approx(1.6448536269514722 * np.sqrt(0.001 / 3))
+    
+    def test_var_with_empty_returns(self, calculator):
+        """Test VaR with no history"""
+        assert calculator.calculate_var(np.array([1.0]), np.empty((0, 1))) == 0.0
+    
+    def test_var_input_checks(self, calculator):
+        """Test that malformed inputs are rejected at the boundary"""
+        returns = np.zeros((5, 2))
+        with pytest.raises(TypeError):
+            calculator.calculate_var([0.5, 0.5], returns)
+        with pytest.raises(TypeError):
+            calculator.calculate_var(np.array([0.5, 0.5]), [{"BTC": 0.01, "ETH": 0.02}])
+        with pytest.raises(ValueError):
+            calculator.calculate_var(np.array([[0.5, 0.5]]), returns)
+        with pytest.raises(ValueError):
+            calculator.calculate_var(np.array([1.0]), returns)
+        with pytest.raises(ValueError):
+            calculator.calculate_var(np.array([0.5, 0.5]), returns, confidence_level=1.5)
+        with pytest.raises(ValueError):
+            calculator.calculate_var(np.array([0.5, 0.5]), returns, method="unknown")
+
+
+class TestPortfolioRisk:
+    """Test suite for the risk service's PortfolioRisk"""
+    
+    @pytest.fixture
+    def portfolio(self):
+        """Create a PortfolioRisk instance for testing"""
+        return PortfolioRisk(config={})
+    
+    def test_incremental_correlation_matches_corrcoef(self, portfolio):
+        """Test single-sample and block Welford updates against np.corrcoef"""
+        rng = np.random.default_rng(7)
+        data = rng.normal(size=(200, 4)) @ rng.normal(size=(4, 4))
+        for row in data[:50]:
+            portfolio.update(row)
+        corr = portfolio.update_correlation_matrix(data[50:])
+        np.testing.assert_allclose(corr, np.corrcoef(data, rowvar=False), atol=1e-12)
+    
+    def test_correlation_input_checks(self, portfolio):
+        """Test correlation updates reject too little or mismatched data"""
+        portfolio.update(np.array([0.01, 0.02]))
+        with pytest.raises(ValueError):
+            portfolio.correlation_matrix()
+        with pytest.raises(ValueError):
+            portfolio.update(np.array([0.01, 0.02, 0.03]))
+        with pytest.raises(TypeError):
+            portfolio.update_correlation_matrix([[0.01, 0.02]])
+    
+    @pytest.mark.skipif(portfolio_risk.njit is not None, reason="numba kernel streams are not reproducible")
+    def test_monte_carlo_seeded_fallback_is_reproducible(self, portfolio):
+        """Test the NumPy Monte Carlo fallback is deterministic for a seed and close to parametric VaR"""
+        rng = np.random.default_rng(3)
+        returns = rng.normal(0.0, 0.01, size=(5000, 1))
+        weights = np.array([1.0])
+        first = portfolio.monte_carlo_simulation(weights, returns, num_simulations=20000, seed=42)
+        second = portfolio.monte_carlo_simulation(weights, returns, num_simulations=20000, seed=42)
+        assert first == second
+        sigma = returns.std(ddof=1)
+        assert first == pytest.approx(-np.expm1(returns.mean() - 1.6448536269514722 * sigma), rel=0.05)
+    
+    def test_monte_carlo_input_checks(self, portfolio):
+        """Test Monte Carlo input validation"""
+        returns = np.zeros((10, 2))
+        with pytest.raises(ValueError):
+            portfolio.monte_carlo_simulation(np.array([0.5, 0.5]), returns, num_simulations=0)
+        with pytest.raises(ValueError):
+            portfolio.monte_carlo_simulation(np.array([0.5, 0.5]), np.zeros((1, 2)))
+        with pytest.raises(TypeError):
+            portfolio.monte_carlo_simulation([0.5, 0.5], returns)
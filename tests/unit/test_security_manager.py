@@ -114,6 +114,15 @@ class TestTransactionVerification:
             security_manager.verify_transaction(valid_transaction)
         
         assert "Potentially malicious transaction data" in str(exc_info.value)
+    
+    def test_verify_transaction_recheck_after_limit_change(self, security_manager, valid_transaction):
+        """Given a previously verified transaction, when the value limit is lowered, then it is re-validated."""
+        assert security_manager.verify_transaction(valid_transaction) is True
+        
+        security_manager.max_transaction_value = 10**17
+        
+        with pytest.raises(SecurityViolationError):
+            security_manager.verify_transaction(valid_transaction)
 
 
 class TestRateLimiting:
@@ -188,6 +197,19 @@ class TestRateLimiting:
         result = security_manager.check_rate_limit(user2)
         assert result is True
 
+    def test_raised_rate_limit_applies_to_existing_users(self, security_manager):
+        """Given a user already tracked, when the limit is raised, then the new limit is enforced."""
+        user_id = "test_user_125"
+        security_manager.check_rate_limit(user_id)
+        
+        security_manager.max_transaction_rate = 5
+        for i in range(4):
+            security_manager.check_rate_limit(user_id)
+        
+        # Sixth transaction exceeds the raised limit
+        with pytest.raises(RateLimitExceededError):
+            security_manager.check_rate_limit(user_id)
+
 
 class TestPhishingProtection:
     """Test phishing protection mechanisms."""
@@ -233,6 +255,16 @@ class TestPhishingProtection:
         with pytest.raises(PhishingDetectedError):
             security_manager.check_phishing(url)
     
+    def test_check_phishing_blocks_known_domain_and_subdomains(self, security_manager):
+        """Given a known phishing domain, when it or a subdomain is checked, then raises PhishingDetectedError."""
+        security_manager.phishing_detector.update_phishing_domains(["Uniswap-Claim.io"])
+        
+        with pytest.raises(PhishingDetectedError):
+            security_manager.check_phishing("https://uniswap-claim.io/")
+        with pytest.raises(PhishingDetectedError):
+            security_manager.check_phishing("https://app.uniswap-claim.io/swap")
+        assert security_manager.check_phishing("https://app.uniswap.org") is True
+    
     def test_check_phishing_disabled_bypasses_check(self, security_manager, mock_phishing_detector):
         """Given phishing check disabled, when checked, then bypasses validation."""
         security_manager.phishing_check_enabled = False
@@ -310,6 +342,19 @@ class TestSessionManagement:
         result = security_manager.get_session_user(session_token)
         
         assert result == user_id
+    
+    def test_expired_sessions_are_purged_without_access(self, security_manager):
+        """Given expired sessions never accessed again, when other sessions are validated, then they are purged."""
+        stale_tokens = [security_manager.create_session(f"stale_user_{i}") for i in range(5)]
+        active_token = security_manager.create_session("active_user")
+        
+        with patch('time.time', return_value=time.time() + 301):
+            security_manager.sessions[active_token]['last_activity'] = time.time()
+            for _ in range(100):
+                security_manager.validate_session(active_token)
+        
+        assert active_token in security_manager.sessions
+        assert not any(token in security_manager.sessions for token in stale_tokens)
 
 
 class TestSuspiciousActivityDetection:
@@ -582,6 +627,57 @@ class TestSignatureVerification:
         result = security_manager.verify_signature(message, signature, address)
         assert result is False  # Changed to fail with current placeholder implementation
 
+    def test_signature_cache_is_bounded(self):
+        """Given a full cache of untimed signatures, when a new one is verified, then it is accepted and the oldest untimed entry is evicted."""
+        security_manager = SecurityManager({'max_sig_cache_entries': 2})
+        address = "0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6"
+        for signature in ("sig_a", "sig_b", "sig_c"):
+            assert security_manager.verify_signature("test message", signature, address) is True
+        
+        assert list(security_manager.signature_cache) == ["sig_b", "sig_c"]
+        assert security_manager.verify_signature("test message", "sig_b", address) is False
+        assert security_manager.verify_signature("test message", "sig_c", address) is False
+
+    def test_untimed_signatures_do_not_evict_timed_ones(self, monkeypatch):
+        """Given timed and untimed signatures, when the cache is full, then untimed entries are evicted first."""
+        now = 1_000_000.0
+        monkeypatch.setattr(time, "time", lambda: now)
+        security_manager = SecurityManager({'max_sig_cache_entries': 2})
+        address = "0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6"
+        assert security_manager.verify_signature("test message", "sig_timed", address, timestamp=now) is True
+        for signature in ("sig_a", "sig_b"):
+            assert security_manager.verify_signature("test message", signature, address) is True
+        
+        assert list(security_manager.signature_cache) == ["sig_timed", "sig_b"]
+        assert security_manager.verify_signature("test message", "sig_timed", address, timestamp=now) is False
+
+    def test_future_timestamp_is_rejected(self):
+        """Given a message timestamp beyond the allowed clock skew, when verified, then it is rejected and not cached."""
+        security_manager = SecurityManager()
+        address = "0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6"
+        assert security_manager.verify_signature("test message", "sig_a", address, timestamp=time.time() + 3600) is False
+        assert "sig_a" not in security_manager.signature_cache
+
+    def test_signature_cache_expires_with_replay_window(self, monkeypatch):
+        """Given signatures whose messages left the replay window, when the cache is full, then they are purged and stay rejected."""
+        now = 1_000_000.0
+        monkeypatch.setattr(time, "time", lambda: now)
+        security_manager = SecurityManager({'max_sig_cache_entries': 2, 'signature_replay_window': 60})
+        address = "0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6"
+        for signature in ("sig_a", "sig_b"):
+            assert security_manager.verify_signature("test message", signature, address, timestamp=now) is True
+        
+        now += 61
+        assert security_manager.verify_signature("test message", "sig_c", address, timestamp=now) is True
+        assert list(security_manager.signature_cache) == ["sig_c"]
+        assert security_manager.verify_signature("test message", "sig_a", address, timestamp=now - 61) is False
+
+    def test_failed_verification_does_not_poison_replay_cache(self, security_manager):
+        """Given a signature that failed verification, when checked, then it is not cached as used."""
+        address = "0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6"
+        assert security_manager.verify_signature("test message", "invalid_signature", address) is False
+        assert "invalid_signature" not in security_manager.signature_cache
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions for Security Manager."""
     
@@ -10,13 +10,17 @@ Tests wallet management functionality including:
 Following TDD principles with comprehensive wallet test coverage.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
 # Import the actual WalletManager if available, otherwise use a placeholder
 try:
-    from src.services.metamask_integration.wallet_manager import WalletManager
+    from src.services.metamask_integration.wallet_manager import WalletManager, HistoryExportError
 except ImportError:
+    HistoryExportError = RuntimeError
+
     class WalletManager:
         def __init__(self, config=None):
             self.config = config or {}
@@ -127,6 +131,70 @@ def test_track_transaction_history(wallet_manager):
     assert len(wallet_manager.transaction_history[wallet_address]) == 1
     assert wallet_manager.transaction_history[wallet_address][0]['hash'] == '0xabcdef1234567890'
 
+def test_transaction_history_is_bounded():
+    """Given more transactions than the history limit, when tracking, then only the newest are kept."""
+    wallet_manager = WalletManager({'max_tx_history': 2})
+    wallet_address = "0x1234567890abcdef1234567890abcdef12345678"
+    wallet_manager.add_wallet(wallet_address, "TestWallet")
+    
+    for i in range(3):
+        wallet_manager.track_transaction(wallet_address, {'hash': f'0x{i}'})
+    
+    assert [tx['hash'] for tx in wallet_manager.transaction_history[wallet_address]] == ['0x1', '0x2']
+
+def test_export_history_writes_jsonl_and_clears(tmp_path):
+    """Given tracked transactions, when exported, then they are appended as JSON Lines and the buffer is cleared."""
+    wallet_manager = WalletManager()
+    wallet_address = "0x1234567890abcdef1234567890abcdef12345678"
+    wallet_manager.add_wallet(wallet_address, "TestWallet")
+    wallet_manager.track_transaction(wallet_address, {'hash': '0x0', 'value': 2**70})
+    wallet_manager.track_transaction(wallet_address, {'hash': '0x1'})
+    path = tmp_path / "history.jsonl"
+    
+    assert wallet_manager.export_history(wallet_address, str(path)) == 2
+    assert len(wallet_manager.transaction_history[wallet_address]) == 0
+    assert [json.loads(line)['hash'] for line in path.read_text().splitlines()] == ['0x0', '0x1']
+    assert wallet_manager.export_history(wallet_address, str(path)) == 0
+
+def test_full_history_is_exported_before_wrapping(tmp_path):
+    """Given an export directory, when the history buffer fills, then it is exported in the background instead of dropped."""
+    wallet_manager = WalletManager({'max_tx_history': 2, 'history_export_dir': str(tmp_path)})
+    wallet_address = "0x1234567890abcdef1234567890abcdef12345678"
+    wallet_manager.add_wallet(wallet_address, "TestWallet")
+    
+    for i in range(5):
+        wallet_manager.track_transaction(wallet_address, {'hash': f'0x{i}'})
+    wallet_manager.wait_for_exports()
+    
+    exported = (tmp_path / f"{wallet_address}.jsonl").read_text().splitlines()
+    assert [json.loads(line)['hash'] for line in exported] == ['0x0', '0x1', '0x2', '0x3']
+    assert [tx['hash'] for tx in wallet_manager.transaction_history[wallet_address]] == ['0x4']
+
+def test_history_export_dir_is_created(tmp_path):
+    """Given a missing export directory, when the manager is created, then the directory is created up front."""
+    export_dir = tmp_path / "history"
+    WalletManager({'history_export_dir': str(export_dir)})
+    assert export_dir.is_dir()
+
+def test_failed_background_export_is_surfaced(tmp_path):
+    """Given an export that cannot be written, when waiting for exports, then the failure and its transactions are reported."""
+    wallet_manager = WalletManager({'max_tx_history': 2, 'history_export_dir': str(tmp_path)})
+    wallet_address = "0x1234567890abcdef1234567890abcdef12345678"
+    wallet_manager.add_wallet(wallet_address, "TestWallet")
+    # A directory in place of the export file makes the append fail
+    (tmp_path / f"{wallet_address}.jsonl").mkdir()
+    
+    for i in range(3):
+        wallet_manager.track_transaction(wallet_address, {'hash': f'0x{i}'})
+    with pytest.raises(HistoryExportError) as exc_info:
+        wallet_manager.wait_for_exports()
+    
+    [(path, batch, error)] = exc_info.value.failures
+    assert [tx['hash'] for tx in batch] == ['0x0', '0x1']
+    assert isinstance(error, OSError)
+    # Reported failures are not raised again
+    wallet_manager.wait_for_exports()
+
 def test_validate_wallet_security_success(wallet_manager):
     """Given a secure wallet, when validating security, then it should pass."""
     wallet_address = "0x1234567890abcdef1234567890abcdef12345678"